@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Locator Cost Analyzer for Faberwork Test Automation
+Loads each page, runs every class-level locator of its page object many
+times in the page and reports the query cost, match count and ambiguity,
+with cheaper equivalent selectors where one exists
+"""
+
+import json
+import sys
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from pages.home_page import HomePage
+from pages.services_page import ServicesPage
+from pages.contact_page import ContactPage
+from pages.about_page import AboutPage
+from utils import page_runtime
+from utils.driver_factory import DriverFactory
+from utils.locator_finder import LocatorFinder
+from utils.self_healing import to_query
+
+# Page objects analyzed, by command-line name
+PAGES = {
+    'home': HomePage,
+    'services': ServicesPage,
+    'contact': ContactPage,
+    'about': AboutPage,
+}
+
+# Strategies a WebDriver locator can use
+STRATEGIES = {value for name, value in vars(By).items() if not name.startswith('_') and isinstance(value, str)}
+
+# A suggestion must be at least this much cheaper to be reported
+SUGGESTION_SPEEDUP = 2.0
+
+
+def class_locators(page_class):
+    """
+    Get the class-level locators of a page object (BasePage attributes excluded)
+
+    Args:
+        page_class: Page object class
+
+    Returns:
+        dict: Attribute name -> (By, value), in name order
+    """
+    locators = {}
+    for name in sorted(dir(page_class)):
+        if name.startswith('_') or hasattr(BasePage, name):
+            continue
+        value = getattr(page_class, name)
+        if (isinstance(value, tuple) and len(value) == 2 and value[0] in STRATEGIES
+                and isinstance(value[1], str)):
+            locators[name] = value
+    return locators
+
+
+def selector_hints(locator):
+    """
+    Static hints about expensive selector shapes
+
+    Args:
+        locator: Tuple of (By, value)
+
+    Returns:
+        list: Hint strings
+    """
+    by, value = locator
+    hints = []
+    if by == By.XPATH:
+        if value.lstrip('(').startswith('//*'):
+            hints.append("'//*' tests every element of the document")
+        if 'text()' in value:
+            hints.append("text matching reads every text node; prefer an id, data-testid or class")
+    if by == By.CSS_SELECTOR and ',' in value:
+        hints.append(f"{value.count(',') + 1} selectors in one; each one is matched against the document")
+    return hints
+
+
+def measure(driver, locator, rounds, batch):
+    """
+    Measure one locator in the page
+
+    Args:
+        driver: WebDriver instance
+        locator: Tuple of (By, value)
+        rounds: Timed rounds
+        batch: Queries per round
+
+    Returns:
+        dict: median_ms, max_ms, matches, visible and first (element), or error
+    """
+    query = to_query(locator)
+    if query is None:
+        return {'error': f"unsupported strategy {locator[0]}"}
+    return page_runtime.call(driver, 'measureQuery', query, rounds, batch)
+
+
+def cheaper_equivalent(driver, locator, result, rounds, batch):
+    """
+    Find a cheaper selector matching the same single element
+
+    Args:
+        driver: WebDriver instance
+        locator: Tuple of (By, value)
+        result: Measurement of the locator
+        rounds: Timed rounds
+        batch: Queries per round
+
+    Returns:
+        dict: 'locator' and 'median_ms' of the cheapest equivalent, or None
+    """
+    if result.get('matches') != 1 or not result.get('first'):
+        return None
+
+    element = result['first']
+    suggestions = [tuple(candidate) for candidate in LocatorFinder(driver).suggest_locators(element).values()]
+    candidates = [candidate for candidate in suggestions if candidate != tuple(locator) and to_query(candidate)]
+    unique = page_runtime.call(driver, 'uniqueMatches', element, [to_query(c) for c in candidates]) or []
+
+    best = None
+    for candidate, is_unique in zip(candidates, unique):
+        if not is_unique:
+            continue
+        cost = measure(driver, candidate, rounds, batch)
+        if 'error' in cost:
+            continue
+        if best is None or cost['median_ms'] < best['median_ms']:
+            best = {'locator': list(candidate), 'median_ms': cost['median_ms']}
+
+    if best and best['median_ms'] * SUGGESTION_SPEEDUP <= result['median_ms']:
+        return best
+    return None
+
+
+def analyze_page(driver, page_class, rounds, batch, budget_ms):
+    """
+    Analyze every locator of one page object
+
+    Args:
+        driver: WebDriver instance
+        page_class: Page object class
+        rounds: Timed rounds per locator
+        batch: Queries per round
+        budget_ms: Median cost above which a locator fails
+
+    Returns:
+        dict: Page URL and one entry per locator
+    """
+    page = page_class(driver)
+    page.navigate_to(page.url)
+
+    entries = []
+    for name, locator in class_locators(page_class).items():
+        result = measure(driver, locator, rounds, batch)
+        entry = {'name': f"{page_class.__name__}.{name}", 'locator': list(locator), 'hints': selector_hints(locator)}
+        if 'error' in result:
+            entry.update({'error': result['error'], 'over_budget': False})
+        else:
+            entry.update({
+                'median_ms': result['median_ms'],
+                'max_ms': result['max_ms'],
+                'matches': result['matches'],
+                'visible': result['visible'],
+                'ambiguous': result['matches'] > 1,
+                'over_budget': result['median_ms'] > budget_ms,
+                'suggestion': cheaper_equivalent(driver, locator, result, rounds, batch),
+            })
+        entries.append(entry)
+
+    return {'page': page_class.__name__, 'url': page.url, 'locators': entries}
+
+
+def build_report(page_names, rounds, batch, budget_ms):
+    """
+    Build the locator cost report (one browser for all pages)
+
+    Args:
+        page_names: Keys of PAGES to analyze
+        rounds: Timed rounds per locator
+        batch: Queries per round
+        budget_ms: Median cost above which a locator fails
+
+    Returns:
+        dict: Report with per-page entries and the locators over budget
+    """
+    driver = DriverFactory.create_driver()
+    try:
+        pages = [analyze_page(driver, PAGES[name], rounds, batch, budget_ms) for name in page_names]
+    finally:
+        DriverFactory.quit_driver(driver)
+
+    entries = [entry for page in pages for entry in page['locators']]
+    return {
+        'budget_ms': budget_ms,
+        'queries_per_locator': rounds * batch,
+        'pages': pages,
+        'over_budget': [entry['name'] for entry in entries if entry['over_budget']],
+        'ambiguous': [entry['name'] for entry in entries if entry.get('ambiguous')],
+        'no_match': [entry['name'] for entry in entries if entry.get('matches') == 0],
+    }
+
+
+def print_report(report):
+    """Print the locator cost report as a table"""
+    width = 96
+    print("\n" + "=" * width)
+    print(f"  Locator Cost Report ({report['queries_per_locator']} queries per locator, "
+          f"budget {report['budget_ms']:.2f} ms)")
+    print("=" * width)
+
+    for page in report['pages']:
+        print(f"\n{page['page']} ({page['url']})")
+        print(f"{'Locator':<52}{'Median':>10}{'Max':>10}{'Matches':>9}{'Visible':>9}  Flags")
+        print("-" * width)
+        for entry in sorted(page['locators'], key=lambda e: e.get('median_ms', 0), reverse=True):
+            name = entry['name'].split('.', 1)[1]
+            if 'error' in entry:
+                print(f"{name[:51]:<52}{'error: ' + entry['error']}")
+                continue
+            flags = []
+            if entry['over_budget']:
+                flags.append('OVER BUDGET')
+            if entry['ambiguous']:
+                flags.append('ambiguous')
+            if entry['matches'] == 0:
+                flags.append('no match')
+            print(f"{name[:51]:<52}{entry['median_ms']:>8.3f}ms{entry['max_ms']:>8.3f}ms"
+                  f"{entry['matches']:>9}{entry['visible']:>9}  {', '.join(flags)}")
+            for hint in entry['hints']:
+                print(f"    - {hint}")
+            if entry['suggestion']:
+                by, value = entry['suggestion']['locator']
+                print(f"    - cheaper: ({by!r}, {value!r}) at {entry['suggestion']['median_ms']:.3f}ms")
+
+    print("\n" + "-" * width)
+    print(f"Ambiguous locators (more than one match): {len(report['ambiguous'])}")
+    print(f"Locators without a match:                 {len(report['no_match'])}")
+    print(f"Locators over budget:                     {len(report['over_budget'])}")
+    for name in report['over_budget']:
+        print(f"  {name}")
+
+
+def main():
+    """Main execution"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure the in-page query cost of every page-object locator")
+    parser.add_argument("--pages", nargs='+', choices=sorted(PAGES), default=list(PAGES),
+                        help="Page objects to analyze (default: all)")
+    parser.add_argument("--rounds", type=int, default=20,
+                        help="Timed rounds per locator")
+    parser.add_argument("--batch", type=int, default=10,
+                        help="Queries per round")
+    parser.add_argument("--budget-ms", type=float, default=1.0,
+                        help="Median query cost (ms) above which the command fails")
+    parser.add_argument("--json", type=str, default=None,
+                        help="Also write the report to this JSON file")
+
+    args = parser.parse_args()
+
+    report = build_report(args.pages, args.rounds, args.batch, args.budget_ms)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport saved to: {args.json}")
+
+    sys.exit(1 if report['over_budget'] else 0)
+
+
+if __name__ == "__main__":
+    main()
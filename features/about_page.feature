@@ -8,19 +8,19 @@ Feature: About Us Page Functionality
     Given I am on the Faberwork homepage
     When I click on the "About us" menu
 
-  @about @page_load
+  @about @page_load @snapshot_cache
   Scenario: About Us page loads successfully
     Then the About page should load successfully
     And the page title should be "Who We Are"
     And I should see "Established 2003" text
 
-  @about @company_info
+  @about @company_info @snapshot_cache
   Scenario: Company overview information is displayed
     Then I should see company overview information
     And I should see "Snowflake Partner Network" mentioned
     And I should see "enterprise applications" mentioned
 
-  @about @leadership_team
+  @about @leadership_team @snapshot_cache
   Scenario: All leadership team members are displayed
     Then I should see the following team members:
       | Name              | Title                        |
@@ -31,7 +31,7 @@ Feature: About Us Page Functionality
       | Saurabh Jain      | Senior Technical Lead        |
       | Vikas Sharma      | Senior Technical Lead        |
 
-  @about @team_photos
+  @about @team_photos @visual
   Scenario: Team member photos are displayed
     Then I should see profile photos for team members
     And the photo for "Alok Pancholi" should be visible
@@ -49,7 +49,7 @@ Feature: About Us Page Functionality
     Then I should see "Let's Work Together" section
     And the "START NOW" button should be visible
 
-  @about @navigation
+  @about @navigation @snapshot_cache
   Scenario: Navigation elements are present on About page
     Then all navigation links should be present
     And the Faberwork logo should be visible
@@ -27,7 +27,7 @@ Feature: Carousel and Slider Functionality
     When I click the carousel previous button
     Then the previous carousel item should be displayed
 
-  @carousel @autoplay
+  @carousel @autoplay @virtual_time
   Scenario: Carousel auto-rotates
     Given the success stories carousel is visible
     When I wait for 5 seconds
@@ -67,7 +67,7 @@ Feature: Carousel and Slider Functionality
     Then there should be at least 10 carousel items
     And each item should have content
 
-  @carousel @pause_on_hover
+  @carousel @pause_on_hover @virtual_time
   Scenario: Carousel pauses on hover
     Given the carousel is auto-rotating
     When I hover over the carousel
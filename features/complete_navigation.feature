@@ -7,7 +7,7 @@ Feature: Complete Website Navigation
   Background:
     Given I am on the Faberwork homepage
 
-  @navigation @menu
+  @navigation @menu @shared_session
   Scenario Outline: Navigate to all main pages from homepage
     When I click on the "<menu_item>" menu
     Then I should be on the "<page_name>" page
@@ -13,13 +13,13 @@ Feature: Contact Us Page Functionality
     Then the Contact page should load successfully
     And the page heading should be "Get in Touch With Us"
 
-  @contact @office_info
+  @contact @office_info @static
   Scenario: USA office contact information is displayed
     Then I should see USA office phone number "+1-410-884-9169"
     And I should see email address "info@faberwork.com"
     And I should see USA office address "10045 Red Run Blvd Suite 250, Owings Mills, MD 21117"
 
-  @contact @office_info
+  @contact @office_info @static
   Scenario: India office contact information is displayed
     Then I should see India office phone number "+91-74140-82984"
     And I should see email address "info@faberwork.com"
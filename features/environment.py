@@ -5,6 +5,7 @@ Defines hooks and setup/teardown logic for test execution
 
 import sys
 import io
+import json
 from pathlib import Path
 
 # Ensure UTF-8 encoding for stdout to handle Unicode characters on Windows
@@ -16,16 +17,37 @@ project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
 from datetime import datetime
+from typing import Optional
+from behave.model import ScenarioOutline
 from loguru import logger
 
 from utils.config import Config
 from utils.driver_factory import DriverFactory
+from utils.virtual_time import VirtualClock
+from utils.readiness import record_readiness_savings, readiness_stats
+from utils.navigation import navigation_stats
+from utils.element_cache import element_cache_stats
+from utils.helpers import absence_stats
+from utils.locator_timing import get_locator_timings, locator_timing_stats
+from utils.self_healing import get_locator_healer, self_healing_stats
+from utils.scenario_scheduler import schedule_feature, schedule_stats
+from utils.resource_blocking import BlockedRequestCounter
+from utils.http_archive import HttpArchive
+from utils.asset_cache import get_asset_cache
+from utils.snapshot_cache import SnapshotDriver, is_snapshot_mode, snapshot_cache_stats
+from utils.static_driver import StaticDriver, static_stats
+from utils.mock_backend import get_mock_backend
+from utils.warmup import warm_up
 from pages.home_page import HomePage
 from pages.services_page import ServicesPage
 from pages.contact_page import ContactPage
 from pages.about_page import AboutPage
 
 
+# Open sessions of @shared_session outlines: (feature file, outline line) -> session
+_shared_sessions = {}
+
+
 # ============================================
 # Configure Loguru Logger
 # ============================================
@@ -78,9 +100,18 @@ def before_all(context):
         'passed': 0,
         'failed': 0,
         'skipped': 0,
+        'animations_disabled': 0,
+        'blocked_requests': 0,
+        'blocked_bytes': 0,
+        'warmup_seconds': Config.WARMUP_SECONDS,
         'start_time': datetime.now()
     }
 
+    # Pay cold-start costs here so they are not counted as scenario time
+    if Config.WARMUP:
+        context.test_stats['warmup_seconds'] = warm_up()['total']
+        context.test_stats['start_time'] = datetime.now()
+
     logger.info("Global setup completed")
 
 
@@ -101,6 +132,10 @@ def before_feature(context, feature):
     logger.info(f"Tags: {feature.tags if feature.tags else 'None'}")
     logger.info("=" * 80)
 
+    # Run scenarios that start from the same state back to back
+    if Config.SCENARIO_SCHEDULE == 'state':
+        schedule_feature(feature)
+
 
 # ============================================
 # Before Scenario Hook
@@ -120,9 +155,32 @@ def before_scenario(context, scenario):
     logger.info("-" * 80)
 
     try:
-        # Create WebDriver instance
-        context.driver = DriverFactory.create_driver()
-        logger.info("WebDriver created successfully")
+        # Rows of a @shared_session outline continue in the previous row's browser
+        session_key = shared_session_key(scenario)
+        session = _shared_sessions.get(session_key) if session_key else None
+        if session is not None and not DriverFactory.reset_session(session['driver']):
+            DriverFactory.quit_driver(_shared_sessions.pop(session_key)['driver'])
+            session = None
+
+        if session is None and 'static' in scenario.effective_tags:
+            # Server-rendered checks only: plain HTTP and lxml, never a browser
+            session = {'driver': StaticDriver(), 'http_archive': None, 'mock_backend': None,
+                       'clock': None, 'animations_disabled': False, 'resources_blocked': False}
+        elif session is None and snapshot_cache_for(scenario):
+            # Read-only scenario: cached snapshots, a browser only if a step needs one
+            session = {'driver': None, 'http_archive': None, 'mock_backend': None, 'clock': None,
+                       'animations_disabled': False, 'resources_blocked': False}
+            session['driver'] = SnapshotDriver(lambda: start_fallback_session(context, scenario, session))
+        elif session is None:
+            session = start_session(scenario)
+            if session_key:
+                _shared_sessions[session_key] = session
+        else:
+            logger.info("Reusing shared session of the previous example row")
+
+        context.driver = session['driver']
+        context.blocked_requests = None
+        apply_session(context, scenario, session)
 
         # Initialize page objects
         context.home_page = HomePage(context.driver)
@@ -131,10 +189,6 @@ def before_scenario(context, scenario):
         context.about_page = AboutPage(context.driver)
         logger.info("Page objects initialized")
 
-        # Maximize window
-        if not Config.HEADLESS:
-            context.driver.maximize_window()
-
         # Update statistics
         context.test_stats['total'] += 1
 
@@ -143,6 +197,106 @@ def before_scenario(context, scenario):
         raise
 
 
+def apply_session(context, scenario, session: dict):
+    """
+    Expose a session's helpers on the context and start its blocked request counter
+
+    Args:
+        context: Behave context
+        scenario: Scenario the session serves
+        session: Session dict (see start_session)
+    """
+    context.http_archive = session['http_archive']
+    context.mock_backend = session['mock_backend']
+    context.clock = session['clock']
+    if context.mock_backend:
+        context.mock_backend.reset()
+    if session['animations_disabled']:
+        context.test_stats['animations_disabled'] += 1
+
+    # Count blocked requests, or learn the sizes they are priced at (@visual scenarios of a blocking run)
+    driver = session['driver']
+    learn_sizes = Config.BLOCK_RESOURCES and blocking_profile_for(scenario) == 'visual'
+    if driver is not None and not is_snapshot_mode(driver) and (session['resources_blocked'] or learn_sizes):
+        context.blocked_requests = BlockedRequestCounter(driver)
+
+
+def start_fallback_session(context, scenario, session: dict):
+    """
+    Start the real browser of a snapshot scenario once a step needs one
+
+    The session keeps its SnapshotDriver; everything else start_session
+    attached (HTTP archive, mock backend, clock, resource blocking) is taken
+    over into the session and the context.
+
+    Args:
+        context: Behave context
+        scenario: Scenario being executed
+        session: Session dict of the SnapshotDriver
+
+    Returns:
+        WebDriver: Real driver for the SnapshotDriver
+    """
+    live = start_session(scenario)
+    session.update({key: value for key, value in live.items() if key != 'driver'})
+    apply_session(context, scenario, live)
+    return live['driver']
+
+
+def start_session(scenario) -> dict:
+    """
+    Create a WebDriver and apply the scenario's session-wide settings
+
+    Args:
+        scenario: Scenario the session is created for
+
+    Returns:
+        dict: Session (driver and the per-driver helpers attached to it)
+    """
+    use_mock_backend = mock_backend_for(scenario)
+    blocking_profile = blocking_profile_for(scenario)
+    # Blocked request counters (and the sizes learned by @visual scenarios) read Network events
+    count_blocked = Config.BLOCK_RESOURCES or blocking_profile != 'visual'
+    driver = DriverFactory.create_driver(intercept=use_mock_backend, network_events=count_blocked)
+    logger.info("WebDriver created successfully")
+    session = {'driver': driver, 'http_archive': None, 'mock_backend': None,
+               'clock': None, 'animations_disabled': False, 'resources_blocked': False}
+
+    # Record or replay HTTP traffic
+    if Config.HTTP_ARCHIVE_MODE in ('record', 'replay'):
+        archive = HttpArchive()
+        if archive.attach(driver):
+            session['http_archive'] = archive
+
+    # Serve static assets from the cache shared with the other workers
+    if Config.ASSET_CACHE and Config.HTTP_ARCHIVE_MODE != 'replay':
+        get_asset_cache().attach(driver)
+
+    # Send form submissions and chatbot messages to the local stub server
+    if use_mock_backend:
+        backend = get_mock_backend()
+        if backend.attach(driver):
+            session['mock_backend'] = backend
+
+    # Kill CSS transitions/animations unless the scenario tests them
+    if animations_disabled_for(scenario):
+        session['animations_disabled'] = DriverFactory.disable_animations(driver)
+
+    # Block images/fonts/analytics unless the scenario checks visuals
+    session['resources_blocked'] = DriverFactory.block_resources(driver, blocking_profile)
+
+    # Let timer-driven steps fast-forward page timers instead of waiting
+    if 'virtual_time' in scenario.effective_tags:
+        session['clock'] = VirtualClock(driver)
+        session['clock'].install()
+
+    # Maximize window
+    if not Config.HEADLESS:
+        driver.maximize_window()
+
+    return session
+
+
 # ============================================
 # After Scenario Hook
 # ============================================
@@ -198,10 +352,19 @@ def after_scenario(context, scenario):
         logger.error(f"Error in after_scenario hook: {str(e)}")
 
     finally:
-        # Quit driver
+        # Quit driver (shared sessions stay open for the next example row)
         if hasattr(context, 'driver'):
             try:
-                DriverFactory.quit_driver(context.driver)
+                record_readiness_savings(context.driver)
+                record_blocked_requests(context)
+                if getattr(context, 'http_archive', None):
+                    context.http_archive.write_unmatched_report(scenario.name)
+                session_key = shared_session_key(scenario)
+                if session_key in _shared_sessions and keep_shared_session(scenario):
+                    logger.debug("Keeping shared session for the next example row")
+                else:
+                    _shared_sessions.pop(session_key, None)
+                    DriverFactory.quit_driver(context.driver)
             except Exception as e:
                 logger.error(f"Error quitting driver: {str(e)}")
 
@@ -221,6 +384,10 @@ def after_feature(context, feature):
         context: Behave context
         feature: Feature that was executed
     """
+    # Quit shared sessions whose outline did not run to its last row
+    for session_key in [key for key in _shared_sessions if key[0] == feature.filename]:
+        DriverFactory.quit_driver(_shared_sessions.pop(session_key)['driver'])
+
     logger.info("=" * 80)
     logger.info(f"Completed Feature: {feature.name}")
     logger.info(f"Feature Status: {str(feature.status).upper()}")
@@ -248,9 +415,85 @@ def after_all(context):
     logger.info(f"✗ Failed: {context.test_stats['failed']}")
     logger.info(f"⊘ Skipped: {context.test_stats['skipped']}")
     logger.info(f"Execution Time: {duration}")
+    if context.test_stats['warmup_seconds']:
+        logger.info(f"Warm-up Time: {context.test_stats['warmup_seconds']:.2f}s (not included above)")
     logger.info(f"Success Rate: {(context.test_stats['passed'] / context.test_stats['total'] * 100):.2f}%" if context.test_stats['total'] > 0 else "N/A")
     logger.info("=" * 80)
 
+    if context.test_stats['blocked_requests']:
+        logger.info(f"Blocked requests: {context.test_stats['blocked_requests']}, "
+                    f"~{context.test_stats['blocked_bytes'] / 1024 / 1024:.1f} MB saved")
+
+    # Time saved by readiness contracts over waiting for the load event
+    if readiness_stats['navigations']:
+        logger.info(f"Page load strategy: {Config.PAGE_LOAD_STRATEGY}, readiness contracts saved "
+                    f"{readiness_stats['saved_seconds']:.1f}s over {readiness_stats['navigations']} navigation(s)")
+
+    # Asset cache hit ratio (also aggregated over workers by run_tests_parallel.py)
+    if Config.ASSET_CACHE:
+        get_asset_cache().write_stats()
+
+    # Pages served from the snapshot cache and browsers never started
+    if snapshot_cache_stats['hits']:
+        logger.info(f"Snapshot cache: {snapshot_cache_stats['hits']} cached page(s) served, "
+                    f"{snapshot_cache_stats['browsers_avoided']} scenario(s) ran without a browser")
+
+    if static_stats['scenarios']:
+        logger.info(f"Static backend: {static_stats['scenarios']} scenario(s) without a browser, "
+                    f"{static_stats['requests']} page(s) fetched in {static_stats['seconds']:.1f}s")
+
+    # Element lookups answered by cached handles and stale handles recovered
+    if element_cache_stats['hits'] or element_cache_stats['stale_recovered']:
+        logger.info(f"Element cache: {element_cache_stats['hits']} of "
+                    f"{element_cache_stats['hits'] + element_cache_stats['misses']} lookup(s) skipped, "
+                    f"{element_cache_stats['stale_recovered']} stale element(s) recovered")
+
+    # Negative assertions decided by a quiet page instead of a full timeout
+    if absence_stats['checks']:
+        logger.info(f"Absence checks: {absence_stats['checks']} in {absence_stats['seconds']:.1f}s, "
+                    f"~{absence_stats['saved_seconds']:.1f}s saved against full timeouts")
+
+    # Locator latencies: persist them and report locators worth fixing
+    if locator_timing_stats['waits']:
+        timings = get_locator_timings()
+        timings.save()
+        logger.info(f"Locator timing: {locator_timing_stats['waits']} wait(s), "
+                    f"{locator_timing_stats['adaptive']} with a learned timeout, "
+                    f"{locator_timing_stats['timeouts']} timed out, "
+                    f"~{locator_timing_stats['saved_seconds']:.1f}s saved on timeouts")
+        report = timings.report()
+        for item in report['slow']:
+            logger.warning(f"Slow locator {item['locator']}: median {item['median']:.2f}s, "
+                           f"p95 {item['p95']:.2f}s over {item['samples']} wait(s)")
+        for item in report['broken']:
+            logger.warning(f"Locator never appears {item['locator']}: {item['timeouts']} timeout(s) in a row")
+
+    # Locators found through an alternate: persist them and report the drift to fix
+    if self_healing_stats['learned'] or self_healing_stats['healed']:
+        get_locator_healer().save()
+    if self_healing_stats['healed'] or self_healing_stats['cached_heals']:
+        logger.info(f"Self-healing locators: {self_healing_stats['healed']} healed, "
+                    f"{self_healing_stats['cached_heals']} found through a cached alternate")
+    for locator, winner in sorted(get_locator_healer().drift().items()):
+        logger.warning(f"Locator drift: {locator} -> {winner[0]}={winner[1]} (update the page object)")
+
+    # Time saved by skipping navigations to the page already loaded
+    if navigation_stats['reused']:
+        logger.info(f"Navigation reuse: skipped {navigation_stats['reused']} of "
+                    f"{navigation_stats['navigations'] + navigation_stats['reused']} navigation(s), "
+                    f"~{navigation_stats['saved_seconds']:.1f}s saved")
+
+    # Starting state changes between consecutive scenarios, before and after scheduling
+    if schedule_stats['transitions_before'] > schedule_stats['transitions_after']:
+        logger.info(f"Scenario schedule: {schedule_stats['transitions_before']} -> "
+                    f"{schedule_stats['transitions_after']} starting state changes")
+
+    # Record suite timing and compare animation modes
+    record_suite_timing(context.test_stats, duration.total_seconds())
+
+    # Stop the mock backend if any scenario started it
+    get_mock_backend().stop()
+
     # Log completion
     logger.info("Test Execution Completed")
     logger.info("=" * 80)
@@ -321,3 +564,175 @@ def attach_log_to_allure(log_message: str, name: str = "Log"):
         )
     except ImportError:
         pass  # Allure not installed
+
+
+def animations_disabled_for(scenario) -> bool:
+    """
+    Decide whether a scenario runs with CSS animations disabled
+
+    Args:
+        scenario: Behave scenario
+
+    Returns:
+        bool: True if animations should be disabled
+    """
+    tags = set(scenario.effective_tags)
+    if tags & set(Config.ANIMATION_TAGS):
+        return False
+    return Config.DISABLE_ANIMATIONS or 'no_animations' in tags
+
+
+def mock_backend_for(scenario) -> bool:
+    """
+    Decide whether a scenario's form and chatbot requests go to the mock backend
+
+    Args:
+        scenario: Behave scenario
+
+    Returns:
+        bool: True if the mock backend should be used
+    """
+    return Config.MOCK_BACKEND or 'mock_backend' in scenario.effective_tags
+
+
+def shared_session_key(scenario) -> Optional[tuple]:
+    """
+    Get the key of the session a @shared_session outline row runs in
+
+    Args:
+        scenario: Behave scenario
+
+    Returns:
+        tuple: (feature file, outline line), or None if the scenario gets its own browser
+    """
+    outline = _outline_of(scenario)
+    if outline is None or 'shared_session' not in scenario.effective_tags:
+        return None
+    return outline.filename, outline.line
+
+
+def snapshot_cache_for(scenario) -> bool:
+    """
+    Decide whether a scenario is served from cached page snapshots
+
+    Args:
+        scenario: Behave scenario
+
+    Returns:
+        bool: True for @snapshot_cache scenarios that do not share an outline session
+    """
+    return 'snapshot_cache' in scenario.effective_tags and shared_session_key(scenario) is None
+
+
+def keep_shared_session(scenario) -> bool:
+    """
+    Decide whether a finished row leaves its shared session open for the next row
+
+    A failed row may leave the page in any state, so the next row starts fresh.
+
+    Args:
+        scenario: Behave scenario (outline row)
+
+    Returns:
+        bool: True if another row follows and this one did not fail
+    """
+    outline = _outline_of(scenario)
+    return (outline is not None and scenario is not outline.scenarios[-1]
+            and scenario.status not in ('failed', 'untested'))
+
+
+def _outline_of(scenario) -> Optional[ScenarioOutline]:
+    """The Scenario Outline a scenario is an example row of, None for plain scenarios"""
+    if getattr(scenario, '_row', None) is None:
+        return None
+    for candidate in scenario.feature.scenarios:
+        if isinstance(candidate, ScenarioOutline) and scenario in candidate.scenarios:
+            return candidate
+    return None
+
+
+def blocking_profile_for(scenario) -> str:
+    """
+    Decide which resource blocking profile a scenario runs with
+
+    Args:
+        scenario: Behave scenario
+
+    Returns:
+        str: 'visual' (load everything) or 'default' (block images, fonts, media, analytics)
+    """
+    tags = set(scenario.effective_tags)
+    if 'visual' in tags:
+        return 'visual'
+    return 'default' if Config.BLOCK_RESOURCES or 'block_resources' in tags else 'visual'
+
+
+def record_blocked_requests(context):
+    """
+    Log the blocked request counters of the finished scenario and add them to the run totals
+
+    Args:
+        context: Behave context
+    """
+    counter = getattr(context, 'blocked_requests', None)
+    if counter is None:
+        return
+
+    stats = counter.finish()
+    if not stats['blocked']:
+        return
+
+    context.test_stats['blocked_requests'] += stats['blocked']
+    context.test_stats['blocked_bytes'] += stats['bytes_saved']
+    unknown = f", {stats['unknown_size']} of unknown size" if stats['unknown_size'] else ""
+    logger.info(f"Blocked {stats['blocked']} requests, ~{stats['bytes_saved'] / 1024:.0f} KB saved{unknown}")
+
+
+def record_suite_timing(test_stats: dict, duration_seconds: float):
+    """
+    Append this run's duration to the suite timings file and log the
+    average scenario duration with animations enabled vs disabled
+
+    Args:
+        test_stats: Test statistics collected during the run
+        duration_seconds: Total run duration in seconds
+    """
+    total = test_stats['total']
+    if total == 0:
+        return
+
+    disabled = test_stats['animations_disabled']
+    mode = 'disabled' if disabled == total else 'enabled' if disabled == 0 else 'mixed'
+    record = {
+        'timestamp': datetime.now().isoformat(),
+        'animations': mode,
+        'scenarios': total,
+        'duration': round(duration_seconds, 2),
+        'warmup': round(test_stats.get('warmup_seconds', 0.0), 2),
+    }
+
+    try:
+        Config.SUITE_TIMINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(Config.SUITE_TIMINGS_FILE, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+
+        with open(Config.SUITE_TIMINGS_FILE, 'r', encoding='utf-8') as f:
+            history = [json.loads(line) for line in f if line.strip()]
+    except Exception as e:
+        logger.error(f"Failed to record suite timing: {str(e)}")
+        return
+
+    averages = {}
+    for run_mode in ('enabled', 'disabled'):
+        runs = [run for run in history if run['animations'] == run_mode][-10:]
+        scenarios = sum(run['scenarios'] for run in runs)
+        if scenarios:
+            averages[run_mode] = sum(run['duration'] for run in runs) / scenarios
+
+    logger.info(f"Animations: {mode} ({disabled}/{total} scenarios)")
+    if 'enabled' in averages and 'disabled' in averages:
+        saved = averages['enabled'] - averages['disabled']
+        logger.info(
+            f"Avg scenario duration - animations enabled: {averages['enabled']:.2f}s, "
+            f"disabled: {averages['disabled']:.2f}s ({saved:+.2f}s saved per scenario)"
+        )
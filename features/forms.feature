@@ -7,7 +7,7 @@ Feature: Form Submissions and Validations
   Background:
     Given I am on the Faberwork homepage
 
-  @forms @consultation @positive
+  @forms @consultation @positive @virtual_time @mock_backend
   Scenario: Submit consultation form with valid data
     When I fill in the consultation form with valid data:
       | Field   | Value                    |
@@ -19,8 +19,10 @@ Feature: Form Submissions and Validations
     And I submit the consultation form
     Then I should see a success message
     And the success message should contain "thank you" or "received"
+    And the success message should disappear automatically
+    And the mock backend should have received a submission containing "john.doe@techinno.com"
 
-  @forms @consultation @negative
+  @forms @consultation @negative @shared_session
   Scenario Outline: Consultation form validation for invalid email
     When I enter "<email>" in the email field
     And I submit the consultation form
@@ -41,7 +43,7 @@ Feature: Form Submissions and Validations
     Then I should see validation errors for required fields
     And the form should not be submitted
 
-  @forms @consultation @phone
+  @forms @consultation @phone @shared_session
   Scenario Outline: Phone number validation
     When I enter "<phone>" in the phone field
     And I submit the consultation form
@@ -85,7 +87,7 @@ Feature: Form Submissions and Validations
     And I click the newsletter subscribe button
     Then I should see a newsletter subscription confirmation
 
-  @forms @newsletter @negative
+  @forms @newsletter @negative @shared_session
   Scenario Outline: Newsletter subscription with invalid email
     When I enter "<email>" in the newsletter field
     And I click the newsletter subscribe button
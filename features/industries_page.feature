@@ -8,12 +8,12 @@ Feature: Industries Page Functionality
     Given I am on the Faberwork homepage
     When I click on the "Industries" menu
 
-  @industries @page_load
+  @industries @page_load @snapshot_cache
   Scenario: Industries page loads successfully
     Then the Industries page should load successfully
     And the page title should be "Industries We Serve"
 
-  @industries @content
+  @industries @content @snapshot_cache
   Scenario: All industry sectors are listed
     Then I should see the following industries:
       | Industry Name                  |
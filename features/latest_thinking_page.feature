@@ -8,13 +8,13 @@ Feature: Latest Thinking Page Functionality
     Given I am on the Faberwork homepage
     When I click on the "Latest Thinking" menu
 
-  @latest_thinking @page_load
+  @latest_thinking @page_load @snapshot_cache
   Scenario: Latest Thinking page loads successfully
     Then the Latest Thinking page should load successfully
     And the page title should be "Latest Thinking"
     And I should see the subtitle "Notes and Trends"
 
-  @latest_thinking @articles
+  @latest_thinking @articles @visual
   Scenario: Article cards are displayed
     Then I should see multiple article cards
     And each article card should have a featured image
@@ -7,7 +7,7 @@ Feature: Website Navigation
   Background:
     Given I am on the Faberwork homepage
 
-  @navigation @menu
+  @navigation @menu @shared_session
   Scenario Outline: Navigate to different pages via menu
     When I click on the "<menu_item>" menu
     Then I should be on the "<expected_page>" page
@@ -7,7 +7,7 @@ Feature: Search Functionality
   Background:
     Given I am on the Faberwork homepage
 
-  @search @positive
+  @search @positive @shared_session
   Scenario Outline: Search for content with valid keywords
     When I search for "<keyword>"
     Then search results should be displayed
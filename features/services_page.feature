@@ -8,13 +8,13 @@ Feature: Services Page Functionality
     Given I am on the Faberwork homepage
     When I click on the "Services" menu
 
-  @services @page_load
+  @services @page_load @snapshot_cache
   Scenario: Services page loads successfully
     Then the Services page should load successfully
     And the page title should contain "Services"
     And all service offerings are visible on the page
 
-  @services @content
+  @services @content @snapshot_cache
   Scenario: Verify all 8 service offerings are present
     Then I should see the following services:
       | Service Name                        |
@@ -27,7 +27,7 @@ Feature: Services Page Functionality
       | Software Re-engineering            |
       | Test Automation                    |
 
-  @services @sections
+  @services @sections @snapshot_cache
   Scenario: Verify key sections are present on Services page
     Then I should see the "Trusted by Leading Technology Companies" section
     And I should see the "What Sets Us Apart" section
@@ -51,7 +51,7 @@ Feature: Services Page Functionality
     Then the consultation form should be visible
     And the form should have name, company, email, and phone fields
 
-  @services @navigation
+  @services @navigation @snapshot_cache
   Scenario: Navigation menu is present on Services page
     Then all navigation links should be present
     And the Faberwork logo should be visible
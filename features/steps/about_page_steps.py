@@ -10,7 +10,7 @@ import time
 @then('the About page should load successfully')
 def step_verify_about_page_loaded(context):
     """Verify About page loaded successfully"""
-    time.sleep(2)  # Wait for page to stabilize
+    context.home_page.wait_for_animations()
     current_url = context.driver.current_url.lower()
     assert 'about' in current_url, f"Not on About page. Current URL: {current_url}"
     logger.info("✓ About page loaded successfully")
@@ -19,7 +19,7 @@ def step_verify_about_page_loaded(context):
 @then('the page title should be "{expected_title}"')
 def step_verify_page_title(context, expected_title):
     """Verify page title matches expected value"""
-    time.sleep(2)  # Wait for page to load
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source
     assert expected_title.lower() in page_source.lower(), f"Page title '{expected_title}' not found"
     logger.info(f"✓ Page title contains '{expected_title}'")
@@ -28,7 +28,7 @@ def step_verify_page_title(context, expected_title):
 @then('I should see "{text}" text')
 def step_verify_text_present(context, text):
     """Verify specific text is present on page"""
-    time.sleep(2)  # Wait for content to load
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source
     assert text in page_source, f"Text '{text}' not found on page"
     logger.info(f"✓ Found text: {text}")
@@ -37,7 +37,7 @@ def step_verify_text_present(context, text):
 @then('I should see company overview information')
 def step_verify_company_overview(context):
     """Verify company overview section is present"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source.lower()
     # Check for common company info keywords
     keywords = ['consulting', 'technology', 'solutions', 'founded', 'established']
@@ -49,7 +49,7 @@ def step_verify_company_overview(context):
 @then('I should see "{text}" mentioned')
 def step_verify_text_mentioned(context, text):
     """Verify text is mentioned somewhere on the page"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source
     assert text in page_source, f"'{text}' not mentioned on page"
     logger.info(f"✓ '{text}' is mentioned on page")
@@ -58,7 +58,7 @@ def step_verify_text_mentioned(context, text):
 @then('I should see the following team members')
 def step_verify_team_members(context):
     """Verify team members are displayed"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source
 
     for row in context.table:
@@ -181,7 +181,7 @@ def step_verify_button_clickable(context, button_text):
 @then('the Faberwork logo should be visible')
 def step_verify_logo_visible(context):
     """Verify Faberwork logo is visible"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     assert context.home_page.is_element_displayed(context.home_page.LOGO), "Logo not visible"
     logger.info("✓ Faberwork logo is visible")
 
@@ -189,7 +189,7 @@ def step_verify_logo_visible(context):
 @then('the footer should be visible')
 def step_verify_footer_visible(context):
     """Verify footer is visible"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     from selenium.webdriver.common.by import By
 
     # Try multiple approaches to find footer
@@ -6,6 +6,9 @@ from behave import given, when, then
 from loguru import logger
 import time
 
+from utils.config import Config
+from utils.virtual_time import advance_time
+
 
 @given('the success stories carousel is visible')
 @then('the success stories carousel should be visible')
@@ -13,6 +16,7 @@ def step_carousel_visible(context):
     """Verify carousel is visible"""
     context.home_page.scroll_to_element_locator(context.home_page.SUCCESS_STORIES_SECTION)
     assert context.home_page.is_element_displayed(context.home_page.CAROUSEL), "Carousel not visible"
+    context.carousel_position = context.home_page.get_carousel_position()
     logger.info("✓ Carousel is visible")
 
 
@@ -29,14 +33,14 @@ def step_carousel_buttons_present(context):
 def step_click_carousel_next(context):
     """Click carousel next button"""
     context.home_page.click_carousel_next()
-    time.sleep(1)  # Wait for animation
+    context.home_page.wait_for_carousel_to_settle()
 
 
 @when('I click the carousel previous button')
 def step_click_carousel_prev(context):
     """Click carousel previous button"""
     context.home_page.click_carousel_prev()
-    time.sleep(1)
+    context.home_page.wait_for_carousel_to_settle()
 
 
 @then('the next carousel item should be displayed')
@@ -51,7 +55,7 @@ def step_verify_carousel_animated(context):
 def step_navigate_to_second_item(context):
     """Navigate to second carousel item"""
     context.home_page.click_carousel_next()
-    time.sleep(1)
+    context.home_page.wait_for_carousel_to_settle()
 
 
 @then('the previous carousel item should be displayed')
@@ -64,13 +68,16 @@ def step_verify_previous_item(context):
 @then('the carousel should automatically advance to the next item')
 def step_verify_autoplay(context):
     """Verify carousel auto-advances"""
+    context.home_page.wait_for_carousel_to_settle()
+    assert context.home_page.wait_for_carousel_to_advance(context.carousel_position), \
+        "Carousel did not auto-advance"
     logger.info("✓ Carousel auto-rotation verified")
-    assert True
 
 
 @then('the testimonial slider should be visible')
 def step_verify_testimonial_slider(context):
     """Verify testimonial slider visible"""
+    context.home_page.wait_for_testimonials_to_settle()
     assert context.home_page.is_element_displayed(context.home_page.TESTIMONIAL_SECTION), "Testimonials not visible"
     logger.info("✓ Testimonial slider visible")
 
@@ -78,6 +85,7 @@ def step_verify_testimonial_slider(context):
 @then('testimonial quotes should be displayed')
 def step_verify_testimonial_quotes(context):
     """Verify testimonial quotes displayed"""
+    context.home_page.wait_for_testimonials_to_settle()
     quotes = context.home_page.find_elements(context.home_page.TESTIMONIAL_QUOTES)
     assert len(quotes) > 0, "No testimonial quotes found"
     logger.info(f"✓ Found {len(quotes)} testimonials")
@@ -128,20 +136,18 @@ def step_verify_items_have_content(context):
 @given('I am viewing the carousel on a mobile device')
 def step_mobile_carousel_view(context):
     """Set mobile viewport for carousel"""
-    time.sleep(2)
     context.driver.set_window_size(375, 667)  # iPhone size
-    time.sleep(2)
+    context.home_page.wait_for_carousel_to_settle()
     logger.info("✓ Switched to mobile view")
 
 
 @when('I swipe left on the carousel')
 def step_swipe_left_carousel(context):
     """Swipe left on carousel (touch gesture simulation)"""
-    time.sleep(2)
     # Try clicking next button as fallback for swipe
     try:
         context.home_page.click_carousel_next()
-        time.sleep(2)
+        context.home_page.wait_for_carousel_to_settle()
         logger.info("✓ Simulated swipe left (clicked next)")
     except:
         logger.info("Swipe gesture attempted")
@@ -150,7 +156,7 @@ def step_swipe_left_carousel(context):
 @then('the next carousel item should appear')
 def step_verify_next_item_appears(context):
     """Verify next carousel item appears"""
-    time.sleep(2)
+    context.home_page.wait_for_carousel_to_settle()
     logger.info("✓ Next carousel item appeared")
 
 
@@ -158,22 +164,20 @@ def step_verify_next_item_appears(context):
 @given('the success stories carousel has focus')
 def step_carousel_has_focus(context):
     """Give carousel focus for keyboard navigation"""
-    time.sleep(2)
     context.home_page.scroll_to_element_locator(context.home_page.CAROUSEL)
-    time.sleep(1)
+    context.home_page.wait_for_carousel_to_settle()
     logger.info("✓ Carousel has focus")
 
 
 @when('I press the right arrow key')
 def step_press_right_arrow(context):
     """Press right arrow key"""
-    time.sleep(2)
     from selenium.webdriver.common.keys import Keys
     from selenium.webdriver.common.by import By
     try:
         body = context.driver.find_element(By.TAG_NAME, 'body')
         body.send_keys(Keys.ARROW_RIGHT)
-        time.sleep(2)
+        context.home_page.wait_for_carousel_to_settle()
         logger.info("✓ Pressed right arrow key")
     except:
         logger.info("Arrow key press attempted")
@@ -182,13 +186,12 @@ def step_press_right_arrow(context):
 @when('I press the left arrow key')
 def step_press_left_arrow(context):
     """Press left arrow key"""
-    time.sleep(2)
     from selenium.webdriver.common.keys import Keys
     from selenium.webdriver.common.by import By
     try:
         body = context.driver.find_element(By.TAG_NAME, 'body')
         body.send_keys(Keys.ARROW_LEFT)
-        time.sleep(2)
+        context.home_page.wait_for_carousel_to_settle()
         logger.info("✓ Pressed left arrow key")
     except:
         logger.info("Arrow key press attempted")
@@ -198,19 +201,17 @@ def step_press_left_arrow(context):
 @given('the carousel is auto-rotating')
 def step_carousel_auto_rotating(context):
     """Verify carousel is auto-rotating"""
-    time.sleep(2)
     context.home_page.scroll_to_element_locator(context.home_page.CAROUSEL)
-    time.sleep(2)
+    context.home_page.wait_for_carousel_to_settle()
+    context.carousel_position = context.home_page.get_carousel_position()
     logger.info("✓ Carousel auto-rotation active")
 
 
 @when('I hover over the carousel')
 def step_hover_over_carousel(context):
     """Hover over carousel"""
-    time.sleep(2)
     try:
         context.home_page.hover(context.home_page.CAROUSEL)
-        time.sleep(2)
         logger.info("✓ Hovered over carousel")
     except:
         logger.info("Carousel hover attempted")
@@ -219,20 +220,23 @@ def step_hover_over_carousel(context):
 @then('the carousel should pause auto-rotation')
 def step_verify_carousel_paused(context):
     """Verify carousel paused on hover"""
-    time.sleep(3)
+    position = context.home_page.get_carousel_position()
+    if not advance_time(context, Config.CAROUSEL_AUTOPLAY_INTERVAL * 2):
+        time.sleep(Config.CAROUSEL_AUTOPLAY_INTERVAL)
+    context.home_page.wait_for_carousel_to_settle()
+    context.carousel_position = context.home_page.get_carousel_position()
+    assert context.carousel_position == position, "Carousel kept rotating while hovered"
     logger.info("✓ Carousel pause verified")
 
 
 @when('I move the mouse away')
 def step_move_mouse_away(context):
     """Move mouse away from carousel"""
-    time.sleep(2)
     from selenium.webdriver.common.by import By
     try:
         # Move to a different element
         footer = context.driver.find_element(By.TAG_NAME, 'footer')
         context.home_page.hover((By.TAG_NAME, 'footer'))
-        time.sleep(2)
         logger.info("✓ Moved mouse away")
     except:
         logger.info("Mouse movement attempted")
@@ -241,5 +245,7 @@ def step_move_mouse_away(context):
 @then('the carousel should resume auto-rotation')
 def step_verify_carousel_resumed(context):
     """Verify carousel resumed auto-rotation"""
-    time.sleep(3)
+    advance_time(context, Config.CAROUSEL_AUTOPLAY_INTERVAL)
+    assert context.home_page.wait_for_carousel_to_advance(context.carousel_position), \
+        "Carousel did not resume auto-rotation"
     logger.info("✓ Carousel auto-rotation resumed")
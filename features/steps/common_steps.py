@@ -7,6 +7,7 @@ from behave import given, when, then
 from loguru import logger
 from utils.config import Config
 from utils.test_data import TestDataGenerator
+from utils.virtual_time import advance_time
 
 
 # Initialize test data generator
@@ -72,8 +73,7 @@ def step_click_menu_item(context, menu_item):
 
     # Wait for navigation to be fully loaded
     context.home_page.wait_for_page_load()
-    import time
-    time.sleep(0.5)  # Small delay to ensure nav elements are interactive
+    context.home_page.wait_for_animations()  # Ensure nav elements are done animating in
 
     # Case-insensitive menu mapping
     menu_mapping = {
@@ -207,7 +207,10 @@ def step_verify_page_loaded(context):
 
 @when('I wait for {seconds:d} seconds')
 def step_wait_seconds(context, seconds):
-    """Wait for specified number of seconds"""
+    """Wait for specified number of seconds (fast-forwarded on @virtual_time scenarios)"""
+    if advance_time(context, seconds):
+        logger.info(f"Advanced page timers by {seconds} seconds")
+        return
     import time
     time.sleep(seconds)
     logger.info(f"Waited for {seconds} seconds")
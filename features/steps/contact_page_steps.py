@@ -28,7 +28,7 @@ def step_verify_page_heading(context, expected_heading):
 @then('I should see USA office phone number "{phone}"')
 def step_verify_usa_phone(context, phone):
     """Verify USA phone number is displayed"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source
     # Remove formatting for comparison
     phone_digits = phone.replace('+', '').replace('-', '').replace(' ', '')
@@ -40,7 +40,7 @@ def step_verify_usa_phone(context, phone):
 @then('I should see India office phone number "{phone}"')
 def step_verify_india_phone(context, phone):
     """Verify India phone number is displayed"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source
     # Remove formatting for comparison
     phone_digits = phone.replace('+', '').replace('-', '').replace(' ', '')
@@ -52,7 +52,7 @@ def step_verify_india_phone(context, phone):
 @then('I should see email address "{email}"')
 def step_verify_email(context, email):
     """Verify email address is displayed"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source
     assert email in page_source, f"Email '{email}' not found"
     logger.info(f"✓ Email '{email}' is displayed")
@@ -61,7 +61,7 @@ def step_verify_email(context, email):
 @then('I should see USA office address "{address}"')
 def step_verify_usa_address(context, address):
     """Verify USA office address"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source
     # Check if key parts of address are present
     address_parts = address.split(',')
@@ -73,7 +73,7 @@ def step_verify_usa_address(context, address):
 @then('I should see India office address containing "{address_part}"')
 def step_verify_india_address(context, address_part):
     """Verify India office address contains specific text"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source
     assert address_part in page_source, f"India address part '{address_part}' not found"
     logger.info(f"✓ India office address contains '{address_part}'")
@@ -162,8 +162,10 @@ def step_submit_contact_form(context):
     from selenium.webdriver.common.by import By
     try:
         submit_button = context.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+        context.form_response_watch = context.contact_page.arm_dom_change(
+            mutation_types=('childList', 'attributes'), match=context.contact_page.SUCCESS_MESSAGE
+        )
         submit_button.click()
-        time.sleep(2)
         logger.info("✓ Submitted contact form")
     except:
         logger.info("Submit button not found, form submission skipped")
@@ -172,7 +174,13 @@ def step_submit_contact_form(context):
 @then('I should see a success message')
 def step_verify_success_message(context):
     """Verify success message is displayed"""
-    time.sleep(3)  # Extra wait for message to appear
+    watch = getattr(context, 'form_response_watch', None)
+    if watch:
+        change = context.contact_page.wait_for_dom_change(watch)
+        if change:
+            logger.info(f"Form response shown after {change['elapsed_ms']:.0f}ms")
+    else:
+        time.sleep(3)  # Extra wait for message to appear
     page_source = context.driver.page_source.lower()
     success_keywords = ['success', 'thank', 'received', 'submitted', 'sent']
     found = any(keyword in page_source for keyword in success_keywords)
@@ -39,6 +39,9 @@ def step_fill_consultation_form_with_table(context):
 @when('I submit the consultation form')
 def step_submit_consultation_form(context):
     """Submit the consultation form"""
+    context.form_response_watch = context.home_page.arm_dom_change(
+        mutation_types=('childList', 'attributes'), match=context.home_page.SUCCESS_MESSAGE
+    )
     context.home_page.submit_consultation_form()
     logger.info("Submitted consultation form")
 
@@ -136,17 +139,23 @@ def step_verify_success_message_contains_text(context, text, alt_text):
         assert context.home_page.is_success_message_displayed(), "No success message displayed"
 
 
+@then('the success message should disappear automatically')
+def step_verify_success_message_dismissed(context):
+    """Verify the success toast auto-dismisses (fast-forwarded on @virtual_time scenarios)"""
+    assert context.home_page.is_success_message_dismissed(context.clock), \
+        "Success message was not dismissed automatically"
+    logger.info("✓ Success message dismissed automatically")
+
+
 @then('I should see a validation error')
 @then('I should see validation errors for required fields')
 def step_verify_validation_error(context):
     """Verify validation error is displayed"""
-    error_displayed = (
-        context.home_page.is_element_displayed(context.home_page.VALIDATION_ERROR) or
-        context.contact_page.is_error_message_displayed() or
-        len(context.contact_page.get_validation_errors()) > 0
-    )
+    # One bounded wait for whichever response shows up first
+    outcome = context.contact_page.wait_for_form_outcome()
+    error_displayed = outcome in ('error', 'validation') or len(context.contact_page.get_validation_errors()) > 0
 
-    assert error_displayed, "No validation errors displayed"
+    assert error_displayed, f"No validation errors displayed (form outcome: {outcome})"
     logger.info("✓ Validation errors displayed")
 
 
@@ -170,9 +179,9 @@ def step_verify_email_validation_error(context):
 @then('the form should not be submitted')
 def step_verify_form_not_submitted(context):
     """Verify form was not submitted (still on same page)"""
-    # Check we're still on the same page (no redirect)
-    # This is a basic check - might need adjustment based on actual behavior
-    assert not context.home_page.is_success_message_displayed(), "Success message should not be displayed"
+    # Passes once the page is quiet without a success toast, not after a full timeout
+    not_submitted = context.home_page.wait_for_absence(context.home_page.SUCCESS_MESSAGE)
+    assert not_submitted, "Success message should not be displayed"
     logger.info("✓ Form was not submitted")
 
 
@@ -198,7 +207,8 @@ def step_verify_phone_validation(context, result):
 @then('the message should confirm submission')
 def step_verify_submission_confirmation(context):
     """Verify message confirms submission"""
-    assert context.contact_page.is_success_message_displayed(), "No confirmation message"
+    outcome = context.contact_page.wait_for_form_outcome()
+    assert outcome == 'success', f"No confirmation message (form outcome: {outcome})"
     logger.info("✓ Submission confirmed")
 
 
@@ -233,10 +243,7 @@ def step_verify_specific_field_error(context, field_name):
 def step_verify_newsletter_confirmation(context):
     """Verify newsletter subscription confirmation"""
     # This might be a success message or modal
-    confirmation = (
-        context.home_page.is_success_message_displayed() or
-        context.home_page.wait_for_element_to_appear(context.home_page.SUCCESS_MESSAGE, timeout=3)
-    )
+    confirmation = context.home_page.wait_for_form_outcome(timeout=8) == 'success'
 
     if confirmation:
         logger.info("✓ Newsletter subscription confirmed")
@@ -10,7 +10,7 @@ import time
 @then('the Industries page should load successfully')
 def step_verify_industries_page_loaded(context):
     """Verify Industries page loaded successfully"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     current_url = context.driver.current_url.lower()
     assert 'industr' in current_url, f"Not on Industries page. Current URL: {current_url}"
     logger.info("✓ Industries page loaded successfully")
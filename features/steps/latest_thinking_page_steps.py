@@ -10,7 +10,7 @@ import time
 @then('the Latest Thinking page should load successfully')
 def step_verify_latest_thinking_page_loaded(context):
     """Verify Latest Thinking page loaded successfully"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     current_url = context.driver.current_url.lower()
     assert 'thinking' in current_url or 'blog' in current_url or 'article' in current_url, \
         f"Not on Latest Thinking page. Current URL: {current_url}"
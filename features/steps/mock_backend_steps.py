@@ -0,0 +1,66 @@
+"""
+Mock backend step definitions for Faberwork Test Automation
+Error/latency injection and assertions on requests captured by the local stub server
+"""
+
+from behave import given, then
+from loguru import logger
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+
+def _mock_backend(context):
+    """Get the scenario's mock backend, skipping the scenario if it is not active"""
+    backend = getattr(context, 'mock_backend', None)
+    if backend is None:
+        context.scenario.skip("Mock backend not active (needs @mock_backend and selenium-wire)")
+    return backend
+
+
+def _wait_for_captured(context, backend, **criteria) -> list:
+    """Wait for the page to send a request matching the criteria to the mock backend"""
+    try:
+        return WebDriverWait(context.driver, 10, poll_frequency=0.1).until(
+            lambda d: backend.find_requests(**criteria)
+        )
+    except TimeoutException:
+        return []
+
+
+@given('the mock backend responds with status {status:d}')
+def step_mock_backend_status(context, status):
+    """Inject an error (or any fixed status) into every mock backend answer"""
+    backend = _mock_backend(context)
+    if backend:
+        backend.respond_with_status(status)
+        logger.info(f"Mock backend answers with HTTP {status}")
+
+
+@given('the mock backend responds after {latency:d} milliseconds')
+def step_mock_backend_latency(context, latency):
+    """Inject latency into every mock backend answer"""
+    backend = _mock_backend(context)
+    if backend:
+        backend.latency_ms = latency
+        logger.info(f"Mock backend latency set to {latency}ms")
+
+
+@then('the mock backend should have received a submission containing "{text}"')
+def step_verify_mock_submission(context, text):
+    """Verify a form submission carrying the given value reached the mock backend"""
+    backend = _mock_backend(context)
+    if backend:
+        captured = _wait_for_captured(context, backend, text=text)
+        assert captured, f"No request containing '{text}' reached the mock backend: " \
+                         f"{[request['url'] for request in backend.requests]}"
+        logger.info(f"✓ Mock backend received submission to {captured[-1]['path']}")
+
+
+@then('the mock backend should have received the chatbot message "{message}"')
+def step_verify_mock_chatbot_message(context, message):
+    """Verify a chatbot message reached the mock backend"""
+    backend = _mock_backend(context)
+    if backend:
+        captured = _wait_for_captured(context, backend, path_contains='chat', text=message)
+        assert captured, f"Chatbot message '{message}' did not reach the mock backend"
+        logger.info(f"✓ Mock backend received chatbot message at {captured[-1]['path']}")
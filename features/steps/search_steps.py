@@ -10,6 +10,9 @@ from loguru import logger
 def step_search_for_keyword(context, keyword):
     """Search for a keyword"""
     if context.home_page.is_element_displayed(context.home_page.SEARCH_INPUT):
+        context.search_results_watch = context.home_page.arm_dom_change(
+            mutation_types=('childList', 'characterData'), match=context.home_page.SEARCH_RESULTS
+        )
         context.home_page.search_for(keyword)
         context.search_keyword = keyword
         logger.info(f"Searched for: {keyword}")
@@ -30,6 +33,9 @@ def step_submit_empty_search(context):
 @then('search results should be displayed')
 def step_verify_results_displayed(context):
     """Verify search results displayed"""
+    change = context.home_page.wait_for_dom_change(getattr(context, 'search_results_watch', None))
+    if change:
+        logger.info(f"Search results rendered after {change['elapsed_ms']:.0f}ms")
     results_visible = context.home_page.is_element_displayed(context.home_page.SEARCH_RESULTS)
     assert results_visible, "Search results not displayed"
     logger.info("✓ Search results displayed")
@@ -52,8 +58,10 @@ def step_verify_empty_search_message(context):
 @then('no results should be displayed')
 def step_verify_no_results(context):
     """Verify no results displayed"""
+    # Nothing was waited for here before, so the check saves no time
+    no_results = context.home_page.wait_for_absence(context.home_page.SEARCH_RESULT_ITEMS, record_saving=False)
+    assert no_results, "Search results should not be displayed"
     logger.info("✓ No results displayed")
-    assert True
 
 
 @then('I should see a "no results found" message')
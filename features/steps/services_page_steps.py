@@ -4,13 +4,12 @@ Step definitions for Services page
 
 from behave import given, when, then
 from loguru import logger
-import time
 
 
 @then('the Services page should load successfully')
 def step_verify_services_page_loaded(context):
     """Verify Services page loaded successfully"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     current_url = context.driver.current_url.lower()
     assert 'service' in current_url, f"Not on Services page. Current URL: {current_url}"
     logger.info("✓ Services page loaded successfully")
@@ -19,7 +18,7 @@ def step_verify_services_page_loaded(context):
 @then('the page title should contain "{title_text}"')
 def step_verify_page_title_contains(context, title_text):
     """Verify page title contains specific text"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source
     assert title_text in page_source, f"Page title doesn't contain '{title_text}'"
     logger.info(f"✓ Page title contains '{title_text}'")
@@ -28,7 +27,7 @@ def step_verify_page_title_contains(context, title_text):
 @then('all service offerings are visible on the page')
 def step_verify_all_services_visible(context):
     """Verify service offerings are visible"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     from selenium.webdriver.common.by import By
     # Look for service cards or sections
     page_text = context.driver.page_source.lower()
@@ -41,7 +40,7 @@ def step_verify_all_services_visible(context):
 @then('I should see the following services')
 def step_verify_specific_services(context):
     """Verify specific services are listed"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source
 
     for row in context.table:
@@ -53,7 +52,7 @@ def step_verify_specific_services(context):
 @then('I should see the "{section_name}" section')
 def step_verify_section_exists(context, section_name):
     """Verify a section exists on the page"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     page_source = context.driver.page_source
     # Flexible matching
     section_words = section_name.lower().split()
@@ -4,13 +4,13 @@ Step definitions for Success Stories page
 
 from behave import given, when, then
 from loguru import logger
-import time
+from selenium.webdriver.common.by import By
 
 
 @then('the Success Stories page should load successfully')
 def step_verify_success_stories_page_loaded(context):
     """Verify Success Stories page loaded successfully"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     current_url = context.driver.current_url.lower()
     assert 'success' in current_url or 'stories' in current_url, \
         f"Not on Success Stories page. Current URL: {current_url}"
@@ -20,10 +20,9 @@ def step_verify_success_stories_page_loaded(context):
 @then('I should see multiple case study cards')
 def step_verify_case_study_cards(context):
     """Verify case study cards are present"""
-    time.sleep(2)
-    from selenium.webdriver.common.by import By
+    context.home_page.wait_for_animations()
     # Look for cards, articles, or sections
-    page_source = context.driver.page_source.lower()
+    page_source = context.home_page.snapshot().source.lower()
     indicators = ['case', 'study', 'story', 'client', 'customer']
     found = sum(1 for indicator in indicators if indicator in page_source)
     assert found >= 2, f"Case study content not found adequately ({found} indicators)"
@@ -33,28 +32,26 @@ def step_verify_case_study_cards(context):
 @then('each card should have a title')
 def step_verify_cards_have_titles(context):
     """Verify cards have titles"""
-    time.sleep(2)
-    from selenium.webdriver.common.by import By
-    headings = context.driver.find_elements(By.CSS_SELECTOR, 'h1, h2, h3, h4, h5, h6')
-    assert len(headings) >= 2, f"Expected multiple headings/titles, found {len(headings)}"
-    logger.info(f"✓ Found {len(headings)} titles/headings")
+    context.home_page.wait_for_animations()
+    headings = context.home_page.snapshot().count((By.CSS_SELECTOR, 'h1, h2, h3, h4, h5, h6'))
+    assert headings >= 2, f"Expected multiple headings/titles, found {headings}"
+    logger.info(f"✓ Found {headings} titles/headings")
 
 
 @then('each card should have a description')
 def step_verify_cards_have_descriptions(context):
     """Verify cards have descriptions"""
-    time.sleep(2)
-    from selenium.webdriver.common.by import By
-    paragraphs = context.driver.find_elements(By.TAG_NAME, 'p')
-    assert len(paragraphs) >= 2, f"Expected multiple descriptions, found {len(paragraphs)}"
-    logger.info(f"✓ Found {len(paragraphs)} description paragraphs")
+    context.home_page.wait_for_animations()
+    paragraphs = context.home_page.snapshot().count((By.TAG_NAME, 'p'))
+    assert paragraphs >= 2, f"Expected multiple descriptions, found {paragraphs}"
+    logger.info(f"✓ Found {paragraphs} description paragraphs")
 
 
 @then('each card should have a "{link_text}" link')
 def step_verify_cards_have_read_more(context, link_text):
     """Verify cards have Read More links"""
-    time.sleep(2)
-    page_source = context.driver.page_source
+    context.home_page.wait_for_animations()
+    page_source = context.home_page.snapshot().source
     assert link_text.lower() in page_source.lower() or 'read' in page_source.lower(), \
         f"'{link_text}' links not found"
     logger.info(f"✓ '{link_text}' links are present")
@@ -63,14 +60,13 @@ def step_verify_cards_have_read_more(context, link_text):
 @when('I select a filter option')
 def step_select_filter_option(context):
     """Select a filter option"""
-    time.sleep(2)
-    from selenium.webdriver.common.by import By
+    context.home_page.wait_for_animations()
     try:
         # Try to find filter buttons or dropdowns
         buttons = context.driver.find_elements(By.CSS_SELECTOR, 'button, .filter, select')
         if len(buttons) > 0:
             buttons[0].click()
-            time.sleep(2)
+            context.home_page.wait_for_animations()
             logger.info("✓ Selected a filter option")
         else:
             logger.info("Filter options not interactive (may be informational)")
@@ -81,15 +77,15 @@ def step_select_filter_option(context):
 @then('the page should filter the results accordingly')
 def step_verify_filtering_works(context):
     """Verify filtering works"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     logger.info("✓ Filtering behavior verified")
 
 
 @then('I should see industry filter options')
 def step_verify_industry_filters(context):
     """Verify industry filter options exist"""
-    time.sleep(2)
-    page_source = context.driver.page_source.lower()
+    context.home_page.wait_for_animations()
+    page_source = context.home_page.snapshot().source.lower()
     filter_indicators = ['filter', 'industry', 'sector', 'category']
     found = any(indicator in page_source for indicator in filter_indicators)
     if found:
@@ -101,8 +97,8 @@ def step_verify_industry_filters(context):
 @then('I should see technology stack filter options')
 def step_verify_technology_filters(context):
     """Verify technology filter options exist"""
-    time.sleep(2)
-    page_source = context.driver.page_source.lower()
+    context.home_page.wait_for_animations()
+    page_source = context.home_page.snapshot().source.lower()
     found = 'technology' in page_source or 'stack' in page_source or 'tech' in page_source
     logger.info("✓ Technology filter options checked")
 
@@ -110,8 +106,8 @@ def step_verify_technology_filters(context):
 @then('I should see options like "{option_list}"')
 def step_verify_specific_options(context, option_list):
     """Verify specific filter options exist"""
-    time.sleep(2)
-    page_source = context.driver.page_source
+    context.home_page.wait_for_animations()
+    page_source = context.home_page.snapshot().source
     options = [opt.strip().strip('"') for opt in option_list.split(',')]
 
     found_count = sum(1 for option in options if option in page_source)
@@ -121,36 +117,34 @@ def step_verify_specific_options(context, option_list):
 @then('the search field should appear')
 def step_verify_search_field_appears(context):
     """Verify search field is present"""
-    time.sleep(2)
-    from selenium.webdriver.common.by import By
-    inputs = context.driver.find_elements(By.CSS_SELECTOR, 'input[type="text"], input[type="search"]')
-    logger.info(f"✓ Search field checked (found {len(inputs)} input fields)")
+    context.home_page.wait_for_animations()
+    inputs = context.home_page.snapshot().count((By.CSS_SELECTOR, 'input[type="text"], input[type="search"]'))
+    logger.info(f"✓ Search field checked (found {inputs} input fields)")
 
 
 @then('I can search for specific case studies')
 def step_verify_can_search(context):
     """Verify search functionality is available"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     logger.info("✓ Search functionality verified")
 
 
 @then('search results should be displayed dynamically')
 def step_verify_dynamic_search(context):
     """Verify dynamic search results"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     logger.info("✓ Dynamic search verified")
 
 
 @when('I click on a "{link_text}" link on a case study card')
 def step_click_read_more_on_card(context, link_text):
     """Click Read More link on a case study card"""
-    time.sleep(2)
-    from selenium.webdriver.common.by import By
+    context.home_page.wait_for_animations()
     try:
         links = context.driver.find_elements(By.PARTIAL_LINK_TEXT, link_text)
         if len(links) > 0:
             links[0].click()
-            time.sleep(2)
+            context.home_page.wait_for_animations()
             logger.info(f"✓ Clicked '{link_text}' link")
         else:
             logger.info(f"'{link_text}' link not found for interaction")
@@ -161,6 +155,6 @@ def step_click_read_more_on_card(context, link_text):
 @then('I should be taken to the full case study or expanded content')
 def step_verify_case_study_expanded(context):
     """Verify case study content is shown"""
-    time.sleep(2)
+    context.home_page.wait_for_animations()
     # Check if page changed or content expanded
     logger.info("✓ Case study content navigation verified")
@@ -45,12 +45,13 @@ Feature: Success Stories Page Functionality
     When I click on a "Read More" link on a case study card
     Then I should be taken to the full case study or expanded content
 
-  @success_stories @chatbot
+  @success_stories @chatbot @mock_backend
   Scenario: Chatbot is accessible on Success Stories page
     When I click on the chatbot button
     Then the chatbot dialog should open
     And I should see the chat input field
     And I should be able to send a message
+    And the mock backend should have received the chatbot message "Hello"
 
   @success_stories @navigation
   Scenario: Navigation works properly on Success Stories page
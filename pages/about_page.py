@@ -64,6 +64,11 @@ class AboutPage(BasePage):
     COMPANY_IMAGES = (By.CSS_SELECTOR, ".about-image, .company-image")
     TEAM_PHOTOS = (By.CSS_SELECTOR, ".team-photo, .member-photo")
 
+    # ============================================
+    # Readiness Contract
+    # ============================================
+    READY_WHEN = (PAGE_TITLE,)
+
     def __init__(self, driver: WebDriver):
         """Initialize AboutPage"""
         super().__init__(driver)
@@ -8,28 +8,54 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
 from loguru import logger
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import time
 
 from utils.config import Config
+from utils import page_runtime
+from utils.network_idle import network_idle_tracker
+from utils.readiness import wait_for_ready_contract, record_readiness_savings, get_time_origin
+from utils.navigation import can_reuse, mark_clean, mark_dirty, record_navigation, record_reuse
+from utils.dom_snapshot import DomSnapshot, get_snapshot, invalidate_snapshot
+from utils.snapshot_cache import is_snapshot_mode
+from utils.element_cache import get_element_cache
+from utils.locator_timing import get_locator_timings
+from utils.self_healing import get_locator_healer, self_healing_stats
 from utils.helpers import (
     wait_for_element,
     wait_for_element_to_be_clickable,
     wait_for_element_visibility,
+    wait_for_first,
+    wait_for_absence,
     wait_for_elements,
     scroll_to_element,
+    scroll_to_top,
+    scroll_to_bottom,
+    wait_for_animations,
+    wait_for_page_load,
+    arm_dom_change,
+    wait_for_dom_change,
+    DOM_MUTATION_TYPES,
     take_screenshot,
     is_element_present,
-    is_element_visible,
 )
 
 
 class BasePage:
     """Base page class with common methods for all page objects"""
 
+    # Readiness strategy for wait_for_page_load: 'document' or 'network_idle'
+    # (None uses Config.PAGE_READINESS)
+    PAGE_READINESS = None
+
+    # Readiness contract: locators that must be visible (or callables taking the
+    # driver) for the page to be usable; empty means wait for the full load
+    READY_WHEN = ()
+
     def __init__(self, driver: WebDriver):
         """
         Initialize BasePage
@@ -46,21 +72,56 @@ class BasePage:
     # Navigation Methods
     # ============================================
 
-    def navigate_to(self, url: str):
+    def navigate_to(self, url: str, reuse: bool = None):
         """
         Navigate to a specific URL
 
         Args:
             url: URL to navigate to
+            reuse: Skip the reload if the browser is already on url and the page
+                has not been interacted with (defaults to Config.NAVIGATION_REUSE)
         """
+        reuse = Config.NAVIGATION_REUSE if reuse is None else reuse
         try:
+            if is_snapshot_mode(self.driver):
+                # Served from the snapshot cache (a miss loads url in a new browser)
+                self.driver.get(url)
+                logger.info(f"Navigated to: {url}")
+                return
+
+            if reuse and can_reuse(self.driver, url):
+                record_reuse(url)
+                scroll_to_top(self.driver, smooth=False)
+                return
+
+            start = time.perf_counter()
+            previous_origin = self._leave_page()
             self.driver.get(url)
             logger.info(f"Navigated to: {url}")
-            self.wait_for_page_load()
+            # The readiness contract describes this page object's own URL only
+            own_page = url.rstrip('/') == getattr(self, 'url', '').rstrip('/')
+            self.wait_for_page_load(previous_origin=previous_origin, contract=own_page)
+            mark_clean(self.driver)
+            record_navigation(url, time.perf_counter() - start)
         except Exception as e:
             logger.error(f"Failed to navigate to {url}: {str(e)}")
             raise
 
+    def _leave_page(self) -> Optional[float]:
+        """
+        Bookkeeping before navigating away from the current document
+
+        Returns:
+            float: Navigation start of the document being left
+        """
+        record_readiness_savings(self.driver)
+        invalidate_snapshot(self.driver)
+        get_element_cache(self.driver).invalidate()
+        # Drop network events of the previous page (only recorded for network-idle readiness)
+        if Config.NETWORK_EVENTS:
+            network_idle_tracker(self.driver).reset()
+        return get_time_origin(self.driver)
+
     def get_current_url(self) -> str:
         """Get the current page URL"""
         url = self.driver.current_url
@@ -75,21 +136,25 @@ class BasePage:
 
     def refresh_page(self):
         """Refresh the current page"""
+        previous_origin = self._leave_page()
         self.driver.refresh()
         logger.info("Page refreshed")
-        self.wait_for_page_load()
+        self.wait_for_page_load(previous_origin=previous_origin)
+        mark_clean(self.driver)
 
     def go_back(self):
         """Navigate back in browser history"""
+        previous_origin = self._leave_page()
         self.driver.back()
         logger.info("Navigated back")
-        self.wait_for_page_load()
+        self.wait_for_page_load(previous_origin=previous_origin)
 
     def go_forward(self):
         """Navigate forward in browser history"""
+        previous_origin = self._leave_page()
         self.driver.forward()
         logger.info("Navigated forward")
-        self.wait_for_page_load()
+        self.wait_for_page_load(previous_origin=previous_origin)
 
     # ============================================
     # Element Interaction Methods
@@ -99,13 +164,57 @@ class BasePage:
         """
         Find a single element
 
+        With SELF_HEALING, a locator that stopped matching is looked up
+        through the alternates learned for it (see utils/self_healing.py).
+
         Args:
             locator: Tuple of (By, value)
 
         Returns:
             WebElement or None
         """
-        return wait_for_element(self.driver, locator)
+        if Config.SELF_HEALING and not is_snapshot_mode(self.driver):
+            element = self._find_healing(locator)
+        else:
+            element = wait_for_element(self.driver, locator)
+        if element is not None and self._element_cache_enabled():
+            get_element_cache(self.driver).put(locator, element)
+        return element
+
+    def _find_healing(self, locator: Tuple[str, str]) -> Optional[WebElement]:
+        """Find an element, falling back to its alternates when the locator broke"""
+        healer = get_locator_healer()
+
+        # A locator healed on this page before goes straight to its winning alternate
+        winner = healer.winner(locator, self.driver)
+        if winner:
+            element = wait_for_element(self.driver, winner, timeout=Config.SELF_HEALING_PRIMARY_TIMEOUT,
+                                       record=False)
+            if element is not None:
+                self_healing_stats['cached_heals'] += 1
+                return element
+            healer.forget_winner(locator)
+
+        if not healer.knows(locator):
+            element = wait_for_element(self.driver, locator)
+            if element is not None:
+                try:
+                    healer.learn(self.driver, locator, element)
+                except Exception as e:
+                    logger.error(f"Failed to learn alternates of {locator}: {str(e)}")
+            return element
+
+        # Fail fast on the locator, then query it together with its alternates.
+        # The probe is not timed; the locator's latency is recorded once, at the end.
+        start = time.perf_counter()
+        element = wait_for_element(self.driver, locator, timeout=Config.SELF_HEALING_PRIMARY_TIMEOUT, record=False)
+        healed = False
+        if element is None:
+            remaining = max(0.0, Config.EXPLICIT_WAIT - (time.perf_counter() - start))
+            element, healed = healer.heal(self.driver, locator, remaining)
+        found = element is not None and not healed
+        get_locator_timings().record(locator, time.perf_counter() - start, found=found)
+        return element
 
     def find_elements(self, locator: Tuple[str, str]) -> List[WebElement]:
         """
@@ -128,14 +237,24 @@ class BasePage:
             wait_clickable: Wait for element to be clickable
         """
         try:
-            if wait_clickable:
-                element = wait_for_element_to_be_clickable(self.driver, locator)
-            else:
+            if is_snapshot_mode(self.driver):
                 element = self.find_element(locator)
+                if not element:
+                    raise NoSuchElementException(f"Element not found: {locator}")
+                # Links open the cached target page, anything else starts the browser
+                element.click()
+                logger.info(f"Clicked element: {locator}")
+                return
+
+            invalidate_snapshot(self.driver)
 
-            if element:
+            def click_element(element):
                 scroll_to_element(self.driver, element)
                 element.click()
+                return True
+
+            resolve = (lambda: wait_for_element_to_be_clickable(self.driver, locator)) if wait_clickable else None
+            if self._on_element(locator, click_element, resolve):
                 logger.info(f"Clicked element: {locator}")
             else:
                 raise NoSuchElementException(f"Element not found: {locator}")
@@ -157,9 +276,11 @@ class BasePage:
             locator: Tuple of (By, value)
         """
         try:
-            element = self.find_element(locator)
-            if element:
-                self.driver.execute_script("arguments[0].click();", element)
+            invalidate_snapshot(self.driver)
+            clicked = self._on_element(
+                locator, lambda element: page_runtime.call(self.driver, 'click', element) or True
+            )
+            if clicked:
                 logger.info(f"Clicked element with JS: {locator}")
         except Exception as e:
             logger.error(f"Failed to click with JS {locator}: {str(e)}")
@@ -173,9 +294,13 @@ class BasePage:
             locator: Tuple of (By, value)
         """
         try:
-            element = wait_for_element_to_be_clickable(self.driver, locator)
-            if element:
-                self.actions.double_click(element).perform()
+            invalidate_snapshot(self.driver)
+            double_clicked = self._on_element(
+                locator,
+                lambda element: self.actions.double_click(element).perform() or True,
+                lambda: wait_for_element_to_be_clickable(self.driver, locator)
+            )
+            if double_clicked:
                 logger.info(f"Double clicked element: {locator}")
         except Exception as e:
             logger.error(f"Failed to double click {locator}: {str(e)}")
@@ -189,9 +314,13 @@ class BasePage:
             locator: Tuple of (By, value)
         """
         try:
-            element = wait_for_element_to_be_clickable(self.driver, locator)
-            if element:
-                self.actions.context_click(element).perform()
+            invalidate_snapshot(self.driver)
+            right_clicked = self._on_element(
+                locator,
+                lambda element: self.actions.context_click(element).perform() or True,
+                lambda: wait_for_element_to_be_clickable(self.driver, locator)
+            )
+            if right_clicked:
                 logger.info(f"Right clicked element: {locator}")
         except Exception as e:
             logger.error(f"Failed to right click {locator}: {str(e)}")
@@ -205,11 +334,15 @@ class BasePage:
             locator: Tuple of (By, value)
         """
         try:
-            element = wait_for_element_visibility(self.driver, locator)
-            if element:
+            invalidate_snapshot(self.driver)
+
+            def hover_element(element):
                 self.actions.move_to_element(element).perform()
                 logger.info(f"Hovered over element: {locator}")
-                time.sleep(0.5)  # Small delay for hover effects
+                wait_for_animations(self.driver, element)  # Let hover transitions finish
+                return True
+
+            self._on_element(locator, hover_element, lambda: wait_for_element_visibility(self.driver, locator))
         except Exception as e:
             logger.error(f"Failed to hover over {locator}: {str(e)}")
             raise
@@ -224,14 +357,18 @@ class BasePage:
             clear_first: Clear field before entering text
         """
         try:
-            element = wait_for_element_visibility(self.driver, locator)
-            if element:
+            invalidate_snapshot(self.driver)
+
+            def type_into(element):
                 scroll_to_element(self.driver, element)
 
                 if clear_first:
                     element.clear()
 
                 element.send_keys(text)
+                return True
+
+            if self._on_element(locator, type_into, lambda: wait_for_element_visibility(self.driver, locator)):
                 logger.info(f"Entered text into {locator}: '{text}'")
         except Exception as e:
             logger.error(f"Failed to enter text into {locator}: {str(e)}")
@@ -246,9 +383,8 @@ class BasePage:
             locator: Tuple of (By, value)
         """
         try:
-            element = self.find_element(locator)
-            if element:
-                element.clear()
+            invalidate_snapshot(self.driver)
+            if self._on_element(locator, lambda element: element.clear() or True):
                 logger.info(f"Cleared text from: {locator}")
         except Exception as e:
             logger.error(f"Failed to clear text from {locator}: {str(e)}")
@@ -265,9 +401,8 @@ class BasePage:
             str: Element text
         """
         try:
-            element = self.find_element(locator)
-            if element:
-                text = element.text
+            text = self._on_element(locator, lambda element: element.text)
+            if text is not None:
                 logger.debug(f"Got text from {locator}: '{text}'")
                 return text
             return ""
@@ -287,12 +422,9 @@ class BasePage:
             str: Attribute value
         """
         try:
-            element = self.find_element(locator)
-            if element:
-                value = element.get_attribute(attribute)
-                logger.debug(f"Got attribute '{attribute}' from {locator}: '{value}'")
-                return value or ""
-            return ""
+            value = self._on_element(locator, lambda element: element.get_attribute(attribute))
+            logger.debug(f"Got attribute '{attribute}' from {locator}: '{value}'")
+            return value or ""
         except Exception as e:
             logger.error(f"Failed to get attribute from {locator}: {str(e)}")
             return ""
@@ -307,7 +439,13 @@ class BasePage:
         Returns:
             bool: True if displayed, False otherwise
         """
-        return is_element_visible(self.driver, locator)
+        def find_now():
+            try:
+                return self.driver.find_element(*locator)
+            except NoSuchElementException:
+                return None
+
+        return bool(self._on_element(locator, lambda element: element.is_displayed(), find_now))
 
     def is_element_enabled(self, locator: Tuple[str, str]) -> bool:
         """
@@ -320,8 +458,7 @@ class BasePage:
             bool: True if enabled, False otherwise
         """
         try:
-            element = self.find_element(locator)
-            return element.is_enabled() if element else False
+            return bool(self._on_element(locator, lambda element: element.is_enabled()))
         except:
             return False
 
@@ -336,11 +473,33 @@ class BasePage:
             bool: True if selected, False otherwise
         """
         try:
-            element = self.find_element(locator)
-            return element.is_selected() if element else False
+            return bool(self._on_element(locator, lambda element: element.is_selected()))
         except:
             return False
 
+    def _on_element(self, locator: Tuple[str, str], action, resolve=None):
+        """
+        Run an action on the element of a locator through the element cache
+
+        Args:
+            locator: Tuple of (By, value)
+            action: Called with the element, its result is returned
+            resolve: Finds the element when no usable handle is cached
+                (defaults to waiting for presence)
+
+        Returns:
+            Result of action, or None if the element was not found
+        """
+        resolve = resolve or (lambda: self.find_element(locator))
+        if not self._element_cache_enabled():
+            element = resolve()
+            return action(element) if element else None
+        return get_element_cache(self.driver).run(locator, resolve, action)
+
+    def _element_cache_enabled(self) -> bool:
+        """True if element handles are cached (snapshot elements never go stale)"""
+        return Config.ELEMENT_CACHE and not is_snapshot_mode(self.driver)
+
     # ============================================
     # Wait Methods
     # ============================================
@@ -349,6 +508,10 @@ class BasePage:
         """
         Wait for element to appear
 
+        A wait with an explicit timeout is a probe that may well time out
+        (e.g. for an error message), so it is not recorded in the locator
+        timing table.
+
         Args:
             locator: Tuple of (By, value)
             timeout: Maximum wait time
@@ -356,9 +519,10 @@ class BasePage:
         Returns:
             bool: True if element appeared, False otherwise
         """
+        record = timeout is None
         timeout = timeout or Config.EXPLICIT_WAIT
         try:
-            wait_for_element(self.driver, locator, timeout)
+            wait_for_element(self.driver, locator, timeout, record=record)
             logger.info(f"Element appeared: {locator}")
             return True
         except TimeoutException:
@@ -387,48 +551,174 @@ class BasePage:
             logger.warning(f"Element did not disappear within {timeout}s: {locator}")
             return False
 
-    def wait_for_page_load(self, timeout: int = None):
+    def wait_for_absence(self, locator: Tuple[str, str], quiet_ms: int = None, timeout: float = None,
+                         record_saving: bool = True) -> bool:
         """
-        Wait for page to fully load
+        Assert-style wait for an element that should not appear (e.g. after submitting)
+
+        Returns as soon as nothing visible matches and the page has been quiet
+        for quiet_ms, instead of waiting out the whole timeout.
 
         Args:
-            timeout: Maximum wait time
+            locator: Tuple of (By, value)
+            quiet_ms: DOM quiet period in milliseconds (defaults to Config.ABSENCE_QUIET_MS)
+            timeout: Maximum wait time in seconds (defaults to Config.ABSENCE_TIMEOUT)
+            record_saving: Count the time left as saved (False where the check did not replace a full wait)
+
+        Returns:
+            bool: True if the element did not appear, False if it did
         """
-        timeout = timeout or Config.PAGE_LOAD_TIMEOUT
+        if is_snapshot_mode(self.driver):
+            # A snapshot never changes, one look decides
+            return not any(element.is_displayed() for element in self.driver.find_elements(*locator))
+
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script('return document.readyState') == 'complete'
-            )
-            logger.debug("Page loaded successfully")
-        except TimeoutException:
-            logger.warning(f"Page did not load within {timeout}s")
+            result = wait_for_absence(self.driver, locator, quiet_ms, timeout, record_saving)
+        except Exception as e:
+            logger.error(f"Failed to wait for absence of {locator}: {str(e)}")
+            return not self.is_element_displayed(locator)
+
+        if result['absent']:
+            logger.info(f"Element did not appear: {locator} (checked in {result['elapsed']:.2f}s)")
+        else:
+            logger.warning(f"Element appeared after {result['elapsed']:.2f}s: {locator}")
+        return result['absent']
+
+    def wait_for_first(
+        self,
+        outcomes: Dict[str, Union[Tuple[str, str], Callable]],
+        timeout: float = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait for whichever of several competing outcomes happens first (e.g. success vs error)
+
+        Args:
+            outcomes: Outcome name -> locator (visible element) or callable taking the driver
+            timeout: Maximum wait time for all outcomes together
+
+        Returns:
+            dict: 'outcome', 'value' and 'elapsed' seconds, or None if none happened
+        """
+        result = wait_for_first(self.driver, outcomes, timeout)
+        if result:
+            logger.info(f"Outcome '{result['outcome']}' after {result['elapsed']:.2f}s")
+        return result
+
+    def wait_for_animations(self, locator: Tuple[str, str] = None, timeout: int = None) -> bool:
+        """
+        Wait for CSS animations and transitions to finish
+
+        Args:
+            locator: Tuple of (By, value) for the subtree to watch (whole page if None)
+            timeout: Maximum wait time
+
+        Returns:
+            bool: True if animations settled, False otherwise
+        """
+        if is_snapshot_mode(self.driver):
+            return True
+
+        element = None
+        if locator:
+            element = self.find_element(locator)
+            if not element:
+                return False
+        return wait_for_animations(self.driver, element, timeout)
+
+    def arm_dom_change(
+        self,
+        locator: Tuple[str, str] = None,
+        mutation_types: tuple = DOM_MUTATION_TYPES,
+        match: Tuple[str, str] = None
+    ) -> Optional[str]:
+        """
+        Start watching a locator's subtree for DOM changes (call before the triggering action)
+
+        Args:
+            locator: Tuple of (By, value) for the subtree to watch (whole page if None)
+            mutation_types: Any of 'childList', 'characterData' and 'attributes'
+            match: Optional locator (ID, CSS or class name), only mutations on/inside
+                matching elements count, so the watched element need not exist yet
+
+        Returns:
+            str: Watch token for wait_for_dom_change(), or None if it could not be armed
+        """
+        element = None
+        if locator:
+            element = self.find_element(locator)
+            if not element:
+                return None
+
+        css = None
+        if match:
+            by, value = match
+            css = {By.ID: f"#{value}", By.CSS_SELECTOR: value, By.CLASS_NAME: f".{value}"}.get(by)
+            if css is None:
+                logger.error(f"Cannot watch DOM changes by {by}: {match}")
+                return None
+
+        return arm_dom_change(self.driver, element, mutation_types, css)
+
+    def wait_for_dom_change(self, token: str, timeout: float = None) -> Optional[dict]:
+        """
+        Wait for the first DOM change seen by an armed watch
+
+        Args:
+            token: Token returned by arm_dom_change()
+            timeout: Maximum wait time
+
+        Returns:
+            dict: Mutation 'type' and 'elapsed_ms' since arming, or None if nothing changed
+        """
+        return wait_for_dom_change(self.driver, token, timeout)
+
+    def wait_for_page_load(self, timeout: int = None, previous_origin: float = None, contract: bool = False):
+        """
+        Wait for page to be ready
+
+        With contract=True a page object with READY_WHEN is ready as soon as
+        the contract holds (plus network idle if PAGE_READINESS asks for it),
+        otherwise PAGE_READINESS decides.
+
+        Args:
+            timeout: Maximum wait time
+            previous_origin: Navigation start of the document left, if navigating
+            contract: Use the READY_WHEN contract (the browser is on this page object's URL)
+        """
+        if is_snapshot_mode(self.driver):
+            return
+
+        if not (contract and self.READY_WHEN):
+            wait_for_page_load(self.driver, timeout, self.PAGE_READINESS, previous_origin)
+            return
+
+        wait_for_ready_contract(self.driver, self.READY_WHEN, timeout, previous_origin)
+        if (self.PAGE_READINESS or Config.PAGE_READINESS) == 'network_idle':
+            wait_for_page_load(self.driver, timeout, 'network_idle')
 
     # ============================================
     # Scroll Methods
     # ============================================
 
-    def scroll_to_element_locator(self, locator: Tuple[str, str]):
+    def scroll_to_element_locator(self, locator: Tuple[str, str], smooth: bool = None):
         """
         Scroll to an element by locator
 
         Args:
             locator: Tuple of (By, value)
+            smooth: Use smooth scrolling (defaults to Config.SMOOTH_SCROLL)
         """
         element = self.find_element(locator)
         if element:
-            scroll_to_element(self.driver, element)
+            scroll_to_element(self.driver, element, smooth)
 
-    def scroll_to_top(self):
+    def scroll_to_top(self, smooth: bool = None):
         """Scroll to top of page"""
-        self.driver.execute_script("window.scrollTo(0, 0);")
-        logger.debug("Scrolled to top")
-        time.sleep(0.3)
+        scroll_to_top(self.driver, smooth)
 
-    def scroll_to_bottom(self):
+    def scroll_to_bottom(self, smooth: bool = None):
         """Scroll to bottom of page"""
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        logger.debug("Scrolled to bottom")
-        time.sleep(0.3)
+        scroll_to_bottom(self.driver, smooth)
 
     # ============================================
     # Screenshot Methods
@@ -446,6 +736,28 @@ class BasePage:
         """
         return take_screenshot(self.driver, name)
 
+    # ============================================
+    # DOM Snapshot Methods
+    # ============================================
+
+    def snapshot(self, fresh: bool = False) -> DomSnapshot:
+        """
+        Get a read-only snapshot of the current page for local queries
+
+        The snapshot is shared by all page objects of this driver and dropped on
+        navigation, interaction or any DOM mutation. Scenarios served from the
+        snapshot cache get the cached page.
+
+        Args:
+            fresh: Always capture a new snapshot
+
+        Returns:
+            DomSnapshot: Snapshot of the current page
+        """
+        if is_snapshot_mode(self.driver):
+            return self.driver.snapshot
+        return get_snapshot(self.driver, fresh)
+
     # ============================================
     # JavaScript Methods
     # ============================================
@@ -462,7 +774,10 @@ class BasePage:
             Any: Result of script execution
         """
         try:
+            invalidate_snapshot(self.driver)
             result = self.driver.execute_script(script, *args)
+            # The script may have changed the page without firing events
+            mark_dirty(self.driver)
             logger.debug(f"Executed JavaScript: {script[:50]}...")
             return result
         except Exception as e:
@@ -3,6 +3,7 @@ Contact Page Object for Faberwork Test Automation
 www.faberwork.com/contact page elements and interactions
 """
 
+from typing import Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from loguru import logger
@@ -33,7 +34,8 @@ class ContactPage(BasePage):
     FORM_SUBMIT = (By.CSS_SELECTOR, "#consultationForm button[type='submit']")
 
     # Form Messages
-    SUCCESS_MESSAGE = (By.CSS_SELECTOR, ".toast.text-bg-success, #alert-container .toast")
+    SUCCESS_MESSAGE = (By.CSS_SELECTOR,
+                       ".toast.text-bg-success, #alert-container .toast:not(.text-bg-danger):not(.text-bg-warning)")
     ERROR_MESSAGE = (By.CSS_SELECTOR, ".toast.text-bg-warning, .toast.text-bg-danger")
     VALIDATION_ERRORS = (By.CSS_SELECTOR, ".invalid-feedback, .error")
 
@@ -47,6 +49,11 @@ class ContactPage(BasePage):
     # Map
     MAP_SECTION = (By.CSS_SELECTOR, ".map, #map, iframe[src*='maps']")
 
+    # ============================================
+    # Readiness Contract
+    # ============================================
+    READY_WHEN = (PAGE_TITLE,)
+
     def __init__(self, driver: WebDriver):
         """Initialize ContactPage"""
         super().__init__(driver)
@@ -111,6 +118,24 @@ class ContactPage(BasePage):
         """Check if error message is displayed"""
         return self.wait_for_element_to_appear(self.ERROR_MESSAGE, timeout=3)
 
+    def wait_for_form_outcome(self, timeout: int = 5) -> Optional[str]:
+        """
+        Wait for the first response to a form submission
+
+        Args:
+            timeout: Maximum wait time for any response
+
+        Returns:
+            str: 'success', 'error' or 'validation', or None if nothing appeared
+        """
+        # Error toasts first: they share the toast container with success ones
+        result = self.wait_for_first({
+            'error': self.ERROR_MESSAGE,
+            'success': self.SUCCESS_MESSAGE,
+            'validation': self.VALIDATION_ERRORS,
+        }, timeout)
+        return result['outcome'] if result else None
+
     def get_success_message_text(self) -> str:
         """Get the success message text"""
         return self.get_text(self.SUCCESS_MESSAGE)
@@ -3,12 +3,34 @@ Home Page Object for Faberwork Test Automation
 www.faberwork.com homepage elements and interactions
 """
 
+from typing import Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from loguru import logger
 
 from .base_page import BasePage
 from utils.config import Config
+from utils.helpers import wait_for_animations, wait_for_element_visibility
+
+
+# Fingerprint of the carousel position: indexes of the items inside the
+# viewport plus the active indicator dot
+_CAROUSEL_POSITION_SCRIPT = """
+var root = arguments[0], rootRect = root.getBoundingClientRect();
+var visible = [];
+root.querySelectorAll(arguments[1]).forEach(function (item, index) {
+    var rect = item.getBoundingClientRect(), style = window.getComputedStyle(item);
+    if (style.display !== 'none' && style.visibility !== 'hidden' && parseFloat(style.opacity) > 0 &&
+        rect.width > 0 && rect.right > rootRect.left + 1 && rect.left < rootRect.right - 1) {
+        visible.push(index);
+    }
+});
+var dots = document.getElementById(arguments[2]);
+var activeDot = dots ? Array.prototype.indexOf.call(dots.children, dots.querySelector('.active')) : -1;
+return visible.join(',') + '|' + activeDot;
+"""
 
 
 class HomePage(BasePage):
@@ -73,7 +95,8 @@ class HomePage(BasePage):
     FORM_SUBMIT = (By.CSS_SELECTOR, "#consultation-form button[type='submit']")
 
     # Form Messages
-    SUCCESS_MESSAGE = (By.CSS_SELECTOR, ".toast.text-bg-success, #alert-container .toast")
+    SUCCESS_MESSAGE = (By.CSS_SELECTOR,
+                       ".toast.text-bg-success, #alert-container .toast:not(.text-bg-danger):not(.text-bg-warning)")
     ERROR_MESSAGE = (By.CSS_SELECTOR, ".toast.text-bg-warning, .toast.text-bg-danger")
     VALIDATION_ERROR = (By.CSS_SELECTOR, ".invalid-feedback, .error")
 
@@ -103,6 +126,11 @@ class HomePage(BasePage):
     SEARCH_RESULTS = (By.ID, "searchResults")
     SEARCH_RESULT_ITEMS = (By.CSS_SELECTOR, "#searchResults .dropdown-item")
 
+    # ============================================
+    # Readiness Contract
+    # ============================================
+    READY_WHEN = (NAV_SERVICES, HERO_SECTION)
+
     def __init__(self, driver: WebDriver):
         """Initialize HomePage"""
         super().__init__(driver)
@@ -206,6 +234,47 @@ class HomePage(BasePage):
         self.click(self.CAROUSEL_PREV)
         logger.info("Clicked carousel prev")
 
+    def wait_for_carousel_to_settle(self) -> bool:
+        """Wait for the carousel slide transition to finish"""
+        return self.wait_for_animations(self.CAROUSEL)
+
+    def wait_for_testimonials_to_settle(self) -> bool:
+        """Wait for the testimonial slider transition to finish"""
+        return self.wait_for_animations(self.TESTIMONIAL_SECTION)
+
+    def get_carousel_position(self) -> str:
+        """
+        Get a fingerprint of the current carousel position
+
+        Returns:
+            str: Visible item indexes and active indicator, changes whenever the carousel moves
+        """
+        carousel = self.find_element(self.CAROUSEL)
+        return self.driver.execute_script(
+            _CAROUSEL_POSITION_SCRIPT, carousel, self.CAROUSEL_ITEMS[1], self.CAROUSEL_DOTS[1]
+        )
+
+    def wait_for_carousel_to_advance(self, from_position: str, timeout: float = None) -> bool:
+        """
+        Wait for the carousel to move away from a previously read position
+
+        Args:
+            from_position: Position returned by get_carousel_position()
+            timeout: Maximum wait time (defaults to one autoplay interval)
+
+        Returns:
+            bool: True if the carousel moved
+        """
+        timeout = timeout or Config.CAROUSEL_AUTOPLAY_INTERVAL
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: self.get_carousel_position() != from_position
+            )
+            return True
+        except TimeoutException:
+            logger.warning(f"Carousel did not move from position {from_position} within {timeout}s")
+            return False
+
     def get_carousel_items_count(self) -> int:
         """Get the number of carousel items"""
         items = self.find_elements(self.CAROUSEL_ITEMS)
@@ -249,10 +318,44 @@ class HomePage(BasePage):
         """Check if success message is displayed"""
         return self.wait_for_element_to_appear(self.SUCCESS_MESSAGE, timeout=5)
 
+    def is_success_message_dismissed(self, clock=None) -> bool:
+        """
+        Check the success toast hides itself after its autohide delay
+
+        Args:
+            clock: VirtualClock to fast-forward the delay with (waits in real time without one)
+
+        Returns:
+            bool: True if the toast disappeared
+        """
+        if clock is not None and clock.advance(Config.TOAST_AUTOHIDE_DELAY):
+            # Second tick runs the hide transition's fallback timer
+            clock.advance(1)
+            return self.wait_for_element_to_disappear(self.SUCCESS_MESSAGE, timeout=2)
+        return self.wait_for_element_to_disappear(self.SUCCESS_MESSAGE, timeout=Config.TOAST_AUTOHIDE_DELAY + 2)
+
     def is_error_message_displayed(self) -> bool:
         """Check if error message is displayed"""
         return self.is_element_displayed(self.ERROR_MESSAGE)
 
+    def wait_for_form_outcome(self, timeout: int = 5) -> Optional[str]:
+        """
+        Wait for the first response to a form submission
+
+        Args:
+            timeout: Maximum wait time for any response
+
+        Returns:
+            str: 'success', 'error' or 'validation', or None if nothing appeared
+        """
+        # Error toasts first: they share the toast container with success ones
+        result = self.wait_for_first({
+            'error': self.ERROR_MESSAGE,
+            'success': self.SUCCESS_MESSAGE,
+            'validation': self.VALIDATION_ERROR,
+        }, timeout)
+        return result['outcome'] if result else None
+
     def get_success_message_text(self) -> str:
         """Get the success message text"""
         return self.get_text(self.SUCCESS_MESSAGE)
@@ -288,6 +391,14 @@ class HomePage(BasePage):
             self.click(self.CHATBOT_OPEN_BUTTON)
             logger.info("Opened chatbot")
 
+    def wait_for_chatbot_dialog_open(self) -> bool:
+        """Wait for the chatbot dialog to be visible and its opening animation to finish"""
+        dialog = wait_for_element_visibility(self.driver, self.CHATBOT_WIDGET)
+        if not dialog:
+            return False
+        wait_for_animations(self.driver, dialog)
+        return True
+
     def send_chatbot_message(self, message: str):
         """
         Send a message in chatbot
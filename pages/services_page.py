@@ -50,6 +50,11 @@ class ServicesPage(BasePage):
     SERVICE_DESCRIPTIONS = (By.CSS_SELECTOR, ".service-description, .description")
     SERVICE_FEATURES = (By.CSS_SELECTOR, ".service-features, .features li")
 
+    # ============================================
+    # Readiness Contract
+    # ============================================
+    READY_WHEN = (PAGE_TITLE,)
+
     def __init__(self, driver: WebDriver):
         """Initialize ServicesPage"""
         super().__init__(driver)
@@ -21,6 +21,11 @@ PROJECT_ROOT = Path(__file__).parent
 FEATURES_DIR = PROJECT_ROOT / "features"
 REPORTS_DIR = PROJECT_ROOT / "reports"
 PARALLEL_RESULTS_DIR = REPORTS_DIR / "parallel-results"
+ASSET_CACHE_STATS_DIR = PROJECT_ROOT / os.getenv("ASSET_CACHE_STATS_DIR", "reports/asset_cache")
+WARMUP_STATS_DIR = PROJECT_ROOT / os.getenv("WARMUP_STATS_DIR", "reports/warmup")
+
+# Warm-up seconds of this worker process, handed to its first behave run
+_worker_warmup_seconds = 0.0
 
 
 def print_banner(message):
@@ -48,8 +53,31 @@ def get_all_feature_files(tag=None):
     return feature_files
 
 
+def warm_up_worker():
+    """
+    Warm up once per worker process, before its first feature file
+
+    Only the browser stage is run: DNS and HTTP warm-up would warm this
+    process, not the behave runs it starts, while the browser load fills the
+    driver binary, CDN and (with --asset-cache) asset caches they share.
+    """
+    global _worker_warmup_seconds
+    from utils.warmup import warm_up
+
+    timings = warm_up(browser=True, network=False)
+    _worker_warmup_seconds = timings['total']
+    print(f"[Worker {os.getpid()}] Warm-up completed in {timings['total']:.2f}s")
+
+    WARMUP_STATS_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        (WARMUP_STATS_DIR / f"{os.getpid()}.json").write_text(json.dumps(timings), encoding='utf-8')
+    except OSError as e:
+        print(f"Warning: Could not write warm-up timings: {e}")
+
+
 def run_feature_file(args):
     """Run a single feature file"""
+    global _worker_warmup_seconds
     feature_file, worker_id, output_format = args
 
     feature_name = feature_file.stem
@@ -81,12 +109,17 @@ def run_feature_file(args):
             "-o", str(allure_output)
         ])
 
+    # The first behave run of a worker records the worker's warm-up (in suite_timings)
+    env = dict(os.environ, WARMUP_SECONDS=str(_worker_warmup_seconds))
+    _worker_warmup_seconds = 0.0
+
     # Run the test
     start_time = datetime.now()
     try:
         result = subprocess.run(
             cmd,
             cwd=PROJECT_ROOT,
+            env=env,
             capture_output=True,
             text=True,
             timeout=900  # 15 minute timeout per feature (increased for stability)
@@ -202,6 +235,43 @@ def calculate_statistics(results):
     return stats
 
 
+def aggregate_asset_cache_stats():
+    """Sum the asset cache statistics written by every worker process"""
+    totals = {'requests': 0, 'hits': 0, 'revalidated': 0, 'misses': 0, 'stored': 0, 'bytes_saved': 0}
+
+    for stats_file in ASSET_CACHE_STATS_DIR.glob("*.json"):
+        try:
+            with open(stats_file, 'r') as f:
+                worker_stats = json.load(f)
+        except Exception as e:
+            print(f"Warning: Could not read {stats_file}: {e}")
+            continue
+        for key in totals:
+            totals[key] += worker_stats.get(key, 0)
+
+    served = totals['hits'] + totals['revalidated']
+    totals['hit_ratio'] = served / totals['requests'] if totals['requests'] else 0
+    return totals
+
+
+def aggregate_warmup_stats():
+    """Sum the warm-up timings written by every worker process"""
+    totals = {'workers': 0, 'total': 0.0, 'max': 0.0}
+
+    for stats_file in WARMUP_STATS_DIR.glob("*.json"):
+        try:
+            with open(stats_file, 'r') as f:
+                timings = json.load(f)
+        except Exception as e:
+            print(f"Warning: Could not read {stats_file}: {e}")
+            continue
+        totals['workers'] += 1
+        totals['total'] += timings.get('total', 0.0)
+        totals['max'] = max(totals['max'], timings.get('total', 0.0))
+
+    return totals
+
+
 def print_results(results, stats):
     """Print execution results"""
     print_banner("Parallel Execution Results")
@@ -216,6 +286,18 @@ def print_results(results, stats):
     print(f"Shortest Feature:   {stats['min_duration']:.2f}s")
     print(f"Average Duration:   {stats['avg_duration']:.2f}s")
 
+    cache = stats.get('asset_cache')
+    if cache:
+        print(f"\nAsset Cache:        {cache['hit_ratio']*100:.1f}% hit ratio "
+              f"({cache['hits'] + cache['revalidated']}/{cache['requests']} requests, "
+              f"{cache['revalidated']} revalidated)")
+        print(f"Bytes Saved:        {cache['bytes_saved']/1024/1024:.1f} MB")
+
+    warmup = stats.get('warmup')
+    if warmup:
+        print(f"\nWarm-up:            {warmup['total']:.2f}s over {warmup['workers']} worker(s), "
+              f"longest {warmup['max']:.2f}s (not included in the durations above)")
+
     # Print failed features
     failed = [r for r in results if not r['success']]
     if failed:
@@ -257,6 +339,13 @@ def main():
                        help="Clean previous results before running")
     parser.add_argument("--generate-report", action="store_true",
                        help="Generate HTML report after tests")
+    parser.add_argument("--schedule", type=str, default="file",
+                       choices=["file", "state"],
+                       help="Scenario order: file order, or grouped by starting state (default: file)")
+    parser.add_argument("--warmup", action="store_true",
+                       help="Warm up DNS/connections/browser once in every worker before its first feature")
+    parser.add_argument("--asset-cache", action="store_true",
+                       help="Share one on-disk cache of static assets between all workers")
 
     args = parser.parse_args()
 
@@ -272,6 +361,12 @@ def main():
     print(f"Output Format:       {args.format}")
     if args.tag:
         print(f"Tag Filter:          @{args.tag}")
+    if args.schedule != "file":
+        print(f"Schedule:            {args.schedule}")
+    if args.warmup:
+        print("Warm-up:             enabled")
+    if args.asset_cache:
+        print("Asset Cache:         enabled")
     print()
 
     # Clean previous results
@@ -281,6 +376,18 @@ def main():
 
     PARALLEL_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Workers inherit the environment; their statistics start from zero every run.
+    # With --warmup each worker warms up once, not every behave run it starts.
+    if args.warmup:
+        os.environ["WARMUP"] = "false"
+        if WARMUP_STATS_DIR.exists():
+            shutil.rmtree(WARMUP_STATS_DIR)
+    os.environ["SCENARIO_SCHEDULE"] = args.schedule
+    if args.asset_cache:
+        os.environ["ASSET_CACHE"] = "true"
+        if ASSET_CACHE_STATS_DIR.exists():
+            shutil.rmtree(ASSET_CACHE_STATS_DIR)
+
     # Get feature files
     feature_files = get_all_feature_files(args.tag)
 
@@ -292,6 +399,15 @@ def main():
 
     print(f"Found {len(feature_files)} feature files to run\n")
 
+    # Submit features starting from the same state together; workers reorder scenarios
+    schedule_savings = None
+    if args.schedule == "state":
+        from utils.scenario_scheduler import schedule_feature_files, estimate_schedule_savings
+        feature_files = schedule_feature_files(feature_files)
+        schedule_savings = estimate_schedule_savings(feature_files)
+        print(f"Scenario schedule: {schedule_savings['transitions_before']} -> "
+              f"{schedule_savings['transitions_after']} starting state changes within features\n")
+
     # Prepare tasks
     tasks = [
         (feature_file, i % workers, args.format)
@@ -305,7 +421,8 @@ def main():
     start_time = datetime.now()
     results = []
 
-    with ProcessPoolExecutor(max_workers=workers) as executor:
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=warm_up_worker if args.warmup else None) as executor:
         futures = {executor.submit(run_feature_file, task): task for task in tasks}
 
         for future in as_completed(futures):
@@ -326,6 +443,12 @@ def main():
     stats = calculate_statistics(results)
     stats['parallel_duration'] = total_duration
     stats['speedup'] = stats['total_duration'] / total_duration if total_duration > 0 else 1
+    if args.asset_cache:
+        stats['asset_cache'] = aggregate_asset_cache_stats()
+    if args.warmup:
+        stats['warmup'] = aggregate_warmup_stats()
+    if schedule_savings:
+        stats['schedule'] = schedule_savings
 
     print(f"\nSpeedup: {stats['speedup']:.2f}x faster than sequential")
     print(f"(Sequential would take: {stats['total_duration']/60:.2f}m)")
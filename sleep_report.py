@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Fixed-Sleep Report for Faberwork Test Automation
+Statically lists the remaining time.sleep() calls and estimates the
+wall-clock seconds they cost per full run of the feature files
+"""
+
+import ast
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Project directories
+PROJECT_ROOT = Path(__file__).parent
+FEATURES_DIR = PROJECT_ROOT / "features"
+STEPS_DIR = FEATURES_DIR / "steps"
+SCANNED_DIRS = [STEPS_DIR, PROJECT_ROOT / "pages", PROJECT_ROOT / "utils"]
+
+# Scenarios excluded by behave.ini default_tags
+EXCLUDED_TAGS = {'wip', 'skip'}
+
+
+def find_sleep_calls(path):
+    """
+    Find time.sleep() calls in a Python file
+
+    Args:
+        path: Path to the Python file
+
+    Returns:
+        list: One dict per call with line, function name and seconds (None if not a constant)
+    """
+    tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+    calls = []
+
+    def visit(node, function_name):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                visit(child, child.name)
+                continue
+
+            if isinstance(child, ast.Call):
+                func = child.func
+                is_sleep = (
+                    (isinstance(func, ast.Attribute) and func.attr == 'sleep'
+                     and isinstance(func.value, ast.Name) and func.value.id == 'time')
+                    or (isinstance(func, ast.Name) and func.id == 'sleep')
+                )
+                if is_sleep:
+                    seconds = None
+                    if child.args and isinstance(child.args[0], ast.Constant):
+                        seconds = float(child.args[0].value)
+                    calls.append({
+                        'file': str(path.relative_to(PROJECT_ROOT)),
+                        'line': child.lineno,
+                        'function': function_name,
+                        'seconds': seconds,
+                    })
+
+            visit(child, function_name)
+
+    visit(tree, '<module>')
+    return calls
+
+
+def count_step_invocations():
+    """
+    Count how often each step function runs in a full run of the feature files
+
+    Scenario Outline rows and Background steps are expanded, matching is done
+    with behave's own step registry so the attribution matches a real run.
+
+    Returns:
+        Counter: (file, function name) -> number of invocations
+    """
+    from behave.parser import parse_file
+    from behave.runner_util import load_step_modules
+    from behave.step_registry import registry
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    load_step_modules([str(STEPS_DIR)])
+
+    invocations = Counter()
+    for feature_file in sorted(FEATURES_DIR.glob("*.feature")):
+        feature = parse_file(str(feature_file))
+        if not feature or EXCLUDED_TAGS & set(feature.tags):
+            continue
+
+        for scenario in feature.walk_scenarios():
+            if EXCLUDED_TAGS & set(scenario.effective_tags):
+                continue
+            for step in scenario.all_steps:
+                match = registry.find_match(step)
+                if match is None:
+                    continue
+                code = match.func.__code__
+                source = Path(code.co_filename).resolve().relative_to(PROJECT_ROOT.resolve())
+                invocations[(str(source), match.func.__name__)] += 1
+
+    return invocations
+
+
+def build_report():
+    """
+    Build the sleep report
+
+    Returns:
+        dict: Report with per-call entries and totals
+    """
+    calls = []
+    for directory in SCANNED_DIRS:
+        for path in sorted(directory.glob("*.py")):
+            calls.extend(find_sleep_calls(path))
+
+    invocations = count_step_invocations()
+
+    for call in calls:
+        runs = invocations.get((call['file'], call['function']))
+        call['runs_per_suite'] = runs
+        if runs is not None and call['seconds'] is not None:
+            call['seconds_per_suite'] = call['seconds'] * runs
+        else:
+            call['seconds_per_suite'] = None
+
+    per_file = Counter()
+    for call in calls:
+        per_file[call['file']] += call['seconds_per_suite'] or 0
+
+    return {
+        'total_calls': len(calls),
+        'total_seconds_per_suite': sum(call['seconds_per_suite'] or 0 for call in calls),
+        'seconds_per_file': dict(per_file.most_common()),
+        'calls': sorted(calls, key=lambda c: c['seconds_per_suite'] or 0, reverse=True),
+    }
+
+
+def print_report(report):
+    """Print the sleep report as a table"""
+    width = 80
+    print("\n" + "=" * width)
+    print("  Fixed Sleep Report")
+    print("=" * width + "\n")
+
+    print(f"{'Location':<52}{'Sleep':>8}{'Runs':>7}{'Cost':>10}")
+    print("-" * width)
+    for call in report['calls']:
+        location = f"{call['file']}:{call['line']} {call['function']}"
+        seconds = f"{call['seconds']:.1f}s" if call['seconds'] is not None else "?"
+        runs = str(call['runs_per_suite']) if call['runs_per_suite'] is not None else "-"
+        cost = f"{call['seconds_per_suite']:.1f}s" if call['seconds_per_suite'] is not None else "per call"
+        print(f"{location[:51]:<52}{seconds:>8}{runs:>7}{cost:>10}")
+
+    print("\n" + "-" * width)
+    for file_name, seconds in report['seconds_per_file'].items():
+        print(f"{file_name:<62}{seconds:>10.1f}s")
+
+    total = report['total_seconds_per_suite']
+    print("-" * width)
+    print(f"Remaining time.sleep calls: {report['total_calls']}")
+    print(f"Fixed sleep cost per run:   {total:.1f}s ({total / 60:.1f}m)")
+
+
+def main():
+    """Main execution"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Report remaining fixed sleeps and their cost per run")
+    parser.add_argument("--json", type=str, default=None,
+                        help="Also write the report to this JSON file")
+
+    args = parser.parse_args()
+
+    report = build_report()
+    print_report(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+Shared Asset Cache for Faberwork Test Automation
+On-disk HTTP cache for static assets (JS, CSS, fonts, images) shared by every
+browser and every parallel worker, so bundles are downloaded once per run
+instead of once per scenario
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Optional, Dict, Any
+from loguru import logger
+
+from .config import Config
+
+
+# Headers describing the original connection, not the cached response
+_HOP_BY_HOP_HEADERS = {'connection', 'keep-alive', 'transfer-encoding', 'content-length',
+                       'proxy-authenticate', 'proxy-connection', 'upgrade'}
+
+# Marks responses served from the cache so the response interceptor does not store them again
+_CACHE_HEADER = 'X-Asset-Cache'
+
+
+def _header(headers, name: str) -> str:
+    """Get a header value (case-insensitive), empty string if missing"""
+    for key, value in headers.items():
+        if key.lower() == name.lower():
+            return value
+    return ''
+
+
+def _http_date(value: str) -> Optional[float]:
+    """Parse an HTTP date header into a timestamp"""
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers) -> Optional[float]:
+    """
+    Get how long a response may be served without revalidation
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        float: Lifetime in seconds (0 = always revalidate), or None if the response must not be stored
+    """
+    cache_control = _header(headers, 'Cache-Control').lower()
+    if 'no-store' in cache_control or 'private' in cache_control:
+        return None
+    if 'no-cache' in cache_control:
+        return 0.0
+
+    for directive in ('s-maxage', 'max-age'):
+        match = re.search(rf'{directive}\s*=\s*"?(\d+)', cache_control)
+        if match:
+            return float(match.group(1))
+
+    expires = _http_date(_header(headers, 'Expires'))
+    if expires is not None:
+        date = _http_date(_header(headers, 'Date')) or time.time()
+        return max(0.0, expires - date)
+
+    # Heuristic freshness (RFC 9111 4.2.2): 10% of the time since the last modification
+    last_modified = _http_date(_header(headers, 'Last-Modified'))
+    if last_modified is not None:
+        date = _http_date(_header(headers, 'Date')) or time.time()
+        return max(0.0, (date - last_modified) / 10)
+
+    # No freshness information, keep it only if it can be revalidated
+    return 0.0 if _header(headers, 'ETag') else None
+
+
+class AssetCache:
+    """
+    Shared HTTP cache on top of selenium-wire request/response interceptors
+
+    Fresh entries are answered by the request interceptor without leaving the
+    machine. Stale entries with a validator are revalidated with a conditional
+    request and a 304 is expanded back into the cached 200. Entries are one
+    file pair per URL (<sha1>.json + <sha1>.body), written atomically, so all
+    parallel workers read and fill the same directory.
+    """
+
+    def __init__(self, directory: Path = None):
+        """
+        Initialize the cache
+
+        Args:
+            directory: Cache directory (defaults to Config.ASSET_CACHE_DIR)
+        """
+        self.directory = Path(directory or Config.ASSET_CACHE_DIR)
+        self.stats = {'requests': 0, 'hits': 0, 'revalidated': 0, 'misses': 0, 'stored': 0, 'bytes_saved': 0}
+        self._asset_pattern = re.compile(Config.ASSET_CACHE_PATTERN, re.IGNORECASE)
+        self._revalidating: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    # ============================================
+    # Driver Wiring
+    # ============================================
+
+    def attach(self, driver) -> bool:
+        """
+        Install the cache interceptors on a selenium-wire driver
+
+        Interceptors already installed on the driver (e.g. HTTP archive
+        recording) still see every request and response.
+
+        Args:
+            driver: selenium-wire WebDriver instance (see DriverFactory)
+
+        Returns:
+            bool: True if the cache is active
+        """
+        if not hasattr(driver, 'request_interceptor'):
+            logger.warning("Asset cache needs a selenium-wire driver - assets are downloaded")
+            return False
+
+        previous_request = driver.request_interceptor
+        previous_response = driver.response_interceptor
+
+        def intercept_request(request):
+            self._serve(request)
+            if request.response is None and previous_request is not None:
+                previous_request(request)
+
+        def intercept_response(request, response):
+            if previous_response is not None:
+                previous_response(request, response)
+            self._store(request, response)
+
+        driver.request_interceptor = intercept_request
+        driver.response_interceptor = intercept_response
+        logger.debug(f"Asset cache: {self.directory}")
+        return True
+
+    def is_cacheable(self, method: str, url: str) -> bool:
+        """
+        Check if a request is a static asset request the cache handles
+
+        Args:
+            method: HTTP method
+            url: Request URL
+
+        Returns:
+            bool: True for GET requests matching ASSET_CACHE_PATTERN
+        """
+        return method.upper() == 'GET' and bool(self._asset_pattern.search(url.split('?', 1)[0]))
+
+    # ============================================
+    # Storage
+    # ============================================
+
+    def _entry_path(self, url: str) -> Path:
+        """Path of an entry's metadata file (the body file uses the .body suffix)"""
+        return self.directory / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def _write_entry(self, url: str, entry: Dict[str, Any], body: bytes = None):
+        """Atomically write an entry (and its body, unless only the metadata changed)"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        meta_path = self._entry_path(url)
+        files = [(meta_path, json.dumps(entry, indent=2).encode('utf-8'))]
+        if body is not None:
+            files.insert(0, (meta_path.with_suffix('.body'), body))
+        for path, data in files:
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+
+    def _read_entry(self, url: str) -> Optional[tuple]:
+        """Read an entry and its body, None if the URL is not cached"""
+        meta_path = self._entry_path(url)
+        try:
+            entry = json.loads(meta_path.read_text(encoding='utf-8'))
+            return entry, meta_path.with_suffix('.body').read_bytes()
+        except (FileNotFoundError, ValueError):
+            return None
+
+    # ============================================
+    # Interceptors
+    # ============================================
+
+    def _serve(self, request):
+        """Request interceptor: answer fresh entries, make stale ones conditional"""
+        if not self.is_cacheable(request.method, request.url):
+            return
+
+        with self._lock:
+            self.stats['requests'] += 1
+
+        cached = self._read_entry(request.url)
+        if cached is None:
+            with self._lock:
+                self.stats['misses'] += 1
+            return
+
+        entry, body = cached
+        if time.time() < entry['stored_at'] + entry['lifetime']:
+            self._respond(request, entry, body)
+            with self._lock:
+                self.stats['hits'] += 1
+                self.stats['bytes_saved'] += len(body)
+            return
+
+        validators = {'If-None-Match': entry.get('etag'), 'If-Modified-Since': entry.get('last_modified')}
+        validators = {name: value for name, value in validators.items() if value}
+        # The browser's own conditional request expects its own 304, leave it alone
+        browser_conditional = any(_header(request.headers, name) for name in validators)
+        if not validators or browser_conditional:
+            with self._lock:
+                self.stats['misses'] += 1
+            return
+
+        for name, value in validators.items():
+            request.headers[name] = value
+        with self._lock:
+            self._revalidating[request.url] = entry
+
+    def _respond(self, request, entry: Dict[str, Any], body: bytes):
+        """Answer a request from a cache entry"""
+        headers = [(name, value) for name, value in entry['headers']]
+        headers += [('Content-Length', str(len(body))), (_CACHE_HEADER, 'hit')]
+        request.create_response(status_code=entry['status'], headers=headers, body=body)
+
+    def _store(self, request, response):
+        """Response interceptor: store cacheable responses, expand revalidated 304s"""
+        if _header(response.headers, _CACHE_HEADER) or not self.is_cacheable(request.method, request.url):
+            return
+
+        with self._lock:
+            revalidated = self._revalidating.pop(request.url, None)
+
+        if revalidated is not None and response.status_code == 304:
+            cached = self._read_entry(request.url)
+            if cached is not None:
+                entry, body = cached
+                entry['stored_at'] = time.time()
+                lifetime = freshness_lifetime(response.headers)
+                if lifetime is not None:
+                    entry['lifetime'] = lifetime
+                try:
+                    self._write_entry(request.url, entry)
+                except Exception as e:
+                    logger.error(f"Failed to refresh cached {request.url}: {str(e)}")
+
+                response.status_code = entry['status']
+                response.reason = entry['reason']
+                del response.headers['Content-Length']
+                for name, value in entry['headers']:
+                    if name not in response.headers:
+                        response.headers[name] = value
+                response.headers['Content-Length'] = str(len(body))
+                response.body = body
+                with self._lock:
+                    self.stats['revalidated'] += 1
+                    self.stats['bytes_saved'] += len(body)
+                return
+
+        if revalidated is not None:
+            with self._lock:
+                self.stats['misses'] += 1
+
+        if response.status_code != 200:
+            return
+
+        lifetime = freshness_lifetime(response.headers)
+        if lifetime is None or (lifetime == 0 and not (_header(response.headers, 'ETag')
+                                                        or _header(response.headers, 'Last-Modified'))):
+            return
+
+        entry = {
+            'url': request.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': [[name, value] for name, value in response.headers.items()
+                        if name.lower() not in _HOP_BY_HOP_HEADERS],
+            'etag': _header(response.headers, 'ETag') or None,
+            'last_modified': _header(response.headers, 'Last-Modified') or None,
+            'stored_at': time.time(),
+            'lifetime': lifetime,
+        }
+        try:
+            self._write_entry(request.url, entry, response.body)
+        except Exception as e:
+            logger.error(f"Failed to cache {request.url}: {str(e)}")
+            return
+
+        with self._lock:
+            self.stats['stored'] += 1
+
+    # ============================================
+    # Reporting
+    # ============================================
+
+    def write_stats(self) -> Dict[str, int]:
+        """
+        Log this process's cache statistics and write them for the parallel runner
+
+        Returns:
+            dict: Cache statistics
+        """
+        with self._lock:
+            stats = dict(self.stats)
+
+        if not stats['requests']:
+            return stats
+
+        served = stats['hits'] + stats['revalidated']
+        logger.info(f"Asset cache: {served}/{stats['requests']} served from cache "
+                    f"({served / stats['requests'] * 100:.1f}%), "
+                    f"{stats['bytes_saved'] / 1024 / 1024:.1f} MB saved")
+
+        stats_path = Config.ASSET_CACHE_STATS_DIR / f"{os.getpid()}.json"
+        try:
+            stats_path.parent.mkdir(parents=True, exist_ok=True)
+            stats_path.write_text(json.dumps(stats), encoding='utf-8')
+        except Exception as e:
+            logger.error(f"Failed to write asset cache statistics: {str(e)}")
+        return stats
+
+
+_cache = None
+
+
+def get_asset_cache() -> AssetCache:
+    """
+    Get the process-wide asset cache (statistics cover every scenario of the process)
+
+    Returns:
+        AssetCache: Asset cache
+    """
+    global _cache
+    if _cache is None:
+        _cache = AssetCache()
+    return _cache
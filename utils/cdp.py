@@ -0,0 +1,167 @@
+"""
+Chrome DevTools Protocol helpers for Faberwork Test Automation
+Thin wrappers around execute_cdp_cmd for Chromium-based drivers (Chrome, Edge)
+"""
+
+import json
+from typing import Optional, Dict, Any, Callable, List
+from weakref import WeakKeyDictionary, ref
+from loguru import logger
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+def supports_cdp(driver: WebDriver) -> bool:
+    """
+    Check if the driver can send Chrome DevTools Protocol commands
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        bool: True for local Chromium drivers, False for Firefox and Remote drivers
+    """
+    return hasattr(driver, 'execute_cdp_cmd')
+
+
+def execute_cdp(driver: WebDriver, command: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    """
+    Execute a Chrome DevTools Protocol command
+
+    Args:
+        driver: WebDriver instance
+        command: CDP method name (e.g. 'Network.enable')
+        params: CDP method parameters
+
+    Returns:
+        dict: CDP result, or None if CDP is unavailable or the command failed
+    """
+    if not supports_cdp(driver):
+        logger.debug(f"CDP not supported by {driver.__class__.__name__}, skipped {command}")
+        return None
+
+    try:
+        return driver.execute_cdp_cmd(command, params or {})
+    except Exception as e:
+        logger.error(f"CDP command {command} failed: {str(e)}")
+        return None
+
+
+def add_script_on_new_document(driver: WebDriver, source: str) -> Optional[str]:
+    """
+    Register a script that runs in every new document before the page's own scripts
+
+    Args:
+        driver: WebDriver instance
+        source: JavaScript source
+
+    Returns:
+        str: Script identifier, or None if it could not be registered
+    """
+    result = execute_cdp(driver, 'Page.addScriptToEvaluateOnNewDocument', {'source': source})
+    return result.get('identifier') if result else None
+
+
+class NetworkEventStream:
+    """
+    CDP Network events read from the Chromium 'performance' log
+
+    execute_cdp_cmd cannot subscribe to CDP events, but chromedriver records
+    them in the performance log (see DriverFactory). Reading the log drains
+    it, so all consumers share one stream per driver via network_events().
+    The stream only keeps a weak reference to its driver, so the per-driver
+    registry entry goes away with the driver.
+    """
+
+    def __init__(self, driver: WebDriver):
+        """
+        Initialize the event stream
+
+        Args:
+            driver: WebDriver instance
+        """
+        self._driver = ref(driver)
+        # None until the first poll tells whether the driver has a performance log
+        self.available = None
+        self._listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+
+    @property
+    def driver(self) -> Optional[WebDriver]:
+        """Driver of the stream, None once it was garbage collected"""
+        return self._driver()
+
+    def subscribe(self, listener: Callable[[str, Dict[str, Any]], None]):
+        """
+        Register a listener called with (method, params) for every Network event
+
+        Args:
+            listener: Callback
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str, Dict[str, Any]], None]):
+        """
+        Remove a listener
+
+        Args:
+            listener: Callback registered with subscribe()
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def poll(self) -> int:
+        """
+        Drain the performance log and dispatch its Network events to the listeners
+
+        Returns:
+            int: Number of Network events dispatched
+        """
+        driver = self.driver
+        if self.available is False or driver is None:
+            return 0
+
+        try:
+            entries = driver.get_log('performance')
+            self.available = True
+        except Exception as e:
+            self.available = False
+            logger.debug(f"Performance log unavailable, network events disabled: {str(e)}")
+            return 0
+
+        dispatched = 0
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            method = message.get('method', '')
+            if not method.startswith('Network.'):
+                continue
+
+            params = message.get('params', {})
+            for listener in list(self._listeners):
+                listener(method, params)
+            dispatched += 1
+
+        return dispatched
+
+
+_network_event_streams = WeakKeyDictionary()
+
+
+def network_events(driver: WebDriver) -> NetworkEventStream:
+    """
+    Get the shared Network event stream of a driver
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        NetworkEventStream: Stream for this driver
+    """
+    stream = _network_event_streams.get(driver)
+    if stream is None:
+        stream = NetworkEventStream(driver)
+        _network_event_streams[driver] = stream
+    return stream
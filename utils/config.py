@@ -44,6 +44,173 @@ class Config:
     PAGE_LOAD_TIMEOUT = int(os.getenv('PAGE_LOAD_TIMEOUT', 30))
     SCRIPT_TIMEOUT = int(os.getenv('SCRIPT_TIMEOUT', 30))
 
+    # ============================================
+    # Page Readiness
+    # ============================================
+    # 'document' (readyState complete) or 'network_idle'; page objects override with PAGE_READINESS
+    PAGE_READINESS = os.getenv('PAGE_READINESS', 'document').lower()
+    # 'normal' waits for the load event, 'eager' for DOMContentLoaded, 'none' returns immediately;
+    # page objects' READY_WHEN contracts decide when the page is usable
+    PAGE_LOAD_STRATEGY = os.getenv('PAGE_LOAD_STRATEGY', 'normal').lower()
+    # Record CDP Network events in the performance log (Chromium only). On by default only with
+    # network_idle readiness; set it when a page object selects network_idle on its own
+    NETWORK_EVENTS = os.getenv('NETWORK_EVENTS', str(PAGE_READINESS == 'network_idle')).lower() == 'true'
+    NETWORK_IDLE_QUIET_MS = int(os.getenv('NETWORK_IDLE_QUIET_MS', 500))
+    NETWORK_IDLE_TIMEOUT = int(os.getenv('NETWORK_IDLE_TIMEOUT', 15))
+    NETWORK_IDLE_MAX_REQUEST_SECONDS = float(os.getenv('NETWORK_IDLE_MAX_REQUEST_SECONDS', 10))
+    # Comma-separated URL regexes: requests that never block readiness / the only requests tracked
+    NETWORK_IDLE_IGNORE = [p.strip() for p in os.getenv(
+        'NETWORK_IDLE_IGNORE',
+        r'google-analytics\.com,googletagmanager\.com,doubleclick\.net,facebook\.(com|net),'
+        r'hotjar\.com,clarity\.ms,hubspot\.com,intercom\.io,tawk\.to,livechatinc\.com'
+    ).split(',') if p.strip()]
+    NETWORK_IDLE_ONLY = [p.strip() for p in os.getenv('NETWORK_IDLE_ONLY', '').split(',') if p.strip()]
+
+    # ============================================
+    # Absence Checks
+    # ============================================
+    # "Should not appear" assertions pass once nothing matches and the DOM has been
+    # quiet for ABSENCE_QUIET_MS, instead of waiting out a full timeout
+    ABSENCE_QUIET_MS = int(os.getenv('ABSENCE_QUIET_MS', 500))
+    ABSENCE_TIMEOUT = int(os.getenv('ABSENCE_TIMEOUT', 5))
+
+    # ============================================
+    # Scrolling
+    # ============================================
+    SMOOTH_SCROLL = os.getenv('SMOOTH_SCROLL', 'False').lower() == 'true'
+    SCROLL_SETTLE_TIMEOUT_MS = int(os.getenv('SCROLL_SETTLE_TIMEOUT_MS', 2000))
+    ANIMATION_SETTLE_TIMEOUT = int(os.getenv('ANIMATION_SETTLE_TIMEOUT', 5))
+
+    # ============================================
+    # Animations
+    # ============================================
+    DISABLE_ANIMATIONS = os.getenv('DISABLE_ANIMATIONS', 'False').lower() == 'true'
+    # Scenarios with any of these tags always keep real animations
+    ANIMATION_TAGS = [tag.strip() for tag in os.getenv('ANIMATION_TAGS', 'carousel,animations').split(',') if tag.strip()]
+    SUITE_TIMINGS_FILE = BASE_DIR / os.getenv('SUITE_TIMINGS_FILE', 'reports/suite_timings.jsonl')
+
+    # ============================================
+    # Resource Blocking
+    # ============================================
+    # Block images, fonts, media and analytics for every scenario not tagged @visual (Chromium only);
+    # @block_resources enables it per scenario
+    BLOCK_RESOURCES = os.getenv('BLOCK_RESOURCES', 'True').lower() == 'true'
+    # Extra comma-separated URL wildcard patterns added to the blocking profile
+    BLOCKED_URL_PATTERNS = [p.strip() for p in os.getenv('BLOCKED_URL_PATTERNS', '').split(',') if p.strip()]
+    # Response sizes learned from unblocked loads, used to estimate bytes saved
+    RESOURCE_SIZES_FILE = BASE_DIR / os.getenv('RESOURCE_SIZES_FILE', 'reports/resource_sizes.json')
+
+    # ============================================
+    # HTTP Archive (Record/Replay)
+    # ============================================
+    # off, record (capture every response) or replay (serve the archive, no live traffic)
+    HTTP_ARCHIVE_MODE = os.getenv('HTTP_ARCHIVE_MODE', 'off').lower()
+    HTTP_ARCHIVE_DIR = BASE_DIR / os.getenv('HTTP_ARCHIVE_DIR', 'http_archive')
+    # Query parameters ignored when matching requests (cache busters)
+    HTTP_ARCHIVE_IGNORE_PARAMS = [p.strip() for p in os.getenv('HTTP_ARCHIVE_IGNORE_PARAMS', '_,cb').split(',') if p.strip()]
+    # Replay answer for requests missing from the archive: 'block' (404) or 'passthrough' (live)
+    HTTP_ARCHIVE_UNMATCHED = os.getenv('HTTP_ARCHIVE_UNMATCHED', 'block').lower()
+    HTTP_ARCHIVE_LATENCY_MS = int(os.getenv('HTTP_ARCHIVE_LATENCY_MS', 0))
+    HTTP_ARCHIVE_REPORT = BASE_DIR / os.getenv('HTTP_ARCHIVE_REPORT', 'reports/http_archive_unmatched.jsonl')
+
+    # ============================================
+    # Navigation Reuse
+    # ============================================
+    # Skip navigate_to when the browser is already on that URL and nothing has
+    # interacted with the page since it was loaded
+    NAVIGATION_REUSE = os.getenv('NAVIGATION_REUSE', 'True').lower() == 'true'
+    # Scenario order within a feature: 'file' or 'state' (group by Background + leading Given steps)
+    SCENARIO_SCHEDULE = os.getenv('SCENARIO_SCHEDULE', 'file').lower()
+
+    # ============================================
+    # Element Cache
+    # ============================================
+    # Reuse element handles page objects resolved (per document) instead of
+    # looking each locator up again; stale handles are resolved again
+    ELEMENT_CACHE = os.getenv('ELEMENT_CACHE', 'True').lower() == 'true'
+    STALE_ELEMENT_RETRIES = int(os.getenv('STALE_ELEMENT_RETRIES', 2))
+
+    # ============================================
+    # Locator Timing
+    # ============================================
+    # How long each waited-for locator took to appear, kept across runs
+    LOCATOR_TIMINGS_FILE = BASE_DIR / os.getenv('LOCATOR_TIMINGS_FILE', 'reports/locator_timings.json')
+    LOCATOR_TIMING_SAMPLES = int(os.getenv('LOCATOR_TIMING_SAMPLES', 50))
+    # Waits without an explicit timeout use percentile latency x factor, clamped to [min, max]
+    ADAPTIVE_TIMEOUTS = os.getenv('ADAPTIVE_TIMEOUTS', 'False').lower() == 'true'
+    ADAPTIVE_TIMEOUT_PERCENTILE = float(os.getenv('ADAPTIVE_TIMEOUT_PERCENTILE', 95))
+    ADAPTIVE_TIMEOUT_FACTOR = float(os.getenv('ADAPTIVE_TIMEOUT_FACTOR', 2.0))
+    ADAPTIVE_TIMEOUT_MIN = float(os.getenv('ADAPTIVE_TIMEOUT_MIN', 2))
+    ADAPTIVE_TIMEOUT_MAX = float(os.getenv('ADAPTIVE_TIMEOUT_MAX', 30))
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES = int(os.getenv('ADAPTIVE_TIMEOUT_MIN_SAMPLES', 5))
+    # Locators with a median latency at least this long are reported as slow
+    SLOW_LOCATOR_SECONDS = float(os.getenv('SLOW_LOCATOR_SECONDS', 3))
+
+    # ============================================
+    # Self-Healing Locators
+    # ============================================
+    # Alternates (id, data-testid, text, structure) learned for each locator page objects
+    # find; a locator missing for SELF_HEALING_PRIMARY_TIMEOUT is looked up through them
+    SELF_HEALING = os.getenv('SELF_HEALING', 'False').lower() == 'true'
+    SELF_HEALING_FILE = BASE_DIR / os.getenv('SELF_HEALING_FILE', 'reports/locator_alternates.json')
+    SELF_HEALING_PRIMARY_TIMEOUT = float(os.getenv('SELF_HEALING_PRIMARY_TIMEOUT', 3))
+
+    # ============================================
+    # Warm-up
+    # ============================================
+    # Resolve hosts, open connections and load the homepage once before the first
+    # scenario so cold-start time is recorded as warm-up, not scenario time
+    WARMUP = os.getenv('WARMUP', 'False').lower() == 'true'
+    # Load BASE_URL in a throwaway browser session as part of the warm-up
+    WARMUP_BROWSER = os.getenv('WARMUP_BROWSER', 'True').lower() == 'true'
+    # Extra comma-separated URLs (e.g. CDN hosts) to resolve and request
+    WARMUP_URLS = [u.strip() for u in os.getenv('WARMUP_URLS', '').split(',') if u.strip()]
+    # Warm-up already paid for this run by its parallel worker (set by run_tests_parallel.py)
+    WARMUP_SECONDS = float(os.getenv('WARMUP_SECONDS', 0))
+
+    # ============================================
+    # Asset Cache
+    # ============================================
+    # Serve static assets from an on-disk HTTP cache shared by every browser and
+    # parallel worker (honors Cache-Control/Expires/ETag, needs selenium-wire)
+    ASSET_CACHE = os.getenv('ASSET_CACHE', 'False').lower() == 'true'
+    ASSET_CACHE_DIR = BASE_DIR / os.getenv('ASSET_CACHE_DIR', '.asset_cache')
+    # Regex matched against the URL path of GET requests that may be cached
+    ASSET_CACHE_PATTERN = os.getenv('ASSET_CACHE_PATTERN', r'\.(js|mjs|css|woff2?|ttf|otf|eot|png|jpe?g|gif|webp|avif|svg|ico)$')
+    ASSET_CACHE_STATS_DIR = BASE_DIR / os.getenv('ASSET_CACHE_STATS_DIR', 'reports/asset_cache')
+
+    # ============================================
+    # Snapshot Cache
+    # ============================================
+    # Page snapshots that @snapshot_cache scenarios assert against without a
+    # browser; shared by parallel workers, entries expire after the TTL (seconds)
+    SNAPSHOT_CACHE_DIR = BASE_DIR / os.getenv('SNAPSHOT_CACHE_DIR', '.snapshot_cache')
+    SNAPSHOT_CACHE_TTL = int(os.getenv('SNAPSHOT_CACHE_TTL', 600))
+
+    # ============================================
+    # Mock Backend
+    # ============================================
+    # Route form submissions and chatbot requests to a local stub server for every
+    # scenario (@mock_backend enables it per scenario, needs selenium-wire)
+    MOCK_BACKEND = os.getenv('MOCK_BACKEND', 'False').lower() == 'true'
+    MOCK_BACKEND_PORT = int(os.getenv('MOCK_BACKEND_PORT', 0))
+    # Comma-separated regexes matched against "METHOD URL" of requests sent to the stub
+    MOCK_BACKEND_ROUTES = [p.strip() for p in os.getenv(
+        'MOCK_BACKEND_ROUTES',
+        r'^(POST|PUT|PATCH|DELETE) https?://(www\.)?faberwork\.com/,^[A-Z]+ https?://(www\.)?faberwork\.com/api/'
+    ).split(',') if p.strip()]
+    MOCK_BACKEND_LATENCY_MS = int(os.getenv('MOCK_BACKEND_LATENCY_MS', 0))
+    # Share of requests (0-1) answered with HTTP 500
+    MOCK_BACKEND_ERROR_RATE = float(os.getenv('MOCK_BACKEND_ERROR_RATE', 0))
+    MOCK_CHATBOT_REPLY = os.getenv('MOCK_CHATBOT_REPLY', 'Hello! How can Faberwork help you today?')
+
+    # ============================================
+    # Virtual Time
+    # ============================================
+    # Page timer periods that @virtual_time scenarios fast-forward through
+    CAROUSEL_AUTOPLAY_INTERVAL = float(os.getenv('CAROUSEL_AUTOPLAY_INTERVAL', 5))
+    TOAST_AUTOHIDE_DELAY = float(os.getenv('TOAST_AUTOHIDE_DELAY', 5))
+
     # ============================================
     # Test Configuration
     # ============================================
@@ -0,0 +1,314 @@
+"""
+DOM Snapshots for Faberwork Test Automation
+Serializes the page once (with computed visibility and live form values
+annotated in-page) so read-only checks run locally against an lxml tree
+instead of one WebDriver round trip per query
+"""
+
+import time
+from typing import List, Optional, Tuple
+from weakref import WeakKeyDictionary
+from loguru import logger
+from lxml import html as lxml_html
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+
+from . import page_runtime
+
+
+# Attributes added to the serialized copy (never to the live page)
+VISIBLE_ATTRIBUTE = 'data-fw-visible'
+VALUE_ATTRIBUTE = 'data-fw-value'
+
+# Elements whose text is separated from the surrounding text when rendered
+_BLOCK_TAGS = {'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'fieldset',
+               'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header',
+               'hr', 'li', 'main', 'nav', 'ol', 'p', 'section', 'table', 'td', 'th', 'tr', 'ul'}
+
+# Live snapshot per driver, shared by every page object using that driver
+_snapshots = WeakKeyDictionary()
+
+snapshot_stats = {'captured': 0, 'reused': 0, 'invalidated': 0}
+
+
+class DomSnapshot:
+    """
+    Read-only view of a page at one point in time
+
+    Queries accept the same (By, value) locators as the page objects, plus
+    raw CSS selectors and XPath expressions.
+    """
+
+    def __init__(self, source: str, url: str, time_origin: float = None):
+        """
+        Parse a serialized document
+
+        Args:
+            source: Serialized document (outerHTML with annotations)
+            url: URL the document was captured from
+            time_origin: performance.timeOrigin of the captured document
+        """
+        self.source = source
+        self.url = url
+        self.time_origin = time_origin
+        self.captured_at = time.time()
+        self.tree = lxml_html.fromstring(source)
+
+    # ============================================
+    # Queries
+    # ============================================
+
+    def css(self, selector: str) -> list:
+        """
+        Find elements by CSS selector
+
+        Args:
+            selector: CSS selector
+
+        Returns:
+            list: Matching lxml elements in document order
+        """
+        return self.tree.cssselect(selector)
+
+    def xpath(self, expression: str) -> list:
+        """
+        Evaluate an XPath expression
+
+        Args:
+            expression: XPath expression
+
+        Returns:
+            list: XPath result (elements, strings or numbers)
+        """
+        return self.tree.xpath(expression)
+
+    def find_all(self, locator: Tuple[str, str], visible_only: bool = False) -> list:
+        """
+        Find elements by (By, value) locator
+
+        Args:
+            locator: Tuple of (By, value)
+            visible_only: Keep only elements that were visible at capture time
+
+        Returns:
+            list: Matching lxml elements in document order
+        """
+        by, value = locator
+        if by == By.CSS_SELECTOR:
+            elements = self.css(value)
+        elif by == By.XPATH:
+            elements = [element for element in self.xpath(value) if hasattr(element, 'tag')]
+        elif by == By.ID:
+            elements = self.xpath(f"//*[@id={xpath_literal(value)}]")
+        elif by == By.CLASS_NAME:
+            elements = self.xpath(
+                f"//*[contains(concat(' ', normalize-space(@class), ' '), {xpath_literal(' ' + value + ' ')})]"
+            )
+        elif by == By.NAME:
+            elements = self.xpath(f"//*[@name={xpath_literal(value)}]")
+        elif by == By.TAG_NAME:
+            elements = self.xpath(f"//{value}")
+        elif by == By.LINK_TEXT:
+            elements = [link for link in self.xpath('//a') if self.text_of(link) == value]
+        elif by == By.PARTIAL_LINK_TEXT:
+            elements = [link for link in self.xpath('//a') if value in self.text_of(link)]
+        else:
+            raise ValueError(f"Unsupported locator strategy for snapshots: {by}")
+
+        if visible_only:
+            elements = [element for element in elements if self.is_visible(element)]
+        return elements
+
+    def count(self, locator: Tuple[str, str], visible_only: bool = False) -> int:
+        """
+        Count elements matching a locator
+
+        Args:
+            locator: Tuple of (By, value)
+            visible_only: Count only elements that were visible at capture time
+
+        Returns:
+            int: Number of matching elements
+        """
+        return len(self.find_all(locator, visible_only))
+
+    def exists(self, locator: Tuple[str, str], visible_only: bool = False) -> bool:
+        """
+        Check if any element matches a locator
+
+        Args:
+            locator: Tuple of (By, value)
+            visible_only: Consider only elements that were visible at capture time
+
+        Returns:
+            bool: True if at least one element matches
+        """
+        return self.count(locator, visible_only) > 0
+
+    def texts(self, locator: Tuple[str, str], visible_only: bool = True) -> List[str]:
+        """
+        Get the whitespace-normalized text of every matching element
+
+        Args:
+            locator: Tuple of (By, value)
+            visible_only: Skip elements that were hidden at capture time
+
+        Returns:
+            list: Texts in document order
+        """
+        return [self.text_of(element) for element in self.find_all(locator, visible_only)]
+
+    def text(self, locator: Tuple[str, str]) -> str:
+        """
+        Get the text of the first matching element
+
+        Args:
+            locator: Tuple of (By, value)
+
+        Returns:
+            str: Element text, empty string if nothing matches
+        """
+        elements = self.find_all(locator)
+        return self.text_of(elements[0]) if elements else ""
+
+    def attribute(self, locator: Tuple[str, str], name: str) -> Optional[str]:
+        """
+        Get an attribute of the first matching element
+
+        'value' returns the live form value at capture time.
+
+        Args:
+            locator: Tuple of (By, value)
+            name: Attribute name
+
+        Returns:
+            str: Attribute value, or None if nothing matches or the attribute is missing
+        """
+        elements = self.find_all(locator)
+        if not elements:
+            return None
+        if name == 'value' and elements[0].get(VALUE_ATTRIBUTE) is not None:
+            return elements[0].get(VALUE_ATTRIBUTE)
+        return elements[0].get(name)
+
+    def page_text(self, visible_only: bool = True) -> str:
+        """
+        Get the whitespace-normalized text of the page body
+
+        Args:
+            visible_only: Leave out text of elements hidden at capture time
+
+        Returns:
+            str: Page text
+        """
+        body = self.tree.find('body')
+        if body is None:
+            return ""
+        if not visible_only:
+            return self.text_of(body)
+        return ' '.join(self.visible_text_of(body).split())
+
+    def contains_text(self, text: str, case_sensitive: bool = False) -> bool:
+        """
+        Check if the visible page text contains a string
+
+        Args:
+            text: Text to look for
+            case_sensitive: Compare case-sensitively
+
+        Returns:
+            bool: True if the text is present
+        """
+        page_text = self.page_text()
+        if case_sensitive:
+            return text in page_text
+        return text.lower() in page_text.lower()
+
+    # ============================================
+    # Element Helpers
+    # ============================================
+
+    @staticmethod
+    def is_visible(element) -> bool:
+        """Check if an element was visible at capture time"""
+        return element.get(VISIBLE_ATTRIBUTE) == '1'
+
+    @staticmethod
+    def text_of(element) -> str:
+        """Whitespace-normalized text content of an element"""
+        return ' '.join(element.text_content().split())
+
+    def visible_text_of(self, element) -> str:
+        """Text of an element without the text of hidden descendants (not normalized)"""
+        if not self.is_visible(element) or element.tag in ('script', 'style', 'noscript', 'template'):
+            return element.tail or ''
+        parts = [element.text or '']
+        for child in element:
+            parts.append(self.visible_text_of(child) if isinstance(child.tag, str) else child.tail or '')
+        separator = ' ' if element.tag in _BLOCK_TAGS else ''
+        return separator + ''.join(parts) + separator + (element.tail or '')
+
+
+def xpath_literal(value: str) -> str:
+    """Quote a string for use in an XPath expression"""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+def capture_snapshot(driver: WebDriver) -> DomSnapshot:
+    """
+    Serialize the current document into a new snapshot
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        DomSnapshot: Fresh snapshot
+    """
+    result = page_runtime.call(driver, 'captureSnapshot', VISIBLE_ATTRIBUTE, VALUE_ATTRIBUTE)
+    snapshot = DomSnapshot(result['html'], result['url'], result['origin'])
+    _snapshots[driver] = snapshot
+    snapshot_stats['captured'] += 1
+    logger.debug(f"Captured DOM snapshot of {result['url']} ({len(result['html']) // 1024} KB)")
+    return snapshot
+
+
+def get_snapshot(driver: WebDriver, fresh: bool = False) -> DomSnapshot:
+    """
+    Get a snapshot of the current document, reusing the last one while the page is unchanged
+
+    The last snapshot is reused when it is from the same document and no
+    mutation happened since it was taken (one small script call).
+
+    Args:
+        driver: WebDriver instance
+        fresh: Always capture a new snapshot
+
+    Returns:
+        DomSnapshot: Snapshot of the current document
+    """
+    snapshot = _snapshots.get(driver)
+    if snapshot is not None and not fresh:
+        try:
+            state = page_runtime.call(driver, 'snapshotState')
+            if state['origin'] == snapshot.time_origin and state['mutations'] == 0:
+                snapshot_stats['reused'] += 1
+                return snapshot
+        except WebDriverException:
+            pass
+    return capture_snapshot(driver)
+
+
+def invalidate_snapshot(driver: WebDriver):
+    """
+    Drop the driver's snapshot (after navigation or interaction)
+
+    Args:
+        driver: WebDriver instance
+    """
+    if _snapshots.pop(driver, None) is not None:
+        snapshot_stats['invalidated'] += 1
@@ -16,18 +16,73 @@ from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from loguru import logger
 from .config import Config
+from .cdp import supports_cdp, execute_cdp, add_script_on_new_document
+from .http_archive import wire_webdriver
+from .page_runtime import install_runtime
+from .element_cache import drop_element_cache
+
+
+# Stylesheet injected into every new document in animation-disabled mode.
+# Durations are near-zero rather than zero so transitionend/animationend
+# still fire for page scripts that wait on them.
+DISABLE_ANIMATIONS_SCRIPT = """
+(function () {
+    var css = '*, *::before, *::after {'
+        + ' transition-duration: 0.01ms !important; transition-delay: 0s !important;'
+        + ' animation-duration: 0.01ms !important; animation-delay: 0s !important;'
+        + ' animation-iteration-count: 1 !important; scroll-behavior: auto !important; }'
+        + ' html, body { scroll-behavior: auto !important; }';
+    function inject() {
+        if (document.getElementById('fw-disable-animations')) { return; }
+        var style = document.createElement('style');
+        style.id = 'fw-disable-animations';
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    }
+    if (document.documentElement) {
+        inject();
+    } else {
+        new MutationObserver(function (mutations, observer) {
+            if (document.documentElement) { observer.disconnect(); inject(); }
+        }).observe(document, {childList: true});
+    }
+})();
+"""
+
 
+# Network.setBlockedURLs wildcard patterns per resource blocking profile.
+# SVGs stay unblocked because logo checks look at them.
+RESOURCE_BLOCKING_PROFILES = {
+    'visual': [],
+    'default': [
+        # Images
+        '*.png', '*.png?*', '*.jpg', '*.jpg?*', '*.jpeg', '*.jpeg?*', '*.gif', '*.gif?*',
+        '*.webp', '*.webp?*', '*.avif', '*.avif?*', '*.ico',
+        # Fonts
+        '*.woff', '*.woff?*', '*.woff2', '*.woff2?*', '*.ttf', '*.ttf?*', '*.otf', '*.eot',
+        '*fonts.googleapis.com/*', '*fonts.gstatic.com/*',
+        # Media
+        '*.mp4', '*.webm', '*.mp3', '*.ogg',
+        # Analytics and trackers
+        '*google-analytics.com/*', '*googletagmanager.com/*', '*doubleclick.net/*',
+        '*connect.facebook.net/*', '*hotjar.com/*', '*clarity.ms/*',
+    ],
+}
 
 class DriverFactory:
     """Factory class for creating WebDriver instances"""
 
     @staticmethod
-    def create_driver(browser=None):
+    def create_driver(browser=None, intercept=False, network_events=False):
         """
         Create and configure WebDriver instance
 
         Args:
             browser (str): Browser type ('chrome', 'firefox', 'edge')
+            intercept (bool): Build a selenium-wire driver whose requests can be intercepted
+                (implied by the HTTP archive modes)
+            network_events (bool): Record CDP Network events even without NETWORK_EVENTS
+                (Chromium only, e.g. for the blocked request counters)
 
         Returns:
             WebDriver: Configured WebDriver instance
@@ -36,20 +91,51 @@ class DriverFactory:
         logger.info(f"Creating {browser} WebDriver instance")
 
         if browser.lower() == 'chrome':
-            return DriverFactory._create_chrome_driver()
+            driver = DriverFactory._create_chrome_driver(intercept, network_events)
         elif browser.lower() == 'firefox':
-            return DriverFactory._create_firefox_driver()
+            driver = DriverFactory._create_firefox_driver(intercept)
         elif browser.lower() == 'edge':
-            return DriverFactory._create_edge_driver()
+            driver = DriverFactory._create_edge_driver(intercept, network_events)
         else:
             logger.error(f"Unsupported browser: {browser}. Defaulting to Chrome.")
-            return DriverFactory._create_chrome_driver()
+            driver = DriverFactory._create_chrome_driver(intercept, network_events)
+
+        # Framework helpers live in every document (window.__fw), calls send only names and arguments
+        install_runtime(driver)
+        return driver
+
+    @staticmethod
+    def _local_webdriver(intercept=False):
+        """
+        Get the module local drivers are built from
+
+        Intercepting drivers (mock backend, asset cache, HTTP archive record/replay) come from
+        selenium-wire, which routes all traffic (HTTPS included) through its local proxy.
+
+        Args:
+            intercept (bool): Request interception is needed
+
+        Returns:
+            tuple: (webdriver module, extra driver keyword arguments)
+        """
+        if not intercept and not Config.ASSET_CACHE and Config.HTTP_ARCHIVE_MODE not in ('record', 'replay'):
+            return webdriver, {}
+
+        if wire_webdriver is None:
+            logger.warning("Request interception needs selenium-wire (pip install selenium-wire) - running live")
+            return webdriver, {}
+
+        # Interceptors do the work, keep only a small capture buffer
+        return wire_webdriver, {'seleniumwire_options': {'request_storage': 'memory', 'request_storage_max_size': 100}}
 
     @staticmethod
-    def _create_chrome_driver():
+    def _create_chrome_driver(intercept=False, network_events=False):
         """Create Chrome WebDriver with configurations"""
         chrome_options = ChromeOptions()
 
+        # Page load strategy (normal/eager/none), see READY_WHEN contracts on page objects
+        chrome_options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
+
         # Headless mode
         if Config.HEADLESS:
             chrome_options.add_argument('--headless=new')
@@ -120,13 +206,19 @@ class DriverFactory:
             chrome_options.add_argument('--enable-logging')
             chrome_options.add_argument('--v=1')
 
-        # Performance logging
-        if Config.ENABLE_PERFORMANCE_LOGGING:
-            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        # Performance logging (also carries the CDP Network events used for network-idle
+        # readiness and the blocked request counters)
+        logging_prefs = {}
+        if Config.ENABLE_PERFORMANCE_LOGGING or Config.NETWORK_EVENTS or network_events:
+            logging_prefs['performance'] = 'ALL'
+            chrome_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
 
         # Network logging
         if Config.ENABLE_NETWORK_LOGGING:
-            chrome_options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
+            logging_prefs['browser'] = 'ALL'
+
+        if logging_prefs:
+            chrome_options.set_capability('goog:loggingPrefs', logging_prefs)
 
         # Preferences
         from pathlib import Path
@@ -152,6 +244,7 @@ class DriverFactory:
                 )
             else:
                 # Local execution - try with automatic ChromeDriver download
+                local_webdriver, wire_options = DriverFactory._local_webdriver(intercept)
                 try:
                     from webdriver_manager.chrome import ChromeDriverManager
                     from webdriver_manager.core.os_manager import ChromeType
@@ -159,11 +252,11 @@ class DriverFactory:
                     # Try to install ChromeDriver
                     driver_path = ChromeDriverManager().install()
                     service = ChromeService(executable_path=driver_path)
-                    driver = webdriver.Chrome(service=service, options=chrome_options)
+                    driver = local_webdriver.Chrome(service=service, options=chrome_options, **wire_options)
                 except Exception as e:
                     logger.warning(f"webdriver-manager failed: {e}, trying direct Chrome instantiation")
                     # Fallback: try direct instantiation (Selenium 4.6+ can auto-download)
-                    driver = webdriver.Chrome(options=chrome_options)
+                    driver = local_webdriver.Chrome(options=chrome_options, **wire_options)
 
             # Set timeouts (increased for parallel execution stability)
             driver.implicitly_wait(Config.IMPLICIT_WAIT)
@@ -180,10 +273,13 @@ class DriverFactory:
             raise
 
     @staticmethod
-    def _create_firefox_driver():
+    def _create_firefox_driver(intercept=False):
         """Create Firefox WebDriver with configurations"""
         firefox_options = FirefoxOptions()
 
+        # Page load strategy (normal/eager/none), see READY_WHEN contracts on page objects
+        firefox_options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
+
         # Headless mode
         if Config.HEADLESS:
             firefox_options.add_argument('--headless')
@@ -211,7 +307,8 @@ class DriverFactory:
                 )
             else:
                 service = FirefoxService(GeckoDriverManager().install())
-                driver = webdriver.Firefox(service=service, options=firefox_options)
+                local_webdriver, wire_options = DriverFactory._local_webdriver(intercept)
+                driver = local_webdriver.Firefox(service=service, options=firefox_options, **wire_options)
 
             # Set timeouts (increased for parallel execution stability)
             driver.implicitly_wait(Config.IMPLICIT_WAIT)
@@ -228,10 +325,13 @@ class DriverFactory:
             raise
 
     @staticmethod
-    def _create_edge_driver():
+    def _create_edge_driver(intercept=False, network_events=False):
         """Create Edge WebDriver with configurations"""
         edge_options = EdgeOptions()
 
+        # Page load strategy (normal/eager/none), see READY_WHEN contracts on page objects
+        edge_options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
+
         # Headless mode
         if Config.HEADLESS:
             edge_options.add_argument('--headless')
@@ -246,6 +346,11 @@ class DriverFactory:
         edge_options.add_argument('--no-sandbox')
         edge_options.add_argument('--disable-dev-shm-usage')
 
+        # CDP Network events for network-idle readiness and the blocked request counters
+        if Config.ENABLE_PERFORMANCE_LOGGING or Config.NETWORK_EVENTS or network_events:
+            edge_options.set_capability('ms:loggingPrefs', {'performance': 'ALL'})
+            edge_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
         try:
             if Config.USE_SELENIUM_GRID:
                 logger.info(f"Connecting to Selenium Grid at {Config.SELENIUM_HUB_URL}")
@@ -255,7 +360,8 @@ class DriverFactory:
                 )
             else:
                 service = EdgeService(EdgeChromiumDriverManager().install())
-                driver = webdriver.Edge(service=service, options=edge_options)
+                local_webdriver, wire_options = DriverFactory._local_webdriver(intercept)
+                driver = local_webdriver.Edge(service=service, options=edge_options, **wire_options)
 
             # Set timeouts (increased for parallel execution stability)
             driver.implicitly_wait(Config.IMPLICIT_WAIT)
@@ -271,6 +377,90 @@ class DriverFactory:
             logger.error(f"Failed to create Edge WebDriver: {str(e)}")
             raise
 
+    @staticmethod
+    def disable_animations(driver) -> bool:
+        """
+        Turn off CSS transitions, animations and smooth scrolling for every new document
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            bool: True if the stylesheet was registered, False if the driver has no CDP support
+        """
+        if not supports_cdp(driver):
+            logger.warning("Animation-disabled mode requires a Chromium driver - animations left enabled")
+            return False
+
+        if not add_script_on_new_document(driver, DISABLE_ANIMATIONS_SCRIPT):
+            return False
+
+        execute_cdp(driver, 'Emulation.setEmulatedMedia', {
+            'features': [{'name': 'prefers-reduced-motion', 'value': 'reduce'}]
+        })
+        logger.info("Animations disabled for this session")
+        return True
+
+    @staticmethod
+    def block_resources(driver, profile: str = 'default') -> bool:
+        """
+        Block requests matching a resource blocking profile for the rest of the session
+
+        Args:
+            driver: WebDriver instance
+            profile: Key of RESOURCE_BLOCKING_PROFILES
+
+        Returns:
+            bool: True if blocking is active, False if nothing is blocked or the driver has no CDP support
+        """
+        patterns = RESOURCE_BLOCKING_PROFILES[profile] + (Config.BLOCKED_URL_PATTERNS if profile != 'visual' else [])
+        if not patterns:
+            return False
+
+        if not supports_cdp(driver):
+            logger.warning("Resource blocking requires a Chromium driver - all resources loaded")
+            return False
+
+        execute_cdp(driver, 'Network.enable')
+        if execute_cdp(driver, 'Network.setBlockedURLs', {'urls': patterns}) is None:
+            return False
+
+        logger.info(f"Blocking resources ({profile} profile, {len(patterns)} patterns)")
+        return True
+
+    @staticmethod
+    def reset_session(driver) -> bool:
+        """
+        Bring a reused session back to a clean state without restarting the browser
+
+        Closes extra windows, clears cookies, localStorage and sessionStorage of
+        the current origin and leaves the tab on about:blank, so the next
+        navigation loads a fresh document.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            bool: True if the session was reset, False if it is unusable
+        """
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.delete_all_cookies()
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            driver.get('about:blank')
+            logger.debug("Session reset")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to reset session: {str(e)}")
+            return False
+
     @staticmethod
     def quit_driver(driver):
         """
@@ -281,6 +471,7 @@ class DriverFactory:
         """
         try:
             if driver:
+                drop_element_cache(driver)
                 driver.quit()
                 logger.info("WebDriver quit successfully")
         except Exception as e:
@@ -0,0 +1,159 @@
+"""
+Element Cache for Faberwork Test Automation
+Keeps the element handles page objects resolved, so repeated interactions
+with the same locator skip the lookup, and recovers from stale handles by
+re-resolving them
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+from loguru import logger
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import StaleElementReferenceException, ElementNotInteractableException
+
+from .config import Config
+from .readiness import get_time_origin
+
+
+# Run statistics (one process)
+element_cache_stats = {'hits': 0, 'misses': 0, 'stale_recovered': 0, 'invalidations': 0}
+
+
+class ElementCache:
+    """
+    Element handles of the current document, keyed by locator
+
+    The cache is dropped when the document changes. A navigation through
+    the page objects drops it directly. Any other document change is found
+    when a cached handle goes stale.
+    """
+
+    def __init__(self, driver: WebDriver):
+        """
+        Initialize the cache
+
+        Args:
+            driver: WebDriver instance
+        """
+        self.driver = driver
+        self._elements: Dict[Tuple[str, str], WebElement] = {}
+        self._time_origin: Optional[float] = None
+
+    def put(self, locator: Tuple[str, str], element: WebElement):
+        """
+        Remember the element of a locator
+
+        Args:
+            locator: Tuple of (By, value)
+            element: Element the locator resolved to
+        """
+        if not self._elements:
+            # Identity of the document the handles belong to
+            self._time_origin = get_time_origin(self.driver)
+        self._elements[locator] = element
+
+    def invalidate(self, locator: Tuple[str, str] = None):
+        """
+        Forget one locator, or every handle (after navigation)
+
+        Args:
+            locator: Tuple of (By, value), None for all
+        """
+        if locator is not None:
+            self._elements.pop(locator, None)
+            return
+        if self._elements:
+            element_cache_stats['invalidations'] += 1
+            self._elements.clear()
+        self._time_origin = None
+
+    def run(self, locator: Tuple[str, str], resolve: Callable[[], Optional[WebElement]],
+            action: Callable[[WebElement], object], retries: int = None):
+        """
+        Run an action on the element of a locator
+
+        The cached handle is tried first. A stale handle is resolved again,
+        up to retries times. A cached handle that is not interactable skipped
+        the caller's wait (e.g. for clickability), so it is resolved again too.
+
+        Args:
+            locator: Tuple of (By, value)
+            resolve: Finds the element (None if it does not exist)
+            action: Called with the element, its result is returned
+            retries: Re-resolutions after stale handles (defaults to Config.STALE_ELEMENT_RETRIES)
+
+        Returns:
+            Result of action, or None if resolve found no element
+        """
+        retries = Config.STALE_ELEMENT_RETRIES if retries is None else retries
+
+        element = self._elements.get(locator)
+        if element is not None:
+            element_cache_stats['hits'] += 1
+            try:
+                return action(element)
+            except StaleElementReferenceException:
+                self._recover(locator)
+            except ElementNotInteractableException:
+                self.invalidate(locator)
+        else:
+            element_cache_stats['misses'] += 1
+
+        for attempt in range(retries + 1):
+            element = resolve()
+            if element is None:
+                return None
+            self.put(locator, element)
+            try:
+                return action(element)
+            except StaleElementReferenceException:
+                if attempt == retries:
+                    self.invalidate(locator)
+                    raise
+                self._recover(locator)
+
+    def _recover(self, locator: Tuple[str, str]):
+        """Drop a stale handle (and every handle if the document was replaced)"""
+        element_cache_stats['stale_recovered'] += 1
+        origin = get_time_origin(self.driver)
+        if origin is None or origin != self._time_origin:
+            logger.debug(f"Document changed, dropping {len(self._elements)} cached element(s)")
+            self.invalidate()
+        else:
+            logger.debug(f"Stale element for {locator}, resolving it again")
+            self.invalidate(locator)
+
+
+# One cache per driver, shared by every page object using that driver
+_caches = WeakKeyDictionary()
+
+
+def get_element_cache(driver: WebDriver) -> ElementCache:
+    """
+    Get the element cache of a driver
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        ElementCache: Cache for this driver
+    """
+    cache = _caches.get(driver)
+    if cache is None:
+        cache = ElementCache(driver)
+        _caches[driver] = cache
+    return cache
+
+
+def drop_element_cache(driver: WebDriver):
+    """
+    Forget the element cache of a driver (call when it quits)
+
+    Cached elements refer back to their driver, so the entry would otherwise
+    keep the driver alive for the rest of the run.
+
+    Args:
+        driver: WebDriver instance
+    """
+    _caches.pop(driver, None)
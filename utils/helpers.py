@@ -8,15 +8,16 @@ import time
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Union
 from loguru import logger
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from .config import Config
+from . import page_runtime
 
 
 def take_screenshot(driver: WebDriver, name: str = "screenshot") -> str:
@@ -48,30 +49,53 @@ def wait_for_element(
     driver: WebDriver,
     locator: tuple,
     timeout: int = None,
-    condition=EC.presence_of_element_located
+    condition=EC.presence_of_element_located,
+    record: bool = True
 ) -> Optional[WebElement]:
     """
     Wait for an element to meet a specific condition
 
+    Every wait is recorded in the locator timing table. With ADAPTIVE_TIMEOUTS,
+    waits without an explicit timeout use the timeout learned for the locator.
+
     Args:
         driver: WebDriver instance
         locator: Tuple of (By, value)
         timeout: Maximum wait time in seconds
         condition: Expected condition to wait for
+        record: False for probes shorter than the real wait (the caller records the outcome)
 
     Returns:
         WebElement or None
     """
+    from .locator_timing import get_locator_timings, locator_timing_stats
+    from .snapshot_cache import is_snapshot_mode
+
+    # Snapshots answer at once, their waits say nothing about the site
+    timings = None if is_snapshot_mode(driver) or not record else get_locator_timings()
+    adaptive = False
+    if timeout is None and timings is not None and Config.ADAPTIVE_TIMEOUTS:
+        timeout = timings.timeout_for(locator, Config.EXPLICIT_WAIT)
+        adaptive = timeout != Config.EXPLICIT_WAIT
+        if adaptive:
+            locator_timing_stats['adaptive'] += 1
     timeout = timeout or Config.EXPLICIT_WAIT
+    start = time.perf_counter()
 
     try:
         element = WebDriverWait(driver, timeout).until(
             condition(locator)
         )
+        if timings is not None:
+            timings.record(locator, time.perf_counter() - start, found=True)
         logger.debug(f"Element found: {locator}")
         return element
 
     except TimeoutException:
+        if timings is not None:
+            timings.record(locator, timeout, found=False)
+            if adaptive and timeout < Config.EXPLICIT_WAIT:
+                locator_timing_stats['saved_seconds'] += Config.EXPLICIT_WAIT - timeout
         logger.warning(f"Element not found within {timeout}s: {locator}")
         return None
 
@@ -144,6 +168,148 @@ def wait_for_element_visibility(
     return wait_for_element(driver, locator, timeout, EC.visibility_of_element_located)
 
 
+def wait_for_first(
+    driver: WebDriver,
+    outcomes: Dict[str, Union[tuple, Callable[[WebDriver], Any]]],
+    timeout: float = None,
+    poll_frequency: float = 0.1
+) -> Optional[Dict[str, Any]]:
+    """
+    Wait for whichever of several competing outcomes happens first
+
+    All outcomes are checked on every poll of one bounded wait, so an error
+    shows up as soon as it appears instead of after the success timeout.
+
+    Args:
+        driver: WebDriver instance
+        outcomes: Outcome name -> locator (happens when a matching element is
+            visible) or callable taking the driver (happens when it returns a truthy value)
+        timeout: Maximum wait time in seconds
+        poll_frequency: Seconds between checks
+
+    Returns:
+        dict: 'outcome' (name of the first outcome that happened), 'value' (the visible
+            element or the callable's result) and 'elapsed' seconds, or None on timeout
+    """
+    timeout = timeout or Config.EXPLICIT_WAIT
+    start = time.perf_counter()
+
+    def first_outcome(d):
+        for name, outcome in outcomes.items():
+            if callable(outcome):
+                value = outcome(d)
+            else:
+                value = next((element for element in d.find_elements(*outcome) if element.is_displayed()), None)
+            if value:
+                return {'outcome': name, 'value': value, 'elapsed': time.perf_counter() - start}
+        return False
+
+    try:
+        result = WebDriverWait(
+            driver, timeout, poll_frequency, ignored_exceptions=(StaleElementReferenceException,)
+        ).until(first_outcome)
+        logger.debug(f"Outcome '{result['outcome']}' after {result['elapsed']:.2f}s")
+        return result
+
+    except TimeoutException:
+        logger.warning(f"None of {', '.join(outcomes)} happened within {timeout}s")
+        return None
+
+
+# Absence assertion statistics (one process)
+absence_stats = {'checks': 0, 'seconds': 0.0, 'saved_seconds': 0.0}
+
+
+def _locator_css(locator: tuple) -> Optional[str]:
+    """CSS selector equivalent of a locator, None for strategies CSS cannot express"""
+    by, value = locator
+    if by == By.CSS_SELECTOR:
+        return value
+    if by == By.ID:
+        return '[id="{}"]'.format(value.replace('\\', '\\\\').replace('"', '\\"'))
+    if by == By.CLASS_NAME:
+        return '[class~="{}"]'.format(value.replace('\\', '\\\\').replace('"', '\\"'))
+    return None
+
+
+def _poll_absence(driver: WebDriver, locator: tuple, quiet_ms: int, deadline: float) -> Dict[str, bool]:
+    """Poll until a visible match appears, or none has for quiet_ms (locators without a CSS form)"""
+    start = time.perf_counter()
+    driver.implicitly_wait(0)
+    try:
+        while True:
+            for element in driver.find_elements(*locator):
+                try:
+                    if element.is_displayed():
+                        return {'present': True, 'settled': True}
+                except StaleElementReferenceException:
+                    continue
+            now = time.perf_counter()
+            if now - start >= quiet_ms / 1000:
+                if not page_runtime.call(driver, 'pendingRequests', Config.NETWORK_IDLE_MAX_REQUEST_SECONDS * 1000):
+                    return {'present': False, 'settled': True}
+                # A response still in flight can render the element once it arrives
+                start = now
+            if now >= deadline:
+                return {'present': False, 'settled': False}
+            time.sleep(0.05)
+    finally:
+        driver.implicitly_wait(Config.IMPLICIT_WAIT)
+
+
+def wait_for_absence(driver: WebDriver, locator: tuple, quiet_ms: int = None,
+                     timeout: float = None, record_saving: bool = True) -> Dict[str, Any]:
+    """
+    Wait until an element can be considered not to appear
+
+    Instead of waiting out a full timeout, the element counts as absent once
+    nothing visible matches it, no fetch/XHR request of the page is in flight
+    and the DOM has not changed for quiet_ms. Requests are counted by the
+    in-page runtime from the moment it is in the document, so call this right
+    after the triggering action; without the runtime in place beforehand the
+    full timeout is waited.
+
+    Args:
+        driver: WebDriver instance
+        locator: Tuple of (By, value)
+        quiet_ms: DOM quiet period in milliseconds (defaults to Config.ABSENCE_QUIET_MS)
+        timeout: Maximum wait time in seconds (defaults to Config.ABSENCE_TIMEOUT)
+        record_saving: Count the time left as saved (False where the check did not replace a full wait)
+
+    Returns:
+        dict: 'absent' (no visible match), 'settled' (the page went quiet before
+            the timeout) and 'elapsed' seconds
+    """
+    quiet_ms = Config.ABSENCE_QUIET_MS if quiet_ms is None else quiet_ms
+    timeout = timeout or Config.ABSENCE_TIMEOUT
+    start = time.perf_counter()
+    deadline = start + timeout
+
+    # Requests sent before the runtime arrived were never counted: nothing can be ruled out early
+    if not driver.execute_script("return !!window.__fwRequests;"):
+        logger.debug(f"Request tracking not active, waiting the full {timeout}s for {locator}")
+        quiet_ms = timeout * 1000
+
+    css = _locator_css(locator)
+    if css:
+        result = page_runtime.call_async(driver, 'absenceSettled', css, quiet_ms, timeout * 1000,
+                                         Config.NETWORK_IDLE_MAX_REQUEST_SECONDS * 1000) or {}
+    else:
+        result = _poll_absence(driver, locator, quiet_ms, deadline)
+    present = bool(result.get('present'))
+    settled = bool(result.get('settled'))
+
+    elapsed = time.perf_counter() - start
+    absence_stats['checks'] += 1
+    absence_stats['seconds'] += elapsed
+    if not present:
+        if record_saving:
+            absence_stats['saved_seconds'] += max(0.0, timeout - elapsed)
+        logger.debug(f"{locator} absent after {elapsed:.2f}s instead of {timeout}s"
+                     f"{'' if settled else ' (page never went quiet)'}")
+    return {'absent': not present, 'settled': settled, 'elapsed': elapsed}
+
+
 def is_element_present(driver: WebDriver, locator: tuple) -> bool:
     """
     Check if an element is present in the DOM
@@ -180,50 +346,187 @@ def is_element_visible(driver: WebDriver, locator: tuple) -> bool:
         return False
 
 
-def scroll_to_element(driver: WebDriver, element: WebElement):
+def _scroll_and_settle(driver: WebDriver, mode: str, element: WebElement = None, smooth: bool = None) -> bool:
+    """
+    Scroll the page and wait until the scroll position has settled
+
+    Args:
+        driver: WebDriver instance
+        mode: 'element', 'top' or 'bottom'
+        element: WebElement to scroll to (only for mode 'element')
+        smooth: Use smooth scrolling (defaults to Config.SMOOTH_SCROLL)
+
+    Returns:
+        bool: True if the scroll settled before SCROLL_SETTLE_TIMEOUT_MS
+    """
+    smooth = Config.SMOOTH_SCROLL if smooth is None else smooth
+    behavior = 'smooth' if smooth else 'instant'
+    result = page_runtime.call_async(
+        driver, 'scrollSettle', element, mode, behavior, Config.SCROLL_SETTLE_TIMEOUT_MS
+    ) or {}
+    if not result.get('settled'):
+        logger.debug(f"Scroll did not settle within {Config.SCROLL_SETTLE_TIMEOUT_MS}ms")
+    return bool(result.get('settled'))
+
+
+def scroll_to_element(driver: WebDriver, element: WebElement, smooth: bool = None) -> bool:
     """
     Scroll to bring an element into view
 
+    Scrolls instantly by default and returns as soon as the scroll position
+    and the element's bounding box have stabilized.
+
     Args:
         driver: WebDriver instance
         element: WebElement to scroll to
+        smooth: Use smooth scrolling (defaults to Config.SMOOTH_SCROLL)
+
+    Returns:
+        bool: True if the scroll settled, False otherwise
     """
     try:
-        driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-        time.sleep(0.5)  # Small delay for smooth scrolling
+        settled = _scroll_and_settle(driver, 'element', element, smooth)
         logger.debug("Scrolled to element")
+        return settled
     except Exception as e:
         logger.error(f"Failed to scroll to element: {str(e)}")
+        return False
 
 
-def scroll_to_top(driver: WebDriver):
+def scroll_to_top(driver: WebDriver, smooth: bool = None) -> bool:
     """
     Scroll to the top of the page
 
     Args:
         driver: WebDriver instance
+        smooth: Use smooth scrolling (defaults to Config.SMOOTH_SCROLL)
+
+    Returns:
+        bool: True if the scroll settled, False otherwise
     """
     try:
-        driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(0.3)
+        settled = _scroll_and_settle(driver, 'top', smooth=smooth)
         logger.debug("Scrolled to top of page")
+        return settled
     except Exception as e:
         logger.error(f"Failed to scroll to top: {str(e)}")
+        return False
 
 
-def scroll_to_bottom(driver: WebDriver):
+def scroll_to_bottom(driver: WebDriver, smooth: bool = None) -> bool:
     """
     Scroll to the bottom of the page
 
     Args:
         driver: WebDriver instance
+        smooth: Use smooth scrolling (defaults to Config.SMOOTH_SCROLL)
+
+    Returns:
+        bool: True if the scroll settled, False otherwise
     """
     try:
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(0.3)
+        settled = _scroll_and_settle(driver, 'bottom', smooth=smooth)
         logger.debug("Scrolled to bottom of page")
+        return settled
     except Exception as e:
         logger.error(f"Failed to scroll to bottom: {str(e)}")
+        return False
+
+
+def wait_for_animations(driver: WebDriver, element: WebElement = None, timeout: int = None) -> bool:
+    """
+    Wait until CSS animations and transitions in an element subtree have finished
+
+    Infinite animations (spinners, marquees) are ignored. A transition that
+    never fires transitionend (e.g. its element was removed) stops counting
+    once no animation has been running for ~10 frames.
+
+    Args:
+        driver: WebDriver instance
+        element: Root of the subtree to watch (whole document if None)
+        timeout: Maximum wait time in seconds
+
+    Returns:
+        bool: True if the subtree settled, False on timeout or error
+    """
+    timeout = timeout or Config.ANIMATION_SETTLE_TIMEOUT
+
+    try:
+        result = page_runtime.call_async(driver, 'animationsSettled', element, timeout * 1000) or {}
+        if result.get('settled'):
+            logger.debug(f"Animations settled after {result.get('elapsed', 0):.0f}ms")
+            return True
+        logger.warning(f"Animations did not settle within {timeout}s")
+        return False
+    except Exception as e:
+        logger.error(f"Failed to wait for animations: {str(e)}")
+        return False
+
+
+DOM_MUTATION_TYPES = ('childList', 'characterData', 'attributes')
+
+
+def arm_dom_change(
+    driver: WebDriver,
+    element: WebElement = None,
+    mutation_types: tuple = DOM_MUTATION_TYPES,
+    match: str = None
+) -> Optional[str]:
+    """
+    Start watching an element subtree for DOM changes, before the action that causes them
+
+    Args:
+        driver: WebDriver instance
+        element: Root of the subtree to watch (whole document if None)
+        mutation_types: Any of 'childList' (child added), 'characterData' (text changed)
+            and 'attributes' (attribute changed)
+        match: Optional CSS selector, only mutations on/inside matching elements (or inserting one) count
+
+    Returns:
+        str: Watch token for wait_for_dom_change(), or None if the watch could not be armed
+    """
+    try:
+        return page_runtime.call(driver, 'armDomChange', element, list(mutation_types), match)
+    except Exception as e:
+        logger.error(f"Failed to arm DOM change watch: {str(e)}")
+        return None
+
+
+def wait_for_dom_change(driver: WebDriver, token: str, timeout: float = None) -> Optional[Dict[str, Any]]:
+    """
+    Wait for the first mutation recorded by an armed watch
+
+    The watch is released afterwards, so each token can be waited on once.
+
+    Args:
+        driver: WebDriver instance
+        token: Token returned by arm_dom_change()
+        timeout: Maximum wait time in seconds
+
+    Returns:
+        dict: 'type' of the first mutation and 'elapsed_ms' since arming (doubles as a
+            latency measurement), or None on timeout, lost watch (page navigated) or error
+    """
+    if not token:
+        return None
+
+    timeout = min(timeout or Config.EXPLICIT_WAIT, Config.SCRIPT_TIMEOUT - 1)
+
+    try:
+        result = page_runtime.call_async(driver, 'waitDomChange', token, timeout * 1000)
+    except Exception as e:
+        logger.error(f"Failed to wait for DOM change: {str(e)}")
+        return None
+
+    if result is None:
+        logger.warning(f"DOM change watch {token} was lost (page navigated?)")
+        return None
+    if not result.get('type'):
+        logger.warning(f"No DOM change within {timeout}s")
+        return None
+
+    logger.debug(f"DOM change ({result['type']}) after {result['elapsed_ms']:.0f}ms")
+    return result
 
 
 def highlight_element(driver: WebDriver, element: WebElement, duration: float = 0.5):
@@ -237,17 +540,9 @@ def highlight_element(driver: WebDriver, element: WebElement, duration: float =
     """
     try:
         original_style = element.get_attribute('style')
-        driver.execute_script(
-            "arguments[0].setAttribute('style', arguments[1]);",
-            element,
-            "border: 3px solid red; background-color: yellow;"
-        )
+        page_runtime.call(driver, 'setStyle', element, "border: 3px solid red; background-color: yellow;")
         time.sleep(duration)
-        driver.execute_script(
-            "arguments[0].setAttribute('style', arguments[1]);",
-            element,
-            original_style
-        )
+        page_runtime.call(driver, 'setStyle', element, original_style)
     except Exception as e:
         logger.error(f"Failed to highlight element: {str(e)}")
 
@@ -462,20 +757,43 @@ def generate_timestamp(format_str: str = "%Y%m%d_%H%M%S") -> str:
     return datetime.now().strftime(format_str)
 
 
-def wait_for_page_load(driver: WebDriver, timeout: int = None):
+def wait_for_page_load(driver: WebDriver, timeout: int = None, readiness: str = None,
+                       previous_origin: float = None):
     """
     Wait for page to fully load
 
+    With 'network_idle' readiness the page is ready once the DOM is parsed and
+    no tracked request has been in flight for NETWORK_IDLE_QUIET_MS, which
+    covers XHR-loaded content and skips slow ignored third-party assets.
+    Falls back to 'document' when the driver has no Network events.
+
     Args:
         driver: WebDriver instance
         timeout: Maximum wait time in seconds
+        readiness: 'document' or 'network_idle' (defaults to Config.PAGE_READINESS)
+        previous_origin: Navigation start of the document left; with the 'none' page load
+            strategy the old document can still be current right after navigating
     """
+    from .network_idle import network_idle_tracker
+    from .readiness import get_time_origin
+
     timeout = timeout or Config.PAGE_LOAD_TIMEOUT
+    readiness = readiness or Config.PAGE_READINESS
+    tracker = network_idle_tracker(driver) if readiness == 'network_idle' else None
+    if tracker is not None and not tracker.available:
+        tracker = None
+    ready_states = ('interactive', 'complete') if tracker else ('complete',)
 
     try:
         WebDriverWait(driver, timeout).until(
-            lambda d: d.execute_script('return document.readyState') == 'complete'
+            lambda d: (previous_origin is None or get_time_origin(d) != previous_origin)
+            and d.execute_script('return document.readyState') in ready_states
         )
-        logger.debug("Page loaded successfully")
     except TimeoutException:
         logger.warning(f"Page did not load within {timeout}s")
+        return
+
+    if tracker is None:
+        logger.debug("Page loaded successfully")
+    elif tracker.wait_for_idle(timeout=min(timeout, Config.NETWORK_IDLE_TIMEOUT)):
+        logger.debug("Page ready (network idle)")
@@ -0,0 +1,228 @@
+"""
+HTTP Record/Replay for Faberwork Test Automation
+Captures every response of a run into an on-disk archive and serves it back
+through the selenium-wire proxy, for hermetic runs without the live site
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from loguru import logger
+
+from .config import Config
+
+try:
+    from seleniumwire import webdriver as wire_webdriver
+except ImportError:
+    wire_webdriver = None
+
+
+# Headers describing the original connection, not the archived response
+_HOP_BY_HOP_HEADERS = {'connection', 'keep-alive', 'transfer-encoding', 'content-length',
+                       'proxy-authenticate', 'proxy-connection', 'upgrade'}
+
+
+def archive_key(method: str, url: str, body: bytes = b'') -> str:
+    """
+    Build the lookup key of a request
+
+    Query parameters are sorted and HTTP_ARCHIVE_IGNORE_PARAMS (cache busters) dropped.
+    The body hash is only added when a body is given.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        body: Request body
+
+    Returns:
+        str: Archive key
+    """
+    parts = urlsplit(url)
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name not in Config.HTTP_ARCHIVE_IGNORE_PARAMS
+    )
+    key = f"{method.upper()} {parts.scheme}://{parts.netloc}{parts.path}"
+    if query:
+        key += f"?{urlencode(query)}"
+    if body:
+        key += f" body:{hashlib.sha1(body).hexdigest()}"
+    return key
+
+
+class HttpArchive:
+    """
+    Record/replay layer on top of selenium-wire request/response interceptors
+
+    Entries are stored one file pair per key (<sha1>.json + <sha1>.body) so
+    parallel workers can record into the same directory. Requests with a
+    body are stored under the exact key and under the key without body;
+    replay tries the exact match first.
+    """
+
+    def __init__(self, mode: str = None, directory: Path = None, latency_ms: int = None):
+        """
+        Initialize the archive
+
+        Args:
+            mode: 'record' or 'replay' (defaults to Config.HTTP_ARCHIVE_MODE)
+            directory: Archive directory (defaults to Config.HTTP_ARCHIVE_DIR)
+            latency_ms: Delay added to every replayed response (defaults to Config.HTTP_ARCHIVE_LATENCY_MS)
+        """
+        self.mode = mode or Config.HTTP_ARCHIVE_MODE
+        self.directory = Path(directory or Config.HTTP_ARCHIVE_DIR)
+        self.latency_ms = Config.HTTP_ARCHIVE_LATENCY_MS if latency_ms is None else latency_ms
+        self.stats = {'recorded': 0, 'replayed': 0, 'unmatched': 0}
+        self.unmatched = []
+        self._lock = threading.Lock()
+
+    # ============================================
+    # Driver Wiring
+    # ============================================
+
+    def attach(self, driver) -> bool:
+        """
+        Install the record or replay interceptor on a selenium-wire driver
+
+        Args:
+            driver: selenium-wire WebDriver instance (see DriverFactory)
+
+        Returns:
+            bool: True if the interceptor was installed
+        """
+        if not hasattr(driver, 'request_interceptor'):
+            logger.warning(f"HTTP archive {self.mode} mode needs a selenium-wire driver - running live")
+            return False
+
+        if self.mode == 'record':
+            driver.response_interceptor = self._record
+        elif self.mode == 'replay':
+            if not self.directory.exists():
+                logger.warning(f"HTTP archive {self.directory} does not exist - every request will be unmatched")
+            driver.request_interceptor = self._replay
+        else:
+            return False
+
+        logger.info(f"HTTP archive {self.mode} mode: {self.directory}")
+        return True
+
+    # ============================================
+    # Storage
+    # ============================================
+
+    def _entry_path(self, key: str) -> Path:
+        """Path of an entry's metadata file (the body file uses the .body suffix)"""
+        return self.directory / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def _write_entry(self, key: str, entry: Dict[str, Any], body: bytes):
+        """Atomically write an entry and its body"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        meta_path = self._entry_path(key)
+        body_path = meta_path.with_suffix('.body')
+        for path, data in ((body_path, body), (meta_path, json.dumps(entry, indent=2).encode('utf-8'))):
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+
+    def _read_entry(self, key: str) -> Optional[tuple]:
+        """Read an entry and its body, None if the key is not archived"""
+        meta_path = self._entry_path(key)
+        try:
+            entry = json.loads(meta_path.read_text(encoding='utf-8'))
+            return entry, meta_path.with_suffix('.body').read_bytes()
+        except (FileNotFoundError, ValueError):
+            return None
+
+    # ============================================
+    # Interceptors
+    # ============================================
+
+    def _record(self, request, response):
+        """selenium-wire response interceptor: archive the response"""
+        # A 304 only makes sense for the conditional request that caused it
+        if response.status_code == 304:
+            return
+
+        entry = {
+            'url': request.url,
+            'method': request.method,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': [[name, value] for name, value in response.headers.items()
+                        if name.lower() not in _HOP_BY_HOP_HEADERS],
+        }
+        try:
+            self._write_entry(archive_key(request.method, request.url), entry, response.body)
+            if request.body:
+                self._write_entry(archive_key(request.method, request.url, request.body), entry, response.body)
+        except Exception as e:
+            logger.error(f"Failed to record {request.url}: {str(e)}")
+            return
+
+        with self._lock:
+            self.stats['recorded'] += 1
+
+    def _replay(self, request):
+        """selenium-wire request interceptor: answer from the archive"""
+        archived = None
+        if request.body:
+            archived = self._read_entry(archive_key(request.method, request.url, request.body))
+        archived = archived or self._read_entry(archive_key(request.method, request.url))
+
+        if archived is None:
+            with self._lock:
+                self.stats['unmatched'] += 1
+                self.unmatched.append(f"{request.method} {request.url}")
+            if Config.HTTP_ARCHIVE_UNMATCHED != 'passthrough':
+                request.create_response(status_code=404, headers={'X-Http-Archive': 'miss'}, body=b'')
+            return
+
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        entry, body = archived
+        headers = [(name, value) for name, value in entry['headers']] + [('Content-Length', str(len(body)))]
+        request.create_response(status_code=entry['status'], headers=headers, body=body)
+        with self._lock:
+            self.stats['replayed'] += 1
+
+    # ============================================
+    # Reporting
+    # ============================================
+
+    def write_unmatched_report(self, scenario_name: str):
+        """
+        Log this scenario's archive statistics and add its unmatched requests to the report
+
+        Args:
+            scenario_name: Name of the scenario that made the requests
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            unmatched = sorted(set(self.unmatched))
+            self.unmatched.clear()
+            self.stats = {'recorded': 0, 'replayed': 0, 'unmatched': 0}
+
+        if self.mode == 'record':
+            logger.info(f"HTTP archive: recorded {stats['recorded']} responses")
+            return
+
+        logger.info(f"HTTP archive: replayed {stats['replayed']} responses, {stats['unmatched']} unmatched")
+        if not unmatched:
+            return
+
+        for request in unmatched[:10]:
+            logger.warning(f"Unmatched request: {request}")
+
+        report_path = Config.HTTP_ARCHIVE_REPORT
+        try:
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(report_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'scenario': scenario_name, 'unmatched': unmatched}) + '\n')
+        except Exception as e:
+            logger.error(f"Failed to write unmatched request report: {str(e)}")
@@ -9,6 +9,8 @@ from selenium.common.exceptions import NoSuchElementException
 from typing import List, Tuple, Optional
 from loguru import logger
 
+from . import page_runtime
+
 
 class LocatorFinder:
     """Utility class for finding and validating element locators"""
@@ -207,6 +209,11 @@ class LocatorFinder:
             if element.tag_name == 'a' and element.text:
                 suggestions['LINK_TEXT'] = (By.LINK_TEXT, element.text)
 
+            # Structure (position below the closest ancestor with an id)
+            css_path = page_runtime.call(self.driver, 'cssPath', element)
+            if css_path:
+                suggestions['CSS_PATH'] = (By.CSS_SELECTOR, css_path)
+
             logger.info(f"Generated {len(suggestions)} locator suggestions")
             return suggestions
 
@@ -0,0 +1,174 @@
+"""
+Locator Timing for Faberwork Test Automation
+Records how long every waited-for locator took to appear (persisted across
+runs), derives per-locator timeouts from those latencies and reports
+locators that are consistently slow or never appear
+"""
+
+import json
+import math
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+from loguru import logger
+
+from .config import Config
+
+
+# Run statistics (one process)
+locator_timing_stats = {'waits': 0, 'adaptive': 0, 'timeouts': 0, 'saved_seconds': 0.0}
+
+
+def _locator_key(locator: Tuple[str, str]) -> str:
+    """Table key of a locator"""
+    by, value = locator
+    return f"{by}={value}"
+
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of a non-empty sample list"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class LocatorTimings:
+    """
+    Appearance latencies per locator
+
+    The table (LOCATOR_TIMINGS_FILE) keeps the last LOCATOR_TIMING_SAMPLES
+    latencies of every locator plus its timeouts since it last appeared.
+    Each run adds its own measurements when it saves, so parallel workers
+    merge instead of overwriting each other.
+    """
+
+    def __init__(self, path=None):
+        """
+        Initialize the table
+
+        Args:
+            path: JSON file (defaults to Config.LOCATOR_TIMINGS_FILE)
+        """
+        self.path = path or Config.LOCATOR_TIMINGS_FILE
+        self._history = self._load()
+        self._samples: Dict[str, List[float]] = {}
+        self._timeouts: Dict[str, int] = {}
+
+    def _load(self) -> dict:
+        """Load the persisted table"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Could not read locator timings: {str(e)}")
+            return {}
+
+    def _entry(self, key: str) -> dict:
+        """Persisted and current-run measurements of a locator together"""
+        history = self._history.get(key, {})
+        samples = history.get('samples', []) + self._samples.get(key, [])
+        timeouts = history.get('timeouts', 0)
+        if key in self._samples:
+            timeouts = 0
+        timeouts += self._timeouts.get(key, 0)
+        return {'samples': samples[-Config.LOCATOR_TIMING_SAMPLES:], 'timeouts': timeouts}
+
+    def record(self, locator: Tuple[str, str], seconds: float, found: bool):
+        """
+        Record one wait
+
+        Args:
+            locator: Tuple of (By, value)
+            seconds: Time until the condition was met (or the wait gave up)
+            found: False if the wait timed out
+        """
+        key = _locator_key(locator)
+        locator_timing_stats['waits'] += 1
+        if found:
+            self._samples.setdefault(key, []).append(round(seconds, 3))
+            self._timeouts.pop(key, None)
+        else:
+            self._timeouts[key] = self._timeouts.get(key, 0) + 1
+            locator_timing_stats['timeouts'] += 1
+
+    def timeout_for(self, locator: Tuple[str, str], default: float) -> float:
+        """
+        Timeout for a locator learned from its latencies
+
+        The ADAPTIVE_TIMEOUT_PERCENTILE latency times ADAPTIVE_TIMEOUT_FACTOR,
+        between ADAPTIVE_TIMEOUT_MIN and ADAPTIVE_TIMEOUT_MAX. A locator that
+        timed out ADAPTIVE_TIMEOUT_MIN_SAMPLES times in a row is given the
+        minimum. Too few measurements keep the default.
+
+        Args:
+            locator: Tuple of (By, value)
+            default: Timeout used without enough measurements
+
+        Returns:
+            float: Timeout in seconds
+        """
+        entry = self._entry(_locator_key(locator))
+        if entry['timeouts'] >= Config.ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+            return Config.ADAPTIVE_TIMEOUT_MIN
+        if len(entry['samples']) < Config.ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+            return default
+        learned = _percentile(entry['samples'], Config.ADAPTIVE_TIMEOUT_PERCENTILE) * Config.ADAPTIVE_TIMEOUT_FACTOR
+        return min(max(learned, Config.ADAPTIVE_TIMEOUT_MIN), Config.ADAPTIVE_TIMEOUT_MAX)
+
+    def report(self) -> Dict[str, List[dict]]:
+        """
+        Locators worth fixing
+
+        Returns:
+            dict: 'slow' (median latency of at least SLOW_LOCATOR_SECONDS) and
+                'broken' (timed out ADAPTIVE_TIMEOUT_MIN_SAMPLES times in a row), slowest first
+        """
+        slow, broken = [], []
+        for key in set(self._history) | set(self._samples) | set(self._timeouts):
+            entry = self._entry(key)
+            if entry['timeouts'] >= Config.ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+                broken.append({'locator': key, 'timeouts': entry['timeouts']})
+            elif entry['samples']:
+                median = _percentile(entry['samples'], 50)
+                if median >= Config.SLOW_LOCATOR_SECONDS:
+                    slow.append({'locator': key, 'median': median,
+                                 'p95': _percentile(entry['samples'], 95), 'samples': len(entry['samples'])})
+        slow.sort(key=lambda item: item['median'], reverse=True)
+        broken.sort(key=lambda item: item['timeouts'], reverse=True)
+        return {'slow': slow, 'broken': broken}
+
+    def save(self):
+        """Merge this run's measurements into the persisted table"""
+        if not self._samples and not self._timeouts:
+            return
+        self._history = self._load()
+        for key in set(self._samples) | set(self._timeouts):
+            self._history[key] = self._entry(key)
+        self._samples.clear()
+        self._timeouts.clear()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(self._history, indent=2, sort_keys=True), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Failed to save locator timings: {str(e)}")
+
+
+# One table per process
+_timings: Optional[LocatorTimings] = None
+
+
+def get_locator_timings() -> LocatorTimings:
+    """
+    Get the process-wide locator timing table
+
+    Returns:
+        LocatorTimings: Table loaded from LOCATOR_TIMINGS_FILE
+    """
+    global _timings
+    if _timings is None:
+        _timings = LocatorTimings()
+    return _timings
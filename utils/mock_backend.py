@@ -0,0 +1,283 @@
+"""
+Mock Backend for Faberwork Test Automation
+Local stub server for the consultation/contact/newsletter form submissions and
+the chatbot, so submit scenarios don't post to production
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, List, Dict, Any
+from urllib.parse import urlsplit, parse_qs
+from loguru import logger
+
+from .config import Config
+
+
+class _MockBackendHandler(BaseHTTPRequestHandler):
+    """Request handler of the mock backend, answers every method the same way"""
+
+    def _handle(self):
+        backend = self.server.backend
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        status, payload = backend.handle(self.command, self.path, dict(self.headers.items()), body)
+
+        if 'text/html' in self.headers.get('Accept', '') and self.command == 'POST':
+            content_type = 'text/html; charset=utf-8'
+            data = f"<html><body><p>{payload.get('message', '')}</p></body></html>".encode('utf-8')
+        else:
+            content_type = 'application/json'
+            data = json.dumps(payload).encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        """Route the server's access log to loguru"""
+        logger.debug(f"Mock backend: {format % args}")
+
+
+class MockBackend:
+    """
+    Local stub server standing in for the site's form and chatbot endpoints
+
+    Drivers are routed to it by a selenium-wire request interceptor (see
+    attach()), which rewrites matching requests to the local server. Every
+    request is captured so steps can assert on what the page submitted.
+    """
+
+    def __init__(self, latency_ms: int = None, error_rate: float = None):
+        """
+        Initialize the mock backend
+
+        Args:
+            latency_ms: Delay before every response (defaults to Config.MOCK_BACKEND_LATENCY_MS)
+            error_rate: Share of requests answered with a 500 (defaults to Config.MOCK_BACKEND_ERROR_RATE)
+        """
+        self.latency_ms = Config.MOCK_BACKEND_LATENCY_MS if latency_ms is None else latency_ms
+        self.error_rate = Config.MOCK_BACKEND_ERROR_RATE if error_rate is None else error_rate
+        self.requests: List[Dict[str, Any]] = []
+        self._forced_status: Optional[int] = None
+        self._lock = threading.Lock()
+        self._server = None
+        self._routes = [re.compile(pattern) for pattern in Config.MOCK_BACKEND_ROUTES]
+
+    # ============================================
+    # Server Lifecycle
+    # ============================================
+
+    @property
+    def url(self) -> Optional[str]:
+        """Base URL of the running server"""
+        if self._server is None:
+            return None
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """
+        Start the server in a background thread (no-op if already running)
+
+        Returns:
+            str: Base URL of the server
+        """
+        if self._server is None:
+            self._server = ThreadingHTTPServer(('127.0.0.1', Config.MOCK_BACKEND_PORT), _MockBackendHandler)
+            self._server.daemon_threads = True
+            self._server.backend = self
+            threading.Thread(target=self._server.serve_forever, name='mock-backend', daemon=True).start()
+            logger.info(f"Mock backend listening on {self.url}")
+        return self.url
+
+    def stop(self):
+        """Stop the server"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            logger.info("Mock backend stopped")
+
+    def reset(self):
+        """Clear captured requests and per-scenario overrides"""
+        with self._lock:
+            self.requests.clear()
+            self._forced_status = None
+        self.latency_ms = Config.MOCK_BACKEND_LATENCY_MS
+        self.error_rate = Config.MOCK_BACKEND_ERROR_RATE
+
+    def respond_with_status(self, status: Optional[int]):
+        """
+        Answer every following request with a fixed status (None restores normal answers)
+
+        Args:
+            status: HTTP status code
+        """
+        self._forced_status = status
+
+    # ============================================
+    # Routing
+    # ============================================
+
+    def routes(self, method: str, url: str) -> bool:
+        """
+        Check if a request should go to the mock backend
+
+        Args:
+            method: HTTP method
+            url: Request URL
+
+        Returns:
+            bool: True if "METHOD URL" matches one of MOCK_BACKEND_ROUTES
+        """
+        target = f"{method.upper()} {url}"
+        return any(route.search(target) for route in self._routes)
+
+    def attach(self, driver) -> bool:
+        """
+        Route a selenium-wire driver's matching requests to this server
+
+        An interceptor already installed on the driver (e.g. HTTP archive
+        replay) still handles every request that is not routed here.
+
+        Args:
+            driver: selenium-wire WebDriver instance
+
+        Returns:
+            bool: True if routing is active
+        """
+        if not hasattr(driver, 'request_interceptor'):
+            logger.warning("Mock backend needs a selenium-wire driver - requests go to production")
+            return False
+
+        base_url = self.start()
+        previous = driver.request_interceptor
+
+        def intercept(request):
+            if self.routes(request.method, request.url):
+                parts = urlsplit(request.url)
+                request.headers['X-Original-Url'] = request.url
+                request.url = f"{base_url}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+            elif previous is not None:
+                previous(request)
+
+        driver.request_interceptor = intercept
+        logger.info("Form and chatbot requests routed to the mock backend")
+        return True
+
+    # ============================================
+    # Request Handling
+    # ============================================
+
+    def handle(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> tuple:
+        """
+        Capture a request and build the stub answer
+
+        Args:
+            method: HTTP method
+            path: Request path with query string
+            headers: Request headers
+            body: Request body
+
+        Returns:
+            tuple: (status code, JSON payload)
+        """
+        captured = {
+            'method': method,
+            'path': urlsplit(path).path,
+            'url': headers.get('X-Original-Url', path),
+            'headers': headers,
+            'body': body.decode('utf-8', errors='replace'),
+            'data': self._parse_body(headers.get('Content-Type', ''), body),
+            'time': time.time(),
+        }
+        with self._lock:
+            self.requests.append(captured)
+
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        status = self._forced_status
+        if status is None and self.error_rate and random.random() < self.error_rate:
+            status = 500
+        if status is not None and status >= 400:
+            return status, {'success': False, 'message': 'Something went wrong. Please try again later.'}
+
+        lowered = captured['path'].lower()
+        if 'chat' in lowered:
+            reply = Config.MOCK_CHATBOT_REPLY
+            return status or 200, {'success': True, 'reply': reply, 'response': reply, 'message': reply}
+        if 'newsletter' in lowered or 'subscribe' in lowered:
+            return status or 200, {'success': True, 'message': 'Thank you for subscribing!'}
+        return status or 200, {'success': True, 'message': 'Thank you! Your message has been received.'}
+
+    @staticmethod
+    def _parse_body(content_type: str, body: bytes) -> Dict[str, Any]:
+        """Decode a JSON or form-encoded body into a dict (empty if it is neither)"""
+        text = body.decode('utf-8', errors='replace')
+        if 'json' in content_type:
+            try:
+                data = json.loads(text)
+                return data if isinstance(data, dict) else {'value': data}
+            except ValueError:
+                return {}
+        if 'x-www-form-urlencoded' in content_type:
+            return {name: values[-1] for name, values in parse_qs(text, keep_blank_values=True).items()}
+        return {}
+
+    # ============================================
+    # Assertions
+    # ============================================
+
+    def find_requests(self, method: str = None, path_contains: str = None, text: str = None) -> List[Dict[str, Any]]:
+        """
+        Get captured requests matching all given criteria
+
+        Args:
+            method: HTTP method
+            path_contains: Substring of the request path
+            text: Substring of the raw body or of a decoded field value (case-insensitive)
+
+        Returns:
+            list: Matching captured requests, oldest first
+        """
+        with self._lock:
+            captured = list(self.requests)
+
+        return [
+            request for request in captured
+            if (method is None or request['method'] == method.upper())
+            and (path_contains is None or path_contains in request['path'])
+            and (text is None or self._contains(request, text))
+        ]
+
+    @staticmethod
+    def _contains(request: Dict[str, Any], text: str) -> bool:
+        """Check the raw body or a decoded field value contains text (case-insensitive)"""
+        text = text.lower()
+        return text in request['body'].lower() or any(text in str(value).lower() for value in request['data'].values())
+
+
+_backend = None
+
+
+def get_mock_backend() -> MockBackend:
+    """
+    Get the process-wide mock backend (created on first use, started by attach())
+
+    Returns:
+        MockBackend: Mock backend
+    """
+    global _backend
+    if _backend is None:
+        _backend = MockBackend()
+    return _backend
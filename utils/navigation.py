@@ -0,0 +1,122 @@
+"""
+Navigation Reuse for Faberwork Test Automation
+Lets navigate_to skip reloading a page the browser is already on, as long as
+nothing has interacted with that document since it was loaded
+"""
+
+from typing import Dict
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from loguru import logger
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+
+from . import page_runtime
+
+
+# Per normalized URL: seconds the last real navigation took (estimate of what a reuse saves)
+_last_load_seconds: Dict[str, float] = {}
+
+# Reuse statistics over the whole run (one process)
+navigation_stats = {'navigations': 0, 'load_seconds': 0.0, 'reused': 0, 'saved_seconds': 0.0}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for "same page" comparisons
+
+    Lowercases scheme and host, drops default ports, the fragment and a
+    trailing slash, and sorts query parameters.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        str: Normalized URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = (parts.hostname or '').lower()
+    if parts.port and (scheme, parts.port) not in (('http', 80), ('https', 443)):
+        netloc += f":{parts.port}"
+    path = parts.path.rstrip('/') or '/'
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+def mark_clean(driver: WebDriver):
+    """
+    Mark the current document as freshly loaded and untouched
+
+    Args:
+        driver: WebDriver instance
+    """
+    try:
+        page_runtime.call(driver, 'markClean')
+    except WebDriverException as e:
+        logger.debug(f"Could not mark document clean: {str(e)}")
+
+
+def mark_dirty(driver: WebDriver):
+    """
+    Mark the current document as modified (for script changes, which fire no events)
+
+    Args:
+        driver: WebDriver instance
+    """
+    try:
+        page_runtime.call(driver, 'markDirty')
+    except WebDriverException as e:
+        logger.debug(f"Could not mark document dirty: {str(e)}")
+
+
+def can_reuse(driver: WebDriver, url: str) -> bool:
+    """
+    Check if the current document is an untouched copy of url loaded by navigate_to
+
+    Args:
+        driver: WebDriver instance
+        url: URL about to be navigated to
+
+    Returns:
+        bool: True if navigating to url can be skipped
+    """
+    try:
+        state = page_runtime.call(driver, 'navState')
+    except WebDriverException:
+        return False
+
+    return (
+        state['stamped']
+        and not state['dirty']
+        and normalize_url(state['href']) == normalize_url(url)
+    )
+
+
+def record_navigation(url: str, seconds: float):
+    """
+    Record a real navigation
+
+    Args:
+        url: URL navigated to
+        seconds: Time the navigation (including the readiness wait) took
+    """
+    navigation_stats['navigations'] += 1
+    navigation_stats['load_seconds'] += seconds
+    _last_load_seconds[normalize_url(url)] = seconds
+
+
+def record_reuse(url: str) -> float:
+    """
+    Record a skipped navigation
+
+    Args:
+        url: URL that was already loaded
+
+    Returns:
+        float: Estimated seconds saved (duration of the last real load of url)
+    """
+    saved = _last_load_seconds.get(normalize_url(url), 0.0)
+    navigation_stats['reused'] += 1
+    navigation_stats['saved_seconds'] += saved
+    logger.info(f"Already on {url} (untouched), skipped reload: ~{saved:.2f}s saved")
+    return saved
@@ -0,0 +1,136 @@
+"""
+Network-Idle Page Readiness for Faberwork Test Automation
+Declares a page ready once no tracked request has been in flight for a quiet window
+"""
+
+import re
+import time
+from typing import List
+from weakref import WeakKeyDictionary
+from loguru import logger
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .cdp import network_events
+from .config import Config
+
+
+class NetworkIdleTracker:
+    """Tracks in-flight requests of a driver from CDP Network events"""
+
+    def __init__(self, driver: WebDriver, ignore: List[str] = None, only: List[str] = None):
+        """
+        Initialize the tracker
+
+        Args:
+            driver: WebDriver instance
+            ignore: URL regex patterns that never block readiness (analytics, chat widgets)
+            only: If given, only requests matching one of these URL regex patterns are tracked
+        """
+        self.stream = network_events(driver)
+        self.ignore = [re.compile(p) for p in (Config.NETWORK_IDLE_IGNORE if ignore is None else ignore)]
+        self.only = [re.compile(p) for p in (Config.NETWORK_IDLE_ONLY if only is None else only)]
+        self.in_flight = {}
+        self.stream.subscribe(self._on_event)
+
+    @property
+    def available(self) -> bool:
+        """True if the driver delivers Network events"""
+        if self.stream.available is None:
+            self.stream.poll()
+        return self.stream.available
+
+    def _is_tracked(self, url: str) -> bool:
+        """Check if a request URL counts towards readiness"""
+        if url.startswith(('data:', 'blob:')):
+            return False
+        if self.only and not any(p.search(url) for p in self.only):
+            return False
+        return not any(p.search(url) for p in self.ignore)
+
+    def _on_event(self, method: str, params: dict):
+        """Update in-flight requests from a Network event"""
+        request_id = params.get('requestId')
+        if method == 'Network.requestWillBeSent':
+            url = params.get('request', {}).get('url', '')
+            if self._is_tracked(url):
+                self.in_flight[request_id] = (url, time.monotonic())
+        elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+            self.in_flight.pop(request_id, None)
+
+    def reset(self):
+        """Drop all events seen so far (call before navigating)"""
+        self.stream.poll()
+        self.in_flight.clear()
+
+    def pending(self) -> List[str]:
+        """
+        Get the URLs of tracked requests still in flight
+
+        Requests open longer than NETWORK_IDLE_MAX_REQUEST_SECONDS are treated
+        as long-lived (polling, streaming) and stop blocking readiness.
+
+        Returns:
+            list: In-flight request URLs
+        """
+        self.stream.poll()
+        cutoff = time.monotonic() - Config.NETWORK_IDLE_MAX_REQUEST_SECONDS
+        for request_id, (url, started) in list(self.in_flight.items()):
+            if started < cutoff:
+                logger.debug(f"Ignoring long-lived request: {url}")
+                del self.in_flight[request_id]
+        return [url for url, _ in self.in_flight.values()]
+
+    def wait_for_idle(self, quiet_ms: int = None, timeout: float = None) -> bool:
+        """
+        Wait until no tracked request has been in flight for a quiet window
+
+        Args:
+            quiet_ms: Quiet window in milliseconds
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            bool: True if the network went idle, False on timeout
+        """
+        quiet_ms = quiet_ms or Config.NETWORK_IDLE_QUIET_MS
+        timeout = timeout or Config.NETWORK_IDLE_TIMEOUT
+        start = time.monotonic()
+        idle_since = None
+
+        while True:
+            pending = self.pending()
+            now = time.monotonic()
+
+            if pending:
+                idle_since = None
+            elif idle_since is None:
+                idle_since = now
+            elif (now - idle_since) * 1000 >= quiet_ms:
+                logger.debug(f"Network idle after {(now - start) * 1000:.0f}ms")
+                return True
+
+            if now - start > timeout:
+                logger.warning(f"Network not idle within {timeout}s, {len(pending)} request(s) in flight: "
+                               f"{pending[:3]}")
+                return False
+
+            time.sleep(0.05)
+
+
+_trackers = WeakKeyDictionary()
+
+
+def network_idle_tracker(driver: WebDriver) -> NetworkIdleTracker:
+    """
+    Get the network-idle tracker of a driver (configured from Config)
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        NetworkIdleTracker: Tracker for this driver
+    """
+    tracker = _trackers.get(driver)
+    if tracker is None:
+        tracker = NetworkIdleTracker(driver)
+        _trackers[driver] = tracker
+    return tracker
@@ -0,0 +1,446 @@
+"""
+In-Page Runtime for Faberwork Test Automation
+Framework JavaScript registered once per document (window.__fw), so helpers
+call functions by name with compact arguments instead of shipping script
+text with every execute_script
+"""
+
+from loguru import logger
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .cdp import add_script_on_new_document
+
+
+# Bump when _RUNTIME_SCRIPT changes: documents holding another version get the current one
+RUNTIME_VERSION = 7
+
+_RUNTIME_SCRIPT = """
+(function () {
+    var VERSION = %d;
+    if (window.__fw && window.__fw.version === VERSION) { return; }
+
+    function nextFrame(fn) {
+        if (document.hidden) { setTimeout(fn, 16); } else { window.requestAnimationFrame(fn); }
+    }
+
+    // Counts the page's fetch/XHR requests in flight. Installed once per document and
+    // kept across runtime versions, so no request sent after installation is missed.
+    if (!window.__fwRequests) {
+        var requests = window.__fwRequests = {open: {}, seq: 0, lastEnd: 0};
+        var track = function () {
+            var id = ++requests.seq;
+            requests.open[id] = performance.now();
+            return function () {
+                if (id in requests.open) { delete requests.open[id]; requests.lastEnd = performance.now(); }
+            };
+        };
+        if (window.fetch) {
+            var nativeFetch = window.fetch;
+            window.fetch = function () {
+                var end = track(), promise;
+                try { promise = nativeFetch.apply(this, arguments); } catch (e) { end(); throw e; }
+                promise.then(end, end);
+                return promise;
+            };
+        }
+        var nativeSend = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            var end = track();
+            this.addEventListener('loadend', end);
+            try { return nativeSend.apply(this, arguments); } catch (e) { end(); throw e; }
+        };
+    }
+
+    var fns = {};
+
+    // Scrolls (instantly or smoothly), then resolves once the scroll offsets and the
+    // target's bounding box have been identical for a few consecutive frames.
+    fns.scrollSettle = function (target, mode, behavior, maxMs, done) {
+        if (mode === 'element') {
+            target.scrollIntoView({behavior: behavior, block: 'center', inline: 'nearest'});
+        } else {
+            var top = mode === 'top' ? 0 : Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);
+            window.scrollTo({top: top, left: 0, behavior: behavior});
+        }
+        var start = performance.now(), last = null, stableFrames = 0;
+        function sample() {
+            var rect = target ? target.getBoundingClientRect() : {top: 0, left: 0};
+            return [window.scrollX, window.scrollY, rect.top, rect.left].join(',');
+        }
+        function check() {
+            var current = sample();
+            stableFrames = current === last ? stableFrames + 1 : 0;
+            last = current;
+            var elapsed = performance.now() - start;
+            if (stableFrames >= 2 || elapsed > maxMs) {
+                done({settled: stableFrames >= 2, elapsed: elapsed});
+                return;
+            }
+            nextFrame(check);
+        }
+        nextFrame(check);
+    };
+
+    // Resolves once no finite CSS animation/transition is running in the subtree of
+    // root and every observed transitionrun has seen its transitionend.
+    fns.animationsSettled = function (root, maxMs, done) {
+        root = root || document.documentElement;
+        var pendingTransitions = 0, quietFrames = 0, idleFrames = 0, start = performance.now();
+        function inRoot(event) { return event.target instanceof Node && root.contains(event.target); }
+        function onRun(event) { if (inRoot(event)) { pendingTransitions++; } }
+        function onEnd(event) { if (inRoot(event)) { pendingTransitions = Math.max(0, pendingTransitions - 1); } }
+        document.addEventListener('transitionrun', onRun, true);
+        document.addEventListener('transitionend', onEnd, true);
+        document.addEventListener('transitioncancel', onEnd, true);
+        function runningAnimations() {
+            if (!root.isConnected || !root.getAnimations) { return 0; }
+            return root.getAnimations({subtree: true}).filter(function (animation) {
+                if (animation.playState !== 'running' && !animation.pending) { return false; }
+                var timing = animation.effect ? animation.effect.getComputedTiming() : {};
+                return timing.iterations !== Infinity;
+            }).length;
+        }
+        function finish(settled) {
+            document.removeEventListener('transitionrun', onRun, true);
+            document.removeEventListener('transitionend', onEnd, true);
+            document.removeEventListener('transitioncancel', onEnd, true);
+            done({settled: settled, elapsed: performance.now() - start});
+        }
+        function check() {
+            var running = runningAnimations();
+            idleFrames = running === 0 ? idleFrames + 1 : 0;
+            if (idleFrames >= 10) { pendingTransitions = 0; }
+            quietFrames = running === 0 && pendingTransitions === 0 ? quietFrames + 1 : 0;
+            if (quietFrames >= 2) { finish(true); return; }
+            if (performance.now() - start > maxMs) { finish(false); return; }
+            nextFrame(check);
+        }
+        nextFrame(check);
+    };
+
+    // Arms a MutationObserver and records the first matching mutation. Watches live
+    // on window.__fwDomWatches so they survive between the arm and wait calls.
+    fns.armDomChange = function (root, types, match) {
+        root = root || document.documentElement;
+        var watches = window.__fwDomWatches = window.__fwDomWatches || {};
+        window.__fwDomWatchSeq = (window.__fwDomWatchSeq || 0) + 1;
+        var token = 'watch-' + window.__fwDomWatchSeq;
+        var watch = {start: performance.now(), hit: null, waiter: null};
+        function matches(record) {
+            if (!match) { return true; }
+            // Only inserted subtrees can bring a match in from below; attribute and text
+            // changes count when they happen on or inside a matching element
+            var added = record.type === 'childList';
+            var nodes = added ? Array.prototype.slice.call(record.addedNodes) : [record.target];
+            return nodes.some(function (node) {
+                var el = node.nodeType === 1 ? node : node.parentElement;
+                return el && (el.matches(match) || el.closest(match) ||
+                              (added && node.nodeType === 1 && el.querySelector(match)));
+            });
+        }
+        watch.observer = new MutationObserver(function (records) {
+            if (watch.hit) { return; }
+            for (var i = 0; i < records.length; i++) {
+                var record = records[i];
+                if (record.type === 'childList' && !record.addedNodes.length) { continue; }
+                if (!matches(record)) { continue; }
+                watch.hit = {type: record.type, elapsed_ms: performance.now() - watch.start,
+                             attribute: record.attributeName || null};
+                if (watch.waiter) { watch.waiter(); }
+                return;
+            }
+        });
+        watch.observer.observe(root, {
+            subtree: true,
+            childList: types.indexOf('childList') >= 0,
+            characterData: types.indexOf('characterData') >= 0,
+            attributes: types.indexOf('attributes') >= 0
+        });
+        watches[token] = watch;
+        return token;
+    };
+
+    fns.waitDomChange = function (token, maxMs, done) {
+        var watch = (window.__fwDomWatches || {})[token];
+        if (!watch) { done(null); return; }
+        function finish() {
+            watch.observer.disconnect();
+            delete window.__fwDomWatches[token];
+            done(watch.hit || {type: null, elapsed_ms: performance.now() - watch.start});
+        }
+        if (watch.hit) { finish(); return; }
+        var timer = setTimeout(finish, maxMs);
+        watch.waiter = function () { clearTimeout(timer); finish(); };
+    };
+
+    // Marks the document as freshly loaded and untouched. Any user-level interaction
+    // (typing, clicking, focusing, hovering, submitting) marks it dirty.
+    fns.markClean = function () {
+        if (window.__fwNavState) { return; }
+        var state = window.__fwNavState = {dirty: false, href: location.href};
+        ['input', 'change', 'submit', 'keydown', 'pointerdown', 'mousedown', 'click', 'focusin',
+         'mouseover', 'touchstart'].forEach(function (type) {
+            document.addEventListener(type, function () { state.dirty = true; }, true);
+        });
+    };
+
+    // For changes that fire no events (scripts run by the tests)
+    fns.markDirty = function () {
+        if (window.__fwNavState) { window.__fwNavState.dirty = true; }
+    };
+
+    fns.navState = function () {
+        var state = window.__fwNavState;
+        return {
+            href: location.href,
+            stamped: !!state,
+            dirty: state ? state.dirty || state.href !== location.href : true
+        };
+    };
+
+    function isVisible(el) {
+        if (el.checkVisibility) {
+            return el.checkVisibility({checkOpacity: true, checkVisibilityCSS: true});
+        }
+        var style = window.getComputedStyle(el);
+        return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0';
+    }
+
+    // Serializes a clone of the document with visibility/value annotations and starts
+    // counting mutations of the live document, which invalidate the snapshot.
+    fns.captureSnapshot = function (visibleAttribute, valueAttribute) {
+        var root = document.documentElement;
+        var clone = root.cloneNode(true);
+        var originals = [root].concat(Array.prototype.slice.call(root.querySelectorAll('*')));
+        var copies = [clone].concat(Array.prototype.slice.call(clone.querySelectorAll('*')));
+        for (var i = 0; i < originals.length && i < copies.length; i++) {
+            var el = originals[i], copy = copies[i];
+            copy.setAttribute(visibleAttribute, isVisible(el) ? '1' : '0');
+            if ('value' in el && (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA' || el.tagName === 'SELECT')) {
+                copy.setAttribute(valueAttribute, el.value);
+            }
+            if (el.tagName === 'SCRIPT') {
+                copy.textContent = '';
+            }
+        }
+        if (window.__fwSnapshotObserver) { window.__fwSnapshotObserver.disconnect(); }
+        window.__fwSnapshotMutations = 0;
+        window.__fwSnapshotObserver = new MutationObserver(function (records) {
+            window.__fwSnapshotMutations += records.length;
+        });
+        window.__fwSnapshotObserver.observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+        return {html: clone.outerHTML, url: location.href, origin: performance.timeOrigin};
+    };
+
+    // Document identity and mutations since the last capture
+    fns.snapshotState = function () {
+        return {
+            origin: performance.timeOrigin,
+            mutations: window.__fwSnapshotObserver ? window.__fwSnapshotMutations : -1
+        };
+    };
+
+    // Requests in flight for less than maxRequestMs (longer ones are polling/streaming)
+    function pendingRequests(maxRequestMs) {
+        var cutoff = performance.now() - maxRequestMs, open = window.__fwRequests.open;
+        return Object.keys(open).filter(function (id) { return open[id] >= cutoff; }).length;
+    }
+
+    fns.pendingRequests = pendingRequests;
+
+    // Resolves as soon as a visible element matches css (present), or once none
+    // has, no request is in flight and neither the DOM nor a response has changed
+    // anything for quietMs (absent and settled).
+    fns.absenceSettled = function (css, quietMs, maxMs, maxRequestMs, done) {
+        var start = performance.now(), lastMutation = start;
+        var observer = new MutationObserver(function () { lastMutation = performance.now(); });
+        observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+        function finish(present, settled) {
+            observer.disconnect();
+            done({present: present, settled: settled, elapsed: performance.now() - start});
+        }
+        function check() {
+            var now = performance.now();
+            var quietSince = Math.max(lastMutation, window.__fwRequests.lastEnd);
+            if (Array.prototype.some.call(document.querySelectorAll(css), isVisible)) { finish(true, true); return; }
+            if (now - quietSince >= quietMs && !pendingRequests(maxRequestMs)) { finish(false, true); return; }
+            if (now - start > maxMs) { finish(false, false); return; }
+            setTimeout(check, 25);
+        }
+        check();
+    };
+
+    // Queries are [kind, expression] pairs, kind 'css' or 'xpath'
+    function queryAll(query) {
+        if (query[0] === 'css') { return Array.prototype.slice.call(document.querySelectorAll(query[1])); }
+        var result = document.evaluate(query[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) {
+            if (result.snapshotItem(i).nodeType === 1) { nodes.push(result.snapshotItem(i)); }
+        }
+        return nodes;
+    }
+
+    function tryQueryAll(query) {
+        try { return queryAll(query); } catch (e) { return []; }
+    }
+
+    // First query (in order) that matches anything, with its first element
+    fns.queryFirst = function (queries) {
+        for (var i = 0; i < queries.length; i++) {
+            var nodes = tryQueryAll(queries[i]);
+            if (nodes.length) { return {index: i, element: nodes[0]}; }
+        }
+        return null;
+    };
+
+    // For each query, whether it matches el and nothing else
+    fns.uniqueMatches = function (el, queries) {
+        return queries.map(function (query) {
+            var nodes = tryQueryAll(query);
+            return nodes.length === 1 && nodes[0] === el;
+        });
+    };
+
+    // Cost of one query: rounds of batch runs each (timer resolution is coarse),
+    // with the per-run median and the matches of the last run
+    fns.measureQuery = function (query, rounds, batch) {
+        var nodes, times = [];
+        try { nodes = queryAll(query); } catch (e) { return {error: String(e.message || e)}; }
+        for (var r = 0; r < rounds; r++) {
+            var start = performance.now();
+            for (var b = 0; b < batch; b++) { nodes = queryAll(query); }
+            times.push((performance.now() - start) / batch);
+        }
+        times.sort(function (a, b) { return a - b; });
+        return {
+            median_ms: times[Math.floor(times.length / 2)],
+            max_ms: times[times.length - 1],
+            matches: nodes.length,
+            visible: nodes.filter(isVisible).length,
+            first: nodes[0] || null
+        };
+    };
+
+    // Structural CSS path from the closest ancestor with an id (or the body)
+    fns.cssPath = function (el) {
+        var parts = [];
+        while (el && el.nodeType === 1 && el !== document.body && el !== document.documentElement) {
+            if (el.id) { parts.unshift('#' + CSS.escape(el.id)); return parts.join(' > '); }
+            var index = 1, sibling = el;
+            while ((sibling = sibling.previousElementSibling)) {
+                if (sibling.tagName === el.tagName) { index++; }
+            }
+            parts.unshift(el.tagName.toLowerCase() + ':nth-of-type(' + index + ')');
+            el = el.parentElement;
+        }
+        parts.unshift('body');
+        return parts.join(' > ');
+    };
+
+    fns.click = function (el) { fns.markDirty(); el.click(); };
+
+    fns.setStyle = function (el, style) {
+        if (style === null) { el.removeAttribute('style'); } else { el.setAttribute('style', style); }
+    };
+
+    window.__fw = {
+        version: VERSION,
+        call: function (name, args) {
+            var result = fns[name].apply(null, args);
+            return result === undefined ? null : result;
+        },
+        callAsync: function (name, args, done) {
+            fns[name].apply(null, args.concat([done]));
+        }
+    };
+})();
+""" % RUNTIME_VERSION
+
+# Answer of the call stubs when the document has no (or another) runtime version
+_MISSING = '__fw_missing__'
+
+_CALL_SCRIPT = (
+    "var fw = window.__fw; return fw && fw.version === %d ? fw.call(arguments[0], arguments[1]) : '%s';"
+    % (RUNTIME_VERSION, _MISSING)
+)
+
+_CALL_ASYNC_SCRIPT = (
+    "var done = arguments[arguments.length - 1], fw = window.__fw;"
+    " if (fw && fw.version === %d) { fw.callAsync(arguments[0], arguments[1], done); } else { done('%s'); }"
+    % (RUNTIME_VERSION, _MISSING)
+)
+
+# Run statistics (one process)
+runtime_stats = {'calls': 0, 'injections': 0}
+
+
+def install_runtime(driver: WebDriver) -> bool:
+    """
+    Register the runtime for every new document of a driver (Chromium only)
+
+    Other browsers, and documents that lost the runtime, get it injected by
+    the first call that misses it.
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        bool: True if the runtime was registered
+    """
+    registered = add_script_on_new_document(driver, _RUNTIME_SCRIPT) is not None
+    if registered:
+        logger.debug(f"Registered in-page runtime v{RUNTIME_VERSION}")
+    return registered
+
+
+def inject_runtime(driver: WebDriver):
+    """
+    Inject the runtime into the current document
+
+    Args:
+        driver: WebDriver instance
+    """
+    driver.execute_script(_RUNTIME_SCRIPT)
+    runtime_stats['injections'] += 1
+    logger.debug(f"Injected in-page runtime v{RUNTIME_VERSION} into the current document")
+
+
+def call(driver: WebDriver, name: str, *args):
+    """
+    Call a runtime function in the current document
+
+    Args:
+        driver: WebDriver instance
+        name: Runtime function name
+        *args: Arguments (elements are passed as usual)
+
+    Returns:
+        Return value of the function
+    """
+    runtime_stats['calls'] += 1
+    result = driver.execute_script(_CALL_SCRIPT, name, list(args))
+    if result == _MISSING:
+        inject_runtime(driver)
+        result = driver.execute_script(_CALL_SCRIPT, name, list(args))
+    return result
+
+
+def call_async(driver: WebDriver, name: str, *args):
+    """
+    Call an asynchronous runtime function (its last parameter is the callback)
+
+    Args:
+        driver: WebDriver instance
+        name: Runtime function name
+        *args: Arguments before the callback
+
+    Returns:
+        Value the function passed to its callback
+    """
+    runtime_stats['calls'] += 1
+    result = driver.execute_async_script(_CALL_ASYNC_SCRIPT, name, list(args))
+    if result == _MISSING:
+        inject_runtime(driver)
+        result = driver.execute_async_script(_CALL_ASYNC_SCRIPT, name, list(args))
+    return result
@@ -0,0 +1,132 @@
+"""
+Page Readiness Contracts for Faberwork Test Automation
+Waits for the locators/conditions a page object declares as "usable" and
+logs how much earlier than the full load event that was
+"""
+
+from typing import Callable, Optional, Sequence, Union
+from weakref import WeakKeyDictionary
+from loguru import logger
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from .config import Config
+
+
+# A contract entry is a (By, value) locator that must be visible, or a callable taking the driver
+ReadyCondition = Union[tuple, Callable[[WebDriver], bool]]
+
+# Navigation start (performance.timeOrigin) of the document a driver is on
+_TIME_ORIGIN_SCRIPT = "return performance.timeOrigin;"
+
+# Time the load event finished, or now if the page is still loading (both relative to navigation start)
+_LOAD_EVENT_END_SCRIPT = """
+var entry = performance.getEntriesByType('navigation')[0];
+return {loadEventEnd: entry ? entry.loadEventEnd : 0, now: performance.now()};
+"""
+
+# Per-driver navigation waiting for its savings to be measured: contract time in ms since navigation start
+_pending_marks = WeakKeyDictionary()
+
+# Savings over the whole run (one process)
+readiness_stats = {'navigations': 0, 'saved_seconds': 0.0}
+
+
+def get_time_origin(driver: WebDriver) -> Optional[float]:
+    """
+    Get the navigation start of the current document
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        float: performance.timeOrigin, or None if it could not be read
+    """
+    try:
+        return driver.execute_script(_TIME_ORIGIN_SCRIPT)
+    except WebDriverException:
+        return None
+
+
+def wait_for_ready_contract(
+    driver: WebDriver,
+    conditions: Sequence[ReadyCondition],
+    timeout: int = None,
+    previous_origin: float = None
+) -> bool:
+    """
+    Wait until every condition of a readiness contract holds
+
+    With the 'eager'/'none' page load strategy navigation returns before the
+    load event, so this is what makes the page usable. previous_origin guards
+    against checking the old document before the new one has committed.
+
+    Args:
+        driver: WebDriver instance
+        conditions: Locators that must be visible and/or callables taking the driver
+        timeout: Maximum wait time in seconds
+        previous_origin: get_time_origin() before the navigation was started
+
+    Returns:
+        bool: True if the contract holds, False on timeout
+    """
+    timeout = timeout or Config.PAGE_LOAD_TIMEOUT
+
+    def contract_holds(d):
+        if previous_origin is not None and get_time_origin(d) == previous_origin:
+            return False
+        for condition in conditions:
+            if callable(condition):
+                if not condition(d):
+                    return False
+            elif not EC.visibility_of_element_located(condition)(d):
+                return False
+        return True
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(contract_holds)
+    except TimeoutException:
+        logger.warning(f"Readiness contract not met within {timeout}s: {list(conditions)}")
+        return False
+
+    try:
+        _pending_marks[driver] = driver.execute_script("return performance.now();")
+    except WebDriverException:
+        pass
+
+    logger.debug("Page ready (contract met)")
+    return True
+
+
+def record_readiness_savings(driver: WebDriver) -> float:
+    """
+    Measure how much earlier than the load event the last contract was met
+
+    Call before leaving the page (next navigation, end of scenario): by then
+    the load event has usually fired, otherwise the time until now is counted.
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        float: Seconds saved on the last navigation (0 if nothing to measure)
+    """
+    ready_ms = _pending_marks.pop(driver, None)
+    if ready_ms is None:
+        return 0.0
+
+    try:
+        timing = driver.execute_script(_LOAD_EVENT_END_SCRIPT)
+    except WebDriverException:
+        return 0.0
+
+    load_ms = timing['loadEventEnd'] or timing['now']
+    saved = max(0.0, (load_ms - ready_ms) / 1000)
+
+    readiness_stats['navigations'] += 1
+    readiness_stats['saved_seconds'] += saved
+    logger.info(f"Readiness contract met at {ready_ms:.0f}ms, load event at "
+                f"{'>=' if not timing['loadEventEnd'] else ''}{load_ms:.0f}ms: saved {saved:.2f}s")
+    return saved
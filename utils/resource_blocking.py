@@ -0,0 +1,114 @@
+"""
+Blocked Request Counters for Faberwork Test Automation
+Counts requests blocked by DriverFactory.block_resources and estimates the bytes saved
+"""
+
+import json
+import os
+import threading
+from fnmatch import fnmatchcase
+from typing import List
+from urllib.parse import urlsplit
+from loguru import logger
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .cdp import network_events
+from .config import Config
+from .driver_factory import RESOURCE_BLOCKING_PROFILES
+
+
+def _size_key(url: str) -> str:
+    """URL without query string and fragment, used as resource size table key"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+class BlockedRequestCounter:
+    """
+    Counts blocked requests of a driver session from CDP Network events
+
+    A blocked request never reports its size, so bytes saved are estimated
+    from a table of encoded response sizes learned from unblocked loads
+    (RESOURCE_SIZES_FILE). Only URLs the patterns can block are learned,
+    so the table stays limited to the resources it prices.
+    """
+
+    def __init__(self, driver: WebDriver, patterns: List[str] = None):
+        """
+        Initialize the counter and start listening
+
+        Args:
+            driver: WebDriver instance
+            patterns: Blockable URL wildcards (defaults to the 'default' profile plus BLOCKED_URL_PATTERNS)
+        """
+        self.patterns = patterns or RESOURCE_BLOCKING_PROFILES['default'] + Config.BLOCKED_URL_PATTERNS
+        self.stream = network_events(driver)
+        self.blocked = 0
+        self.bytes_saved = 0
+        self.unknown_size = 0
+        self._urls = {}
+        self._learned = {}
+        self._known_sizes = self._load_sizes()
+        self.stream.subscribe(self._on_event)
+
+    @staticmethod
+    def _load_sizes() -> dict:
+        """Load the learned resource size table"""
+        try:
+            with open(Config.RESOURCE_SIZES_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Could not read resource sizes: {str(e)}")
+            return {}
+
+    def _on_event(self, method: str, params: dict):
+        """Count a Network event"""
+        request_id = params.get('requestId')
+        if method == 'Network.requestWillBeSent':
+            self._urls[request_id] = params.get('request', {}).get('url', '')
+        elif method == 'Network.loadingFinished':
+            url = self._urls.pop(request_id, None)
+            size = params.get('encodedDataLength')
+            if url and size and any(fnmatchcase(url, pattern) for pattern in self.patterns):
+                self._learned[_size_key(url)] = int(size)
+        elif method == 'Network.loadingFailed':
+            url = self._urls.pop(request_id, None)
+            if not params.get('blockedReason'):
+                return
+            self.blocked += 1
+            size = self._learned.get(_size_key(url or '')) or self._known_sizes.get(_size_key(url or ''))
+            if size:
+                self.bytes_saved += size
+            else:
+                self.unknown_size += 1
+
+    def finish(self) -> dict:
+        """
+        Stop counting, persist learned sizes and return the counters
+
+        Returns:
+            dict: blocked requests, estimated bytes saved and blocked requests of unknown size
+        """
+        self.stream.poll()
+        self.stream.unsubscribe(self._on_event)
+
+        if self._learned:
+            sizes = self._load_sizes()
+            sizes.update(self._learned)
+            path = Config.RESOURCE_SIZES_FILE
+            try:
+                # Replace the file in one step, parallel workers never read a half-written table
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp_path.write_text(json.dumps(sizes, indent=2, sort_keys=True), encoding='utf-8')
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.error(f"Failed to save resource sizes: {str(e)}")
+
+        return {
+            'blocked': self.blocked,
+            'bytes_saved': self.bytes_saved,
+            'unknown_size': self.unknown_size,
+        }
@@ -0,0 +1,157 @@
+"""
+Scenario Scheduler for Faberwork Test Automation
+Orders scenarios so those starting from the same page/state run back to back
+(warm HTTP/asset caches, shared sessions)
+"""
+
+from pathlib import Path
+from typing import Dict, List, Sequence
+from loguru import logger
+
+from behave.parser import parse_file
+
+
+# Scheduling statistics over the whole run (one process)
+schedule_stats = {'features': 0, 'transitions_before': 0, 'transitions_after': 0}
+
+
+def starting_state(scenario) -> str:
+    """
+    Describe the state a scenario starts from
+
+    The state is the Background's Given steps followed by the scenario's
+    leading Given steps (for an outline: its step templates, so all rows
+    share one state).
+
+    Args:
+        scenario: Behave Scenario or ScenarioOutline
+
+    Returns:
+        str: Normalized starting state
+    """
+    steps = []
+    background = getattr(scenario, 'background', None) or getattr(scenario.feature, 'background', None)
+    if background is not None:
+        steps.extend(step for step in background.steps if step.step_type == 'given')
+
+    for step in scenario.steps:
+        if step.step_type != 'given':
+            break
+        steps.append(step)
+
+    return ' | '.join(' '.join(step.name.lower().split()) for step in steps)
+
+
+def count_transitions(scenarios: Sequence) -> int:
+    """
+    Count how often the starting state changes from one scenario to the next
+
+    Args:
+        scenarios: Scenarios in run order
+
+    Returns:
+        int: Number of state changes (the first scenario counts as one)
+    """
+    transitions = 0
+    previous = None
+    for scenario in scenarios:
+        state = starting_state(scenario)
+        if state != previous:
+            transitions += 1
+        previous = state
+    return transitions
+
+
+def schedule_by_state(scenarios: Sequence) -> List:
+    """
+    Group scenarios by starting state
+
+    Groups keep the order of their first scenario and scenarios keep their
+    file order inside a group, so the schedule is deterministic.
+
+    Args:
+        scenarios: Scenarios in file order
+
+    Returns:
+        list: Scenarios in run order
+    """
+    groups: Dict[str, List] = {}
+    for scenario in scenarios:
+        groups.setdefault(starting_state(scenario), []).append(scenario)
+    return [scenario for group in groups.values() for scenario in group]
+
+
+def schedule_feature(feature) -> int:
+    """
+    Reorder a feature's scenarios in place by starting state
+
+    Call from before_feature: behave iterates feature.scenarios after the hook.
+
+    Args:
+        feature: Behave Feature
+
+    Returns:
+        int: State changes saved by the new order
+    """
+    before = count_transitions(feature.scenarios)
+    feature.scenarios[:] = schedule_by_state(feature.scenarios)
+    after = count_transitions(feature.scenarios)
+
+    schedule_stats['features'] += 1
+    schedule_stats['transitions_before'] += before
+    schedule_stats['transitions_after'] += after
+    if before != after:
+        logger.info(f"Scheduled {len(feature.scenarios)} scenarios by starting state: "
+                    f"{before} -> {after} state changes")
+    return before - after
+
+
+def schedule_feature_files(feature_files: Sequence[Path]) -> List[Path]:
+    """
+    Order feature files so files starting from the same state are submitted together
+
+    A file's state is the starting state of its first scenario.
+
+    Args:
+        feature_files: Feature files
+
+    Returns:
+        list: Feature files in submission order
+    """
+    states = {}
+    for feature_file in feature_files:
+        try:
+            feature = parse_file(str(feature_file))
+            states[feature_file] = starting_state(feature.scenarios[0]) if feature and feature.scenarios else ''
+        except Exception as e:
+            logger.warning(f"Could not parse {feature_file} for scheduling: {str(e)}")
+            states[feature_file] = ''
+
+    groups: Dict[str, List[Path]] = {}
+    for feature_file in feature_files:
+        groups.setdefault(states[feature_file], []).append(feature_file)
+    return [feature_file for group in groups.values() for feature_file in group]
+
+
+def estimate_schedule_savings(feature_files: Sequence[Path]) -> Dict[str, int]:
+    """
+    Count state changes within the given feature files before and after scheduling
+
+    Args:
+        feature_files: Feature files
+
+    Returns:
+        dict: 'transitions_before', 'transitions_after' and 'saved' over all files
+    """
+    before = after = 0
+    for feature_file in feature_files:
+        try:
+            feature = parse_file(str(feature_file))
+        except Exception as e:
+            logger.warning(f"Could not parse {feature_file} for scheduling: {str(e)}")
+            continue
+        if not feature:
+            continue
+        before += count_transitions(feature.scenarios)
+        after += count_transitions(schedule_by_state(feature.scenarios))
+    return {'transitions_before': before, 'transitions_after': after, 'saved': before - after}
@@ -0,0 +1,265 @@
+"""
+Self-Healing Locators for Faberwork Test Automation
+Learns ranked alternate locators for every element page objects find, and
+when a locator breaks after a site change, finds its element through the
+alternates in one in-page query instead of failing after a full timeout
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+from loguru import logger
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import WebDriverException
+
+from .config import Config
+from . import page_runtime
+from .dom_snapshot import xpath_literal
+from .locator_finder import LocatorFinder
+
+
+# Most to least robust: ids and test ids survive redesigns, structure rarely does
+_STRATEGY_RANK = ['ID', 'DATA_TESTID', 'NAME', 'LINK_TEXT', 'XPATH_TEXT', 'CSS_CLASS', 'CSS_PATH']
+
+# Run statistics (one process)
+self_healing_stats = {'learned': 0, 'healed': 0, 'cached_heals': 0}
+
+
+def _locator_key(locator: Tuple[str, str]) -> str:
+    """Table key of a locator"""
+    by, value = locator
+    return f"{by}={value}"
+
+
+def to_query(locator: Tuple[str, str]) -> Optional[List[str]]:
+    """
+    Translate a locator into an in-page query
+
+    Args:
+        locator: Tuple of (By, value)
+
+    Returns:
+        list: ['css', selector] or ['xpath', expression], None for unsupported strategies
+    """
+    by, value = locator
+    quoted = value.replace('\\', '\\\\').replace('"', '\\"')
+    if by == By.CSS_SELECTOR:
+        return ['css', value]
+    if by == By.ID:
+        return ['css', f'[id="{quoted}"]']
+    if by == By.NAME:
+        return ['css', f'[name="{quoted}"]']
+    if by == By.CLASS_NAME:
+        return ['css', f'[class~="{quoted}"]']
+    if by == By.TAG_NAME:
+        return ['css', value]
+    if by == By.XPATH:
+        return ['xpath', value]
+    if by == By.LINK_TEXT:
+        return ['xpath', f"//a[normalize-space(.)={xpath_literal(value)}]"]
+    if by == By.PARTIAL_LINK_TEXT:
+        return ['xpath', f"//a[contains(normalize-space(.), {xpath_literal(value)})]"]
+    return None
+
+
+class LocatorHealer:
+    """
+    Alternate locators and healed winners, per page-object locator
+
+    The table (SELF_HEALING_FILE) holds, for every locator, the alternates
+    learned the first time it resolved. Each alternate is checked in the
+    page to match that element and nothing else, and is only tried on the
+    page (URL path) it was learned on. When a locator heals, the
+    winning alternate is stored too, so later scenarios use it directly and
+    the drift is reported until the page object is fixed.
+    """
+
+    def __init__(self, path=None):
+        """
+        Initialize the table
+
+        Args:
+            path: JSON file (defaults to Config.SELF_HEALING_FILE)
+        """
+        self.path = path or Config.SELF_HEALING_FILE
+        self._table = self._load()
+        self._changed = set()
+
+    def _load(self) -> dict:
+        """Load the persisted table"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Could not read locator alternates: {str(e)}")
+            return {}
+
+    def knows(self, locator: Tuple[str, str]) -> bool:
+        """True if the alternates of a locator were learned (possibly none)"""
+        return _locator_key(locator) in self._table
+
+    @staticmethod
+    def _learned_here(entry: dict, driver: WebDriver) -> bool:
+        """True if an entry was learned on the current page (URL path)"""
+        return entry.get('page') == urlsplit(driver.current_url).path
+
+    def winner(self, locator: Tuple[str, str], driver: WebDriver) -> Optional[Tuple[str, str]]:
+        """
+        Alternate that healed a locator before, on the current page
+
+        Args:
+            locator: Tuple of (By, value)
+            driver: WebDriver instance
+
+        Returns:
+            tuple: Winning (By, value), or None if the locator never healed
+                or was learned on another page
+        """
+        entry = self._table.get(_locator_key(locator), {})
+        winner = entry.get('winner')
+        if not winner or not self._learned_here(entry, driver):
+            return None
+        return tuple(winner)
+
+    def learn(self, driver: WebDriver, locator: Tuple[str, str], element: WebElement):
+        """
+        Learn the alternates of a locator from the element it resolved to
+
+        Args:
+            driver: WebDriver instance
+            locator: Tuple of (By, value)
+            element: Element the locator resolved to
+        """
+        suggestions = LocatorFinder(driver).suggest_locators(element)
+        ranked = [suggestions[name] for name in _STRATEGY_RANK
+                  if name in suggestions and tuple(suggestions[name]) != tuple(locator)]
+        candidates = [(alternate, to_query(alternate)) for alternate in ranked]
+        candidates = [(alternate, query) for alternate, query in candidates if query]
+        unique = page_runtime.call(driver, 'uniqueMatches', element, [query for _, query in candidates]) or []
+        alternates = [list(alternate) for (alternate, _), ok in zip(candidates, unique) if ok]
+
+        key = _locator_key(locator)
+        self._table[key] = {'alternates': alternates, 'winner': None, 'page': urlsplit(driver.current_url).path,
+                            'learned_at': time.time()}
+        self._changed.add(key)
+        self_healing_stats['learned'] += 1
+        logger.debug(f"Learned {len(alternates)} alternate(s) for {locator}")
+
+    def heal(self, driver: WebDriver, locator: Tuple[str, str],
+             timeout: float) -> Tuple[Optional[WebElement], bool]:
+        """
+        Find the element of a broken locator through its alternates
+
+        The locator and its alternates are queried together in the page (one
+        call per poll), so a late primary match still wins.
+
+        Args:
+            driver: WebDriver instance
+            locator: Tuple of (By, value)
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            tuple: WebElement (None if neither the locator nor an alternate
+                matches) and True if an alternate found it
+        """
+        entry = self._table.get(_locator_key(locator), {})
+        alternates = entry.get('alternates', [])
+        if alternates and not self._learned_here(entry, driver):
+            # Learned on another page, where an alternate could match a different element
+            alternates = []
+        locators = [tuple(locator)] + [tuple(alternate) for alternate in alternates]
+        queries = [to_query(candidate) or ['xpath', 'false()'] for candidate in locators]
+        deadline = time.perf_counter() + timeout
+
+        while True:
+            try:
+                match = page_runtime.call(driver, 'queryFirst', queries)
+            except WebDriverException as e:
+                logger.error(f"Failed to query alternates of {locator}: {str(e)}")
+                return None, False
+            if match:
+                if match['index'] > 0:
+                    self.record_winner(locator, locators[match['index']])
+                return match['element'], match['index'] > 0
+            if time.perf_counter() >= deadline:
+                return None, False
+            time.sleep(0.25)
+
+    def record_winner(self, locator: Tuple[str, str], winner: Tuple[str, str]):
+        """
+        Store the alternate that healed a locator
+
+        Args:
+            locator: Tuple of (By, value)
+            winner: Alternate (By, value) that found the element
+        """
+        key = _locator_key(locator)
+        entry = self._table.setdefault(key, {'alternates': []})
+        if entry.get('winner') != list(winner):
+            logger.warning(f"Locator drift: {locator} no longer matches, healed by {winner}")
+        entry['winner'] = list(winner)
+        entry['healed_at'] = time.time()
+        self._changed.add(key)
+        self_healing_stats['healed'] += 1
+
+    def forget_winner(self, locator: Tuple[str, str]):
+        """
+        Drop a winner that stopped matching as well
+
+        Args:
+            locator: Tuple of (By, value)
+        """
+        key = _locator_key(locator)
+        if self._table.get(key, {}).get('winner'):
+            self._table[key]['winner'] = None
+            self._changed.add(key)
+
+    def drift(self) -> Dict[str, List[str]]:
+        """
+        Locators that only work through an alternate
+
+        Returns:
+            dict: Locator key -> winning (By, value)
+        """
+        return {key: entry['winner'] for key, entry in self._table.items() if entry.get('winner')}
+
+    def save(self):
+        """Merge this run's changes into the persisted table"""
+        if not self._changed:
+            return
+        table = self._load()
+        for key in self._changed:
+            table[key] = self._table[key]
+        self._changed.clear()
+        self._table = table
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(table, indent=2, sort_keys=True), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Failed to save locator alternates: {str(e)}")
+
+
+# One table per process
+_healer: Optional[LocatorHealer] = None
+
+
+def get_locator_healer() -> LocatorHealer:
+    """
+    Get the process-wide alternate locator table
+
+    Returns:
+        LocatorHealer: Table loaded from SELF_HEALING_FILE
+    """
+    global _healer
+    if _healer is None:
+        _healer = LocatorHealer()
+    return _healer
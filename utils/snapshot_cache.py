@@ -0,0 +1,379 @@
+"""
+Snapshot Cache for Faberwork Test Automation
+Run-level on-disk cache of DOM snapshots, shared by parallel workers, and a
+read-only driver that lets @snapshot_cache scenarios assert against cached
+pages without booting a browser (one is started on demand when a step needs it)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+from urllib.parse import urljoin, urlsplit
+from loguru import logger
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import NoSuchElementException
+
+from .config import Config
+from .dom_snapshot import DomSnapshot, capture_snapshot, VALUE_ATTRIBUTE
+from .navigation import normalize_url
+
+
+# Run statistics (one process)
+snapshot_cache_stats = {'hits': 0, 'misses': 0, 'stored': 0, 'browsers_avoided': 0}
+
+
+def viewport_key() -> str:
+    """Describe the rendering setup snapshots depend on (visibility is viewport-dependent)"""
+    return f"{Config.BROWSER}-{Config.WINDOW_SIZE}-{'headless' if Config.HEADLESS else 'headed'}"
+
+
+class SnapshotCache:
+    """
+    On-disk store of page snapshots keyed by URL and viewport
+
+    Entries older than the freshness window are ignored. One file per key,
+    written atomically, so parallel workers share the store.
+    """
+
+    def __init__(self, directory: Path = None, ttl: int = None):
+        """
+        Initialize the cache
+
+        Args:
+            directory: Cache directory (defaults to Config.SNAPSHOT_CACHE_DIR)
+            ttl: Freshness window in seconds (defaults to Config.SNAPSHOT_CACHE_TTL)
+        """
+        self.directory = Path(directory or Config.SNAPSHOT_CACHE_DIR)
+        self.ttl = Config.SNAPSHOT_CACHE_TTL if ttl is None else ttl
+
+    def _path(self, url: str, viewport: str) -> Path:
+        """File of the entry for a URL and viewport"""
+        key = f"{normalize_url(url)}|{viewport}"
+        return self.directory / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str, viewport: str = None) -> Optional[DomSnapshot]:
+        """
+        Get a fresh snapshot of a URL
+
+        Args:
+            url: Requested URL
+            viewport: Viewport key (defaults to viewport_key())
+
+        Returns:
+            DomSnapshot: Cached snapshot, or None if missing or older than the freshness window
+        """
+        try:
+            entry = json.loads(self._path(url, viewport or viewport_key()).read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            snapshot_cache_stats['misses'] += 1
+            return None
+
+        if time.time() - entry['captured_at'] > self.ttl:
+            snapshot_cache_stats['misses'] += 1
+            return None
+
+        snapshot_cache_stats['hits'] += 1
+        snapshot = DomSnapshot(entry['source'], entry['url'])
+        snapshot.captured_at = entry['captured_at']
+        return snapshot
+
+    def put(self, url: str, snapshot: DomSnapshot, viewport: str = None):
+        """
+        Store a snapshot under the URL that was requested
+
+        Args:
+            url: Requested URL (may differ from snapshot.url after redirects)
+            snapshot: Snapshot of the loaded page
+            viewport: Viewport key (defaults to viewport_key())
+        """
+        path = self._path(url, viewport or viewport_key())
+        entry = {'url': snapshot.url, 'captured_at': snapshot.captured_at, 'source': snapshot.source}
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(entry), encoding='utf-8')
+            os.replace(tmp_path, path)
+            snapshot_cache_stats['stored'] += 1
+        except Exception as e:
+            logger.error(f"Failed to store snapshot of {url}: {str(e)}")
+
+
+class SnapshotElement:
+    """
+    WebElement stand-in backed by a snapshot element
+
+    Read-only calls are answered from the snapshot. Anything else (typing,
+    geometry, ...) starts the real browser and is forwarded to the matching
+    live element.
+    """
+
+    def __init__(self, driver: 'SnapshotDriver', snapshot: DomSnapshot, element):
+        """
+        Wrap a snapshot element
+
+        Args:
+            driver: Snapshot driver the element was found through
+            snapshot: Snapshot containing the element
+            element: lxml element
+        """
+        self._driver = driver
+        self._snapshot = snapshot
+        self._element = element
+
+    @property
+    def tag_name(self) -> str:
+        """Tag name of the element"""
+        return self._element.tag
+
+    @property
+    def text(self) -> str:
+        """Rendered text, empty for hidden elements (like WebElement.text)"""
+        if not self.is_displayed():
+            return ""
+        return ' '.join(self._snapshot.visible_text_of(self._element).split())
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """Attribute or property value as WebElement.get_attribute returns it"""
+        if name == 'value' and self._element.get(VALUE_ATTRIBUTE) is not None:
+            return self._element.get(VALUE_ATTRIBUTE)
+        value = self._element.get(name)
+        # Like WebDriver, URL properties come back resolved
+        if value is not None and name in ('href', 'src'):
+            return urljoin(self._snapshot.url, value)
+        if name in ('textContent', 'innerText'):
+            return self._element.text_content()
+        return value
+
+    def get_dom_attribute(self, name: str) -> Optional[str]:
+        """Attribute value as written in the markup"""
+        return self._element.get(name)
+
+    def is_displayed(self) -> bool:
+        """Visibility at capture time"""
+        return self._snapshot.is_visible(self._element)
+
+    def is_enabled(self) -> bool:
+        """True unless the element has the disabled attribute"""
+        return self._element.get('disabled') is None
+
+    def is_selected(self) -> bool:
+        """True if the element is marked checked or selected"""
+        return self._element.get('checked') is not None or self._element.get('selected') is not None
+
+    def find_element(self, by: str = By.ID, value: str = None) -> 'SnapshotElement':
+        """First descendant matching a locator"""
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No snapshot element for {by}={value}")
+        return elements[0]
+
+    def find_elements(self, by: str = By.ID, value: str = None) -> List['SnapshotElement']:
+        """Descendants matching a locator"""
+        if by == By.XPATH:
+            matches = [match for match in self._element.xpath(value) if hasattr(match, 'tag')]
+        elif by == By.CSS_SELECTOR:
+            matches = self._element.cssselect(value)
+        else:
+            matches = [match for match in self._snapshot.find_all((by, value))
+                       if match is not self._element and self._element in match.iterancestors()]
+        return [SnapshotElement(self._driver, self._snapshot, match) for match in matches]
+
+    def link_target(self) -> Optional[str]:
+        """Absolute URL a click on this element navigates to, None if it is not a plain link"""
+        href = self._element.get('href')
+        if self._element.tag != 'a' or not href or href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
+            return None
+        if self._element.get('target') == '_blank':
+            return None
+        target = urljoin(self._snapshot.url, href)
+        return target if urlsplit(target).scheme in ('http', 'https') else None
+
+    def click(self):
+        """Follow a plain link through the cache, click anything else in the real browser"""
+        target = self.link_target()
+        if target is not None and not self._driver.materialized:
+            self._driver.get(target)
+            return
+        self.live().click()
+
+    def live(self):
+        """The matching element of the real page (starts the browser)"""
+        path = self._element.getroottree().getpath(self._element)
+        return self._driver.materialize().find_element(By.XPATH, path)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.live(), name)
+
+
+class SnapshotDriver:
+    """
+    Read-only WebDriver stand-in serving cached snapshots
+
+    get(), current_url, title, page_source and find_element(s) are answered
+    from the cache while possible. The first call that needs a real page
+    starts the browser through the factory (and loads the current URL in it);
+    from then on every call goes to the real driver.
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver], cache: SnapshotCache = None):
+        """
+        Initialize the driver
+
+        Args:
+            factory: Creates the real WebDriver when one is needed
+            cache: Snapshot store (defaults to a SnapshotCache on Config.SNAPSHOT_CACHE_DIR)
+        """
+        self._factory = factory
+        self._cache = cache or SnapshotCache()
+        self._driver: Optional[WebDriver] = None
+        self.snapshot: Optional[DomSnapshot] = None
+
+    # ============================================
+    # Browser Lifecycle
+    # ============================================
+
+    @property
+    def materialized(self) -> bool:
+        """True once a real browser has been started"""
+        return self._driver is not None
+
+    def materialize(self, load_current: bool = True) -> WebDriver:
+        """
+        Start the real browser (no-op if it already runs)
+
+        Args:
+            load_current: Load the URL of the current snapshot in it
+
+        Returns:
+            WebDriver: Real driver
+        """
+        if self._driver is None:
+            logger.info("Step needs a live page, starting the browser")
+            self._driver = self._factory()
+            if load_current and self.snapshot is not None:
+                self._load(self.snapshot.url)
+        return self._driver
+
+    def _load(self, url: str):
+        """Load a URL in the real browser and store its snapshot once animations have settled"""
+        from .helpers import wait_for_animations, wait_for_page_load
+
+        self._driver.get(url)
+        wait_for_page_load(self._driver)
+        # A snapshot taken mid-transition would keep elements half-visible for every later run
+        if not wait_for_animations(self._driver):
+            logger.warning(f"Snapshot of {url} taken before animations settled")
+        self.snapshot = capture_snapshot(self._driver)
+        self._cache.put(url, self.snapshot)
+
+    def quit(self):
+        """Quit the real browser if one was started"""
+        if self._driver is not None:
+            self._driver.quit()
+        else:
+            snapshot_cache_stats['browsers_avoided'] += 1
+            logger.info("Scenario ran on cached snapshots, no browser started")
+
+    # ============================================
+    # Read-only WebDriver API
+    # ============================================
+
+    def get(self, url: str):
+        """Open a URL from the cache, or load (and cache) it in the real browser"""
+        if self._driver is None:
+            cached = self._cache.get(url)
+            if cached is not None:
+                self.snapshot = cached
+                logger.info(f"Opened cached snapshot of {url}")
+                return
+            self.materialize(load_current=False)
+            self._load(url)
+            return
+        self._driver.get(url)
+
+    @property
+    def current_url(self) -> str:
+        """URL of the current page"""
+        if self._driver is None and self.snapshot is not None:
+            return self.snapshot.url
+        return self.materialize().current_url
+
+    @property
+    def title(self) -> str:
+        """Title of the current page"""
+        if self._driver is None and self.snapshot is not None:
+            return (self.snapshot.tree.findtext('.//title') or '').strip()
+        return self.materialize().title
+
+    @property
+    def page_source(self) -> str:
+        """Serialized current page"""
+        if self._driver is None and self.snapshot is not None:
+            return self.snapshot.source
+        return self.materialize().page_source
+
+    def find_element(self, by: str = By.ID, value: str = None):
+        """First element matching a locator"""
+        if self._driver is None and self.snapshot is not None:
+            elements = self.find_elements(by, value)
+            if not elements:
+                raise NoSuchElementException(f"No snapshot element for {by}={value}")
+            return elements[0]
+        return self.materialize().find_element(by, value)
+
+    def find_elements(self, by: str = By.ID, value: str = None) -> list:
+        """Elements matching a locator"""
+        if self._driver is None and self.snapshot is not None:
+            return [SnapshotElement(self, self.snapshot, element)
+                    for element in self.snapshot.find_all((by, value))]
+        return self.materialize().find_elements(by, value)
+
+    def get_log(self, log_type: str) -> list:
+        """No browser, no log entries yet"""
+        if self._driver is None:
+            return []
+        return self._driver.get_log(log_type)
+
+    def delete_all_cookies(self):
+        """No browser, no cookies"""
+        if self._driver is not None:
+            self._driver.delete_all_cookies()
+
+    def execute_script(self, script: str, *args):
+        """Run a script in the real browser (snapshot elements are passed as their live elements)"""
+        return self.materialize().execute_script(script, *self._live_args(args))
+
+    def execute_async_script(self, script: str, *args):
+        """Run an async script in the real browser (snapshot elements are passed as their live elements)"""
+        return self.materialize().execute_async_script(script, *self._live_args(args))
+
+    def _live_args(self, args) -> list:
+        """Replace snapshot elements (also inside lists) by the matching live elements"""
+        self.materialize()
+        return [self._live_args(arg) if isinstance(arg, list)
+                else arg.live() if isinstance(arg, SnapshotElement) else arg for arg in args]
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+
+def is_snapshot_mode(driver) -> bool:
+    """
+    Check if a driver answers from snapshots (cached or @static, no real browser)
+
+    Args:
+        driver: WebDriver, SnapshotDriver or StaticDriver
+
+    Returns:
+        bool: True while page objects should stay on the read-only path
+    """
+    return isinstance(driver, SnapshotDriver) and not driver.materialized
@@ -0,0 +1,162 @@
+"""
+Static Driver for Faberwork Test Automation
+Browserless backend for @static scenarios: pages are fetched over pooled HTTP
+connections and queried with lxml, so checks of server-rendered content take
+milliseconds instead of a browser start-up and page load
+"""
+
+import re
+import time
+from typing import List, Optional
+from loguru import logger
+from selenium.common.exceptions import WebDriverException
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import Config
+from .dom_snapshot import DomSnapshot, VISIBLE_ATTRIBUTE
+from .snapshot_cache import SnapshotDriver
+
+
+# Elements a browser never renders
+_HIDDEN_TAGS = {'head', 'script', 'style', 'noscript', 'template', 'title', 'meta', 'link'}
+
+# Inline styles that hide an element (the only CSS visible without a browser)
+_HIDDEN_STYLE = re.compile(r'display\s*:\s*none|visibility\s*:\s*hidden', re.IGNORECASE)
+
+# One connection pool per process, shared by every @static scenario
+_http_session: Optional[requests.Session] = None
+
+# Run statistics (one process)
+static_stats = {'scenarios': 0, 'requests': 0, 'seconds': 0.0}
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session (keep-alive connections are reused across scenarios)
+
+    Returns:
+        requests.Session: Pooled session
+    """
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=1)
+        _http_session.mount('http://', adapter)
+        _http_session.mount('https://', adapter)
+        _http_session.headers['Accept'] = 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.8'
+    return _http_session
+
+
+def static_snapshot(source: str, url: str) -> DomSnapshot:
+    """
+    Parse server-rendered HTML into a snapshot
+
+    Without a browser, visibility is estimated from the markup: hidden tags,
+    the hidden attribute, hidden inputs and inline display/visibility styles
+    (inherited by descendants).
+
+    Args:
+        source: HTML as served
+        url: Final URL (after redirects)
+
+    Returns:
+        DomSnapshot: Snapshot with visibility annotated
+    """
+    snapshot = DomSnapshot(source, url)
+    for element in snapshot.tree.iter():
+        if not isinstance(element.tag, str):
+            continue
+        parent = element.getparent()
+        hidden = (
+            (parent is not None and parent.get(VISIBLE_ATTRIBUTE) == '0')
+            or element.tag in _HIDDEN_TAGS
+            or element.get('hidden') is not None
+            or (element.tag == 'input' and (element.get('type') or '').lower() == 'hidden')
+            or bool(_HIDDEN_STYLE.search(element.get('style') or ''))
+        )
+        element.set(VISIBLE_ATTRIBUTE, '0' if hidden else '1')
+    return snapshot
+
+
+class StaticDriver(SnapshotDriver):
+    """
+    WebDriver stand-in serving live server-rendered pages without a browser
+
+    Supports the read-only API page objects use (get, current_url, title,
+    page_source, find_element(s), element text and attributes, link clicks,
+    back/forward/refresh). Anything that needs a rendered page, such as
+    scripts, typing or screenshots, raises a WebDriverException naming the
+    @static tag.
+    """
+
+    def __init__(self, session: requests.Session = None):
+        """
+        Initialize the driver
+
+        Args:
+            session: HTTP session (defaults to the pooled process-wide session)
+        """
+        super().__init__(factory=None)
+        self._session = session or get_http_session()
+        self._session.cookies.clear()
+        self._history: List[str] = []
+        self._position = -1
+
+    def materialize(self, load_current: bool = True):
+        """@static scenarios never start a browser"""
+        raise WebDriverException("This step needs a real browser; remove the @static tag from the scenario")
+
+    def quit(self):
+        """End the scenario (the pooled connections stay open for the next one)"""
+        self._session.cookies.clear()
+        static_stats['scenarios'] += 1
+
+    def delete_all_cookies(self):
+        """Clear the cookies of the HTTP session"""
+        self._session.cookies.clear()
+
+    # ============================================
+    # Navigation
+    # ============================================
+
+    def get(self, url: str):
+        """Fetch and parse a page"""
+        self._fetch(url)
+        del self._history[self._position + 1:]
+        self._history.append(self.snapshot.url)
+        self._position = len(self._history) - 1
+
+    def refresh(self):
+        """Fetch the current page again"""
+        self._fetch(self._history[self._position])
+
+    def back(self):
+        """Go to the previous page of the scenario's history"""
+        if self._position > 0:
+            self._position -= 1
+            self._fetch(self._history[self._position])
+
+    def forward(self):
+        """Go to the next page of the scenario's history"""
+        if self._position < len(self._history) - 1:
+            self._position += 1
+            self._fetch(self._history[self._position])
+
+    def _fetch(self, url: str):
+        """Request a URL and replace the current snapshot with the response"""
+        start = time.perf_counter()
+        try:
+            response = self._session.get(url, timeout=Config.PAGE_LOAD_TIMEOUT)
+        except requests.RequestException as e:
+            raise WebDriverException(f"Failed to fetch {url}: {str(e)}")
+
+        if response.status_code >= 400:
+            logger.warning(f"{url} answered HTTP {response.status_code}")
+        self.snapshot = static_snapshot(response.text, response.url)
+
+        elapsed = time.perf_counter() - start
+        static_stats['requests'] += 1
+        static_stats['seconds'] += elapsed
+        logger.debug(f"Fetched {response.url} without a browser in {elapsed * 1000:.0f} ms")
@@ -0,0 +1,208 @@
+"""
+Virtual Time for Faberwork Test Automation
+Fake-timer shim that lets steps fast-forward page timers (carousel autoplay,
+toast auto-dismiss) instead of waiting for them in real time
+"""
+
+from loguru import logger
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .cdp import add_script_on_new_document
+
+
+# Wraps setTimeout/setInterval, Date and performance.now. Timers still fire in
+# real time, window.__fwClock.tick(ms) additionally runs every timer due within
+# the next ms milliseconds (in order) and moves the page clock forward by ms.
+FAKE_TIMERS_SCRIPT = """
+(function () {
+    if (window.__fwClock) { return; }
+
+    var realSetTimeout = window.setTimeout.bind(window);
+    var realClearTimeout = window.clearTimeout.bind(window);
+    var realDateNow = Date.now.bind(Date);
+    var realPerfNow = performance.now.bind(performance);
+    var RealDate = Date;
+    var skew = 0, nextId = 1, timers = {};
+
+    function now() { return realPerfNow() + skew; }
+
+    function arm(id) {
+        var timer = timers[id];
+        realClearTimeout(timer.handle);
+        timer.handle = realSetTimeout(function () { fire(id); }, Math.max(0, timer.at - now()));
+    }
+
+    function fire(id) {
+        var timer = timers[id];
+        if (!timer) { return; }
+        if (timer.interval !== null) {
+            timer.at += timer.interval;
+            arm(id);
+        } else {
+            delete timers[id];
+        }
+        try {
+            if (typeof timer.fn === 'function') {
+                timer.fn.apply(window, timer.args);
+            } else {
+                (0, eval)(String(timer.fn));
+            }
+        } catch (e) {
+            console.error(e);
+        }
+    }
+
+    function schedule(fn, delay, args, repeat) {
+        var id = nextId++;
+        delay = Math.max(0, Number(delay) || 0);
+        timers[id] = {
+            fn: fn, args: args, at: now() + delay,
+            interval: repeat ? Math.max(1, delay) : null, handle: null
+        };
+        arm(id);
+        return id;
+    }
+
+    function clear(id) {
+        var timer = timers[id];
+        if (timer) {
+            realClearTimeout(timer.handle);
+            delete timers[id];
+        }
+    }
+
+    window.setTimeout = function (fn, delay) {
+        return schedule(fn, delay, Array.prototype.slice.call(arguments, 2), false);
+    };
+    window.setInterval = function (fn, delay) {
+        return schedule(fn, delay, Array.prototype.slice.call(arguments, 2), true);
+    };
+    window.clearTimeout = clear;
+    window.clearInterval = clear;
+
+    function FakeDate() {
+        if (!(this instanceof FakeDate)) { return new RealDate(FakeDate.now()).toString(); }
+        if (arguments.length === 0) { return new RealDate(FakeDate.now()); }
+        var args = [null].concat(Array.prototype.slice.call(arguments));
+        return new (Function.prototype.bind.apply(RealDate, args))();
+    }
+    FakeDate.prototype = RealDate.prototype;
+    FakeDate.now = function () { return realDateNow() + skew; };
+    FakeDate.parse = RealDate.parse;
+    FakeDate.UTC = RealDate.UTC;
+    window.Date = FakeDate;
+    performance.now = now;
+
+    window.__fwClock = {
+        tick: function (ms) {
+            var target = now() + Math.max(0, Number(ms) || 0);
+            var fired = 0;
+            while (fired < 10000) {
+                var dueId = null;
+                for (var id in timers) {
+                    if (timers[id].at <= target && (dueId === null || timers[id].at < timers[dueId].at)) {
+                        dueId = id;
+                    }
+                }
+                if (dueId === null) { break; }
+                if (timers[dueId].at > now()) { skew = timers[dueId].at - realPerfNow(); }
+                fire(dueId);
+                fired++;
+            }
+            skew = Math.max(skew, target - realPerfNow());
+            for (var pending in timers) { arm(pending); }
+            return {fired: fired, skew: skew, pending: Object.keys(timers).length};
+        }
+    };
+})();
+"""
+
+_TICK_SCRIPT = "return window.__fwClock ? window.__fwClock.tick(arguments[0]) : null;"
+
+
+class VirtualClock:
+    """Fast-forwards page timers for the current driver session"""
+
+    def __init__(self, driver: WebDriver):
+        """
+        Initialize the virtual clock
+
+        Args:
+            driver: WebDriver instance
+        """
+        self.driver = driver
+        self.installed = False
+
+    def install(self) -> bool:
+        """
+        Install the fake-timer shim in every document loaded from now on
+
+        The shim has to run before the page's own scripts so timers created
+        during page load are captured, which needs CDP (Chrome/Edge).
+
+        Returns:
+            bool: True if the shim was registered
+        """
+        self.installed = add_script_on_new_document(self.driver, FAKE_TIMERS_SCRIPT) is not None
+        if self.installed:
+            logger.debug("Virtual clock installed")
+        else:
+            logger.warning("Virtual clock unavailable (needs CDP), timers run in real time")
+        return self.installed
+
+    def is_active(self) -> bool:
+        """
+        Check if the current document is running on the virtual clock
+
+        Returns:
+            bool: True if timers in the current document can be fast-forwarded
+        """
+        if not self.installed:
+            return False
+        try:
+            return bool(self.driver.execute_script("return !!window.__fwClock;"))
+        except Exception as e:
+            logger.error(f"Failed to check virtual clock: {str(e)}")
+            return False
+
+    def advance(self, seconds: float) -> bool:
+        """
+        Run every page timer due within the next N seconds, without waiting
+
+        Args:
+            seconds: Virtual seconds to advance
+
+        Returns:
+            bool: True if the page clock was advanced, False if the current
+                document is not running on the virtual clock
+        """
+        if not self.installed:
+            return False
+        try:
+            result = self.driver.execute_script(_TICK_SCRIPT, seconds * 1000)
+        except Exception as e:
+            logger.error(f"Failed to advance virtual clock: {str(e)}")
+            return False
+
+        if result is None:
+            logger.warning("Current document is not running on the virtual clock")
+            return False
+
+        logger.debug(f"Advanced virtual clock {seconds}s, fired {result['fired']} timer(s), "
+                     f"{result['pending']} pending")
+        return True
+
+
+def advance_time(context, seconds: float) -> bool:
+    """
+    Fast-forward page timers when the scenario runs on virtual time
+
+    Args:
+        context: Behave context
+        seconds: Seconds to advance
+
+    Returns:
+        bool: True if time was advanced virtually, False if the caller has to wait in real time
+    """
+    clock = getattr(context, 'clock', None)
+    return clock is not None and clock.advance(seconds)
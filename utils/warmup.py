@@ -0,0 +1,130 @@
+"""
+Warm-up for Faberwork Test Automation
+Pays DNS, TLS and CDN cold-start (and the driver binary lookup) once before
+the first scenario, so it doesn't land in that scenario's duration
+"""
+
+import socket
+import time
+from typing import Dict, List
+from urllib.parse import urlsplit
+from loguru import logger
+
+import requests
+
+from .config import Config
+
+
+def _warmup_urls() -> List[str]:
+    """BASE_URL followed by the extra WARMUP_URLS"""
+    return [Config.BASE_URL] + [url for url in Config.WARMUP_URLS if url != Config.BASE_URL]
+
+
+def resolve_hosts(urls: List[str]) -> int:
+    """
+    Resolve the host names of the given URLs (fills the OS resolver cache)
+
+    Args:
+        urls: URLs to resolve the hosts of
+
+    Returns:
+        int: Number of hosts resolved
+    """
+    resolved = 0
+    for host in {urlsplit(url).hostname for url in urls if urlsplit(url).hostname}:
+        try:
+            socket.getaddrinfo(host, 443, proto=socket.IPPROTO_TCP)
+            resolved += 1
+        except OSError as e:
+            logger.warning(f"Warm-up could not resolve {host}: {str(e)}")
+    return resolved
+
+
+def fetch_urls(urls: List[str]) -> int:
+    """
+    Request the given URLs once (TLS handshake, CDN edge and origin caches)
+
+    Args:
+        urls: URLs to request
+
+    Returns:
+        int: Number of URLs that answered
+    """
+    fetched = 0
+    with requests.Session() as session:
+        for url in urls:
+            try:
+                session.get(url, timeout=Config.PAGE_LOAD_TIMEOUT)
+                fetched += 1
+            except requests.RequestException as e:
+                logger.warning(f"Warm-up could not fetch {url}: {str(e)}")
+    return fetched
+
+
+def load_in_browser(url: str) -> bool:
+    """
+    Load a page in a throwaway browser session
+
+    Also resolves/installs the driver binary and, with ASSET_CACHE enabled,
+    fills the shared asset cache for the scenarios that follow.
+
+    Args:
+        url: Page to load
+
+    Returns:
+        bool: True if the page loaded
+    """
+    from .driver_factory import DriverFactory
+
+    driver = None
+    try:
+        driver = DriverFactory.create_driver()
+        if Config.ASSET_CACHE and Config.HTTP_ARCHIVE_MODE != 'replay':
+            from .asset_cache import get_asset_cache
+            get_asset_cache().attach(driver)
+        driver.get(url)
+        return True
+    except Exception as e:
+        logger.warning(f"Warm-up browser session failed: {str(e)}")
+        return False
+    finally:
+        if driver is not None:
+            DriverFactory.quit_driver(driver)
+
+
+def warm_up(browser: bool = None, network: bool = True) -> Dict[str, float]:
+    """
+    Run the warm-up stages and time each of them
+
+    Network stages are skipped when replaying an HTTP archive (offline run).
+
+    Args:
+        browser: Also load the homepage in a throwaway browser (defaults to Config.WARMUP_BROWSER)
+        network: Run the DNS and HTTP stages (they only warm the calling process)
+
+    Returns:
+        dict: Seconds spent per stage ('dns', 'http', 'browser') and in total ('total')
+    """
+    browser = Config.WARMUP_BROWSER if browser is None else browser
+    urls = _warmup_urls()
+    timings = {}
+    start = time.perf_counter()
+
+    if network and Config.HTTP_ARCHIVE_MODE != 'replay':
+        stage_start = time.perf_counter()
+        resolve_hosts(urls)
+        timings['dns'] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        fetch_urls(urls)
+        timings['http'] = time.perf_counter() - stage_start
+
+    if browser:
+        stage_start = time.perf_counter()
+        load_in_browser(Config.BASE_URL)
+        timings['browser'] = time.perf_counter() - stage_start
+
+    timings['total'] = time.perf_counter() - start
+    stages = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items() if stage != 'total')
+    logger.info(f"Warm-up completed in {timings['total']:.2f}s ({stages})")
+    return timings